@@ -19,6 +19,7 @@ from app.services.risk_engine import get_risk_engine
 from app.api.routes.auth import get_current_active_user, User
 from app.core.database.database import get_db
 from app.core.database.job_storage import DBJobStorage
+from app.core.database.blob_store import get_blob_store
 
 
 router = APIRouter()
@@ -2078,6 +2079,25 @@ async def compare_email_scans(
 
 
 
+async def _capture_screenshot(capture_data: Dict[str, Any]) -> Optional[bytes]:
+    """Load a capture's screenshot from the blob store (or legacy inline base64)."""
+    if capture_data.get('screenshot_blob'):
+        # Decompression runs in the executor so large blobs don't block the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, get_blob_store().get, capture_data['screenshot_blob'])
+    if capture_data.get('screenshot'):
+        return base64.b64decode(capture_data['screenshot'])
+    return None
+
+
+async def _capture_har(capture_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Load a capture's HAR from the blob store (or legacy inline JSON)."""
+    if capture_data.get('har_blob'):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, get_blob_store().get_json, capture_data['har_blob'])
+    return capture_data.get('har')
+
+
 @router.get("/investigation/{job_id}/screenshot")
 async def get_investigation_screenshot(job_id: str):
     """Retrieve screenshot captured during investigation job execution."""
@@ -2093,17 +2113,15 @@ async def get_investigation_screenshot(job_id: str):
         
 
         capture_data = getattr(job, 'metadata', {}).get('capture', {})
-        screenshot_b64 = capture_data.get('screenshot')
+        try:
+            screenshot_bytes = await _capture_screenshot(capture_data)
+        except Exception as e:
+            logger.error(f"Error loading screenshot: {e}")
+            raise HTTPException(status_code=500, detail="Failed to load screenshot data")
         
-        if not screenshot_b64:
+        if not screenshot_bytes:
             raise HTTPException(status_code=404, detail="Screenshot not available for this job. The investigation may not have captured a screenshot.")
         
-
-        try:
-            screenshot_bytes = base64.b64decode(screenshot_b64)
-        except Exception as e:
-            logger.error(f"Error decoding screenshot: {e}")
-            raise HTTPException(status_code=500, detail="Failed to decode screenshot data")
         return Response(
             content=screenshot_bytes,
             media_type="image/png",
@@ -2133,7 +2151,7 @@ async def get_investigation_har(job_id: str):
         
 
         capture_data = getattr(job, 'metadata', {}).get('capture', {})
-        har_data = capture_data.get('har')
+        har_data = await _capture_har(capture_data)
         
         if not har_data:
             raise HTTPException(status_code=404, detail="HAR file not available for this job. The investigation may not have captured network traffic.")
@@ -2245,22 +2263,19 @@ async def compare_investigations(
         }
         
 
-        screenshot1 = capture1.get('screenshot')
-        screenshot2 = capture2.get('screenshot')
+        img1_data = await _capture_screenshot(capture1)
+        img2_data = await _capture_screenshot(capture2)
         
-        if screenshot1 and screenshot2:
+        if img1_data and img2_data:
             from app.services.visual_similarity import get_visual_similarity_service
             visual_similarity = get_visual_similarity_service()
             
-            img1_data = base64.b64decode(screenshot1)
-            img2_data = base64.b64decode(screenshot2)
-            
             similarity_result = visual_similarity.compare_images(img1_data, img2_data)
             comparison['visual_similarity'] = similarity_result
         
 
-        har1 = capture1.get('har', {})
-        har2 = capture2.get('har', {})
+        har1 = await _capture_har(capture1) or {}
+        har2 = await _capture_har(capture2) or {}
         
         if har1 and har2:
             domains1 = set()
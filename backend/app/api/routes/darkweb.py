@@ -54,6 +54,11 @@ class OnionSiteResponse(BaseModel):
     risk_score: float
 
 
+class CloneSiteResponse(OnionSiteResponse):
+    """Response model for a near-duplicate site with its content similarity."""
+    similarity: float
+
+
 class ExtractedEntityResponse(BaseModel):
     """Response model for extracted entity (email, bitcoin address, etc.)."""
     type: str
@@ -188,16 +193,20 @@ async def get_site_network(
         raise HTTPException(status_code=500, detail=f"Error retrieving site network: {str(e)}")
 
 
-@router.get("/jobs/{job_id}/sites/{site_id}/clones", response_model=List[OnionSiteResponse])
-async def get_site_clones(job_id: str, site_id: str):
+@router.get("/jobs/{job_id}/sites/{site_id}/clones", response_model=List[CloneSiteResponse])
+async def get_site_clones(
+    job_id: str,
+    site_id: str,
+    threshold: float = Query(0.9, ge=0.5, le=1.0, description="Minimum content similarity (SimHash)")
+):
     """Find cloned/duplicate sites based on content similarity."""
     darkwatch, job = _get_darkwatch_instance(job_id)
     
     try:
-        clones = darkwatch.find_clones(site_id)
+        clones = darkwatch.find_clones(site_id, threshold=threshold)
         
         return [
-            OnionSiteResponse(
+            CloneSiteResponse(
                 site_id=clone.site_id,
                 onion_url=clone.onion_url,
                 title=clone.title,
@@ -211,9 +220,10 @@ async def get_site_clones(job_id: str, site_id: str):
                 entities_count=len(clone.extracted_entities),
                 keywords_matched=clone.keywords_matched,
                 threat_level=clone.threat_level.value,
-                risk_score=clone.risk_score
+                risk_score=clone.risk_score,
+                similarity=round(similarity, 4)
             )
-            for clone in clones
+            for clone, similarity in clones
         ]
     
     except Exception as e:
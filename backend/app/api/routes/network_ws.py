@@ -1,8 +1,10 @@
 from typing import Set
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
 from loguru import logger
 
 from app.middleware.network_logger import get_network_logger_middleware
+from app.services.broadcast_hub import get_all_hub_metrics
+from app.api.routes.auth import get_current_active_user, User
 
 
 router = APIRouter()
@@ -66,15 +68,12 @@ async def broadcast_to_clients(message: dict):
     if not middleware:
         return
     
-    # Send message to all clients, track disconnected ones
-    disconnected = set()
-    for client in middleware.websocket_clients:
-        try:
-            await client.send_json(message)
-        except Exception:
-            disconnected.add(client)
-    
-    # Remove disconnected clients
-    for client in disconnected:
-        middleware.unregister_websocket_client(client)
+    # Queue once per client; slow clients are handled by the hub's backpressure policy
+    middleware.hub.publish(message)
+
+
+@router.get("/ws/metrics")
+async def get_websocket_metrics(current_user: User = Depends(get_current_active_user)):
+    """Queue depth and dropped-message counters for every WebSocket broadcast hub."""
+    return {"hubs": get_all_hub_metrics()}
 
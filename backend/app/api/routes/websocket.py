@@ -5,6 +5,8 @@ from typing import Dict, Set
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from loguru import logger
 
+from app.services.broadcast_hub import get_broadcast_hub
+
 router = APIRouter()
 
 
@@ -21,11 +23,14 @@ class ConnectionManager:
             "scans": set(),
             "all": set()  # All clients receive messages on "all" channel
         }
+        # Per-client bounded send queues so one slow client cannot stall a broadcast
+        self.hub = get_broadcast_hub("events", on_disconnect=self.disconnect)
     
     async def connect(self, websocket: WebSocket, client_id: str):
         """Accept WebSocket connection and register client."""
         await websocket.accept()
         self.active_connections[client_id] = websocket
+        self.hub.register(client_id, websocket)
         self.subscriptions["all"].add(client_id)  # Subscribe to all by default
         logger.info(f"Client {client_id} connected. Total connections: {len(self.active_connections)}")
     
@@ -33,6 +38,7 @@ class ConnectionManager:
         """Remove client connection and all subscriptions."""
         if client_id in self.active_connections:
             del self.active_connections[client_id]
+        self.hub.unregister(client_id)
         
         # Remove from all subscription channels
         for channel in self.subscriptions.values():
@@ -53,28 +59,17 @@ class ConnectionManager:
             logger.debug(f"Client {client_id} unsubscribed from {channel}")
     
     async def send_personal_message(self, message: dict, client_id: str):
-        """Send message to a specific client."""
+        """Queue message for a specific client."""
         if client_id in self.active_connections:
-            websocket = self.active_connections[client_id]
-            try:
-                await websocket.send_json(message)
-            except Exception as e:
-                logger.error(f"Error sending to {client_id}: {e}")
-                self.disconnect(client_id)  # Remove on error
+            self.hub.send(client_id, message)
     
     async def broadcast(self, message: dict, channel: str = "all"):
         """Broadcast message to all clients subscribed to the channel."""
         # Include both channel subscribers and "all" subscribers
         clients = self.subscriptions.get(channel, set()) | self.subscriptions.get("all", set())
         
-        # Send to all clients, remove disconnected ones
-        for client_id in clients.copy():
-            if client_id in self.active_connections:
-                try:
-                    await self.active_connections[client_id].send_json(message)
-                except Exception as e:
-                    logger.error(f"Error broadcasting to {client_id}: {e}")
-                    self.disconnect(client_id)  # Remove on error
+        # Serialize once and queue per client; failed clients are disconnected by the hub
+        self.hub.publish(message, keys=clients)
 
 
 manager = ConnectionManager()
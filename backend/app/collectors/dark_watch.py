@@ -10,6 +10,9 @@ This module uses the following DSA concepts from app.core.dsa:
 - Trie: Keyword and pattern matching for entity extraction
 - DoublyLinkedList: Discovery timeline for chronological event tracking
 - MinHeap: Discovery priority queue for efficient crawling order
+- SimHashIndex: Near-duplicate content lookup for clone and mirror detection
+- TrigramIndex: Substring/regex prefiltering for entity search
+- SkipList: Time-ordered brand mention index
 """
 
 from typing import Dict, List, Optional, Set, Any, Tuple, Callable
@@ -19,26 +22,39 @@ from enum import Enum
 import hashlib
 import re
 import json
+import asyncio
+import uuid
 
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.dsa.graph import Graph
-from core.dsa.bloom_filter import BloomFilter
+from core.dsa.bloom_filter import CompactBloomFilter
 from core.dsa.hashmap import HashMap
 from core.dsa.trie import Trie
 from core.dsa.linked_list import DoublyLinkedList
 from core.dsa.heap import MinHeap
+from core.dsa.simhash import SimHashIndex, simhash, FINGERPRINT_BITS
+from core.dsa.trigram_index import TrigramIndex
+from core.dsa.skip_list import SkipList
 
 from app.collectors.darkwatch_modules.crawlers.tor_connector import TorConnector
+from app.collectors.darkwatch_modules.crawlers.connector_pool import TorConnectorPool
+from app.collectors.darkwatch_modules.crawlers.async_crawler import AsyncTorCrawler
 from app.collectors.darkwatch_modules.crawlers.url_database import URLDatabase
+from app.collectors.darkwatch_modules.crawlers.crawl_frontier import CrawlFrontier
+from app.collectors.darkwatch_modules.crawlers.revisit_policy import RevisitPolicy
+from app.collectors.darkwatch_modules.intel_store import DarkWebIntelStore, get_intel_store
 from app.collectors.darkwatch_modules.crawlers.discovery_engines import (
     DarkWebEngine
 )
+from app.collectors.darkwatch_modules.extractors.entity_engine import (
+    ENTITY_PATTERNS, EntityExtractionEngine, get_entity_engine
+)
 from app.collectors.darkwatch_modules.extractors.site_crawler import crawl_onion_site, extract_entities as extract_entities_from_content
 from app.collectors.darkwatch_modules.extractors.utils import (
-    email_util, bitcoin_util, language_detector
+    email_util, bitcoin_util, language_detector, TextAnalyzer
 )
 from app.config import settings
 from loguru import logger
@@ -109,6 +125,7 @@ class OnionSite:
     language: str
     content_hash: str
     page_count: int = 1
+    simhash: int = 0
     linked_sites: List[str] = field(default_factory=list)
     extracted_entities: List[ExtractedEntity] = field(default_factory=list)
     keywords_matched: List[str] = field(default_factory=list)
@@ -180,21 +197,8 @@ class CrawlJob:
 class DarkWatch:
     """Dark web intelligence collector with entity extraction and relationship mapping."""
     
-    # Regex patterns for entity extraction
-    PATTERNS = { 
-        "email": r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-        "bitcoin": r'\b[13][a-km-zA-HJ-NP-Z1-9]{25,34}\b',
-        "bitcoin_bech32": r'\bbc1[a-zA-HJ-NP-Z0-9]{39,59}\b',
-        "monero": r'\b4[0-9AB][1-9A-HJ-NP-Za-km-z]{93}\b',
-        "ethereum": r'\b0x[a-fA-F0-9]{40}\b',
-        "onion_v2": r'\b[a-z2-7]{16}\.onion\b',
-        "onion_v3": r'\b[a-z2-7]{56}\.onion\b',
-        "ssh_fingerprint": r'\b(?:SHA256|MD5):[A-Za-z0-9+/=:]{32,64}\b',
-        "pgp_key": r'-----BEGIN PGP PUBLIC KEY BLOCK-----',
-        "phone": r'\b\+?[1-9]\d{1,14}\b',
-        "ip_address": r'\b(?:\d{1,3}\.){3}\d{1,3}\b',
-        "credit_card": r'\b(?:4[0-9]{12}(?:[0-9]{3})?|5[1-5][0-9]{14}|3[47][0-9]{13})\b',
-    }
+    # Regex patterns for entity extraction (shared with the extraction engine)
+    PATTERNS = ENTITY_PATTERNS
     
 
     # Keywords for automatic site categorization
@@ -213,16 +217,25 @@ class DarkWatch:
     def __init__(self, monitored_keywords: List[str] = None):
         """Initialize dark web collector with DSA structures for efficient operations."""
         # URL deduplication filter
-        self.url_filter = BloomFilter(expected_items=10_000_000, false_positive_rate=0.001)
+        self.url_filter = CompactBloomFilter(expected_items=10_000_000, false_positive_rate=0.001)
         
         # Site relationship graph
         self.site_graph = Graph(directed=True)
         
         # Storage maps for sites, entities, and brand mentions
         self.sites = HashMap()
+        
+        # SimHash fingerprints for near-duplicate (clone/mirror) lookup
+        self.clone_index = SimHashIndex()
         self.entities = HashMap()
         self.mentions = HashMap()
         
+        # Secondary indexes so entity search and mention listing avoid full scans
+        self.entities_by_type: Dict[str, Dict[str, None]] = {}
+        self.entity_trigrams = TrigramIndex()
+        self.mention_timeline = SkipList()
+        self.mentions_by_keyword: Dict[str, SkipList] = {}
+        
         # Keyword matching for brand monitoring
         self.keyword_trie = Trie()
         self.monitored_keywords = monitored_keywords or []
@@ -235,6 +248,41 @@ class DarkWatch:
         # Chronological crawl history
         self.crawl_history = DoublyLinkedList()
         
+        # One tokenizing pass per page for language, category and keyword scoring
+        self.text_analyzer = TextAnalyzer(self.CATEGORY_KEYWORDS, self.monitored_keywords)
+        
+        # Compiled single-pass entity extractor
+        self.entity_engine: EntityExtractionEngine = (
+            get_entity_engine() if self.PATTERNS is ENTITY_PATTERNS
+            else EntityExtractionEngine(self.PATTERNS)
+        )
+        
+        # Crawl results shared across jobs and scheduled runs
+        self.intel_store: Optional[DarkWebIntelStore] = (
+            get_intel_store() if settings.DARKWEB_INTEL_STORE_ENABLED else None
+        )
+        
+        # Per-site change history; sets how long stored intel stays reusable and what scheduled runs recrawl
+        self.revisit_policy: Optional[RevisitPolicy] = (
+            RevisitPolicy() if settings.DARKWEB_REVISIT_ENABLED else None
+        )
+        
+        # Set by the orchestrator for runs started by a scheduled search
+        self.scheduled_run = False
+        
+        # One reusable TorConnector per crawl worker thread
+        self.connector_pool = TorConnectorPool(
+            proxy_host=settings.TOR_PROXY_HOST,
+            proxy_port=settings.TOR_PROXY_PORT,
+            proxy_type=settings.TOR_PROXY_TYPE,
+            timeout=settings.TOR_TIMEOUT,
+            score_categorie=settings.CRAWLER_SCORE_CATEGORIE,
+            score_keywords=settings.CRAWLER_SCORE_KEYWORDS,
+            count_categories=settings.CRAWLER_COUNT_CATEGORIES,
+            db_path=str(settings.DATA_DIR / settings.CRAWLER_DB_PATH),
+            db_name=settings.CRAWLER_DB_NAME
+        )
+        
 
         self.stats = {
             "sites_indexed": 0,
@@ -248,6 +296,7 @@ class DarkWatch:
         """Add a keyword to monitor for brand mentions."""
         self.monitored_keywords.append(keyword)
         self.keyword_trie.insert(keyword.lower())  # DSA-USED: Trie
+        self.text_analyzer.add_keyword(keyword)
     
     def _generate_site_id(self, onion_url: str) -> str:
         """Generate unique site ID from onion URL hash."""
@@ -280,47 +329,71 @@ class DarkWatch:
     
     def _categorize_site(self, content: str, title: str) -> SiteCategory:
         """Categorize site based on keyword matching."""
-        text = f"{title} {content}".lower()
-        
-        # Score each category based on keyword matches
-        scores = {}
-        for category, keywords in self.CATEGORY_KEYWORDS.items():
-            score = sum(1 for kw in keywords if kw in text)
-            if score > 0:
-                scores[category] = score
-        
-        if scores:
-            return max(scores, key=scores.get)
-        return SiteCategory.UNKNOWN
+        # Category terms are looked up in the page's token-frequency map, not searched for one by one
+        return self.text_analyzer.analyze(f"{title} {content}").category or SiteCategory.UNKNOWN
     
-    def _extract_entities(self, content: str, source_url: str) -> List[ExtractedEntity]:
-        """Extract entities (emails, crypto addresses, etc.) from content using regex patterns."""
+    def _extract_entities(
+        self,
+        content: str,
+        source_url: str,
+        matches: Optional[List[Tuple[str, str, int]]] = None
+    ) -> List[ExtractedEntity]:
+        """Extract entities (emails, crypto addresses, etc.) from content using regex patterns.
+        
+        Matches precomputed by the analysis process pool can be passed in to skip the scan.
+        """
         entities = []
+        discovered_at = datetime.now()
         
-        for entity_type, pattern in self.PATTERNS.items():
-            matches = re.finditer(pattern, content, re.IGNORECASE)
-            for match in matches:
-                value = match.group()
-                
-                # Extract context around the match (50 chars before/after)
-                start = max(0, match.start() - 50)
-                end = min(len(content), match.end() + 50)
-                context = content[start:end]
-                
-                entity = ExtractedEntity(
-                    entity_type=entity_type,
-                    value=value,
-                    context=context,
-                    source_url=source_url,
-                    discovered_at=datetime.now()
-                )
-                entities.append(entity)
-                
+        # One tokenization pass for all patterns; each distinct value is reported once per page
+        if matches is None:
+            matches = self.entity_engine.extract(content)
+        for entity_type, value, position in matches:
+            
+            # Extract context around the first occurrence (50 chars before/after)
+            start = max(0, position - 50)
+            end = min(len(content), position + len(value) + 50)
+            context = content[start:end]
+            
+            entity = ExtractedEntity(
+                entity_type=entity_type,
+                value=value,
+                context=context,
+                source_url=source_url,
+                discovered_at=discovered_at
+            )
+            entities.append(entity)
+            
 
-                self.entities.put(value, entity)  # DSA-USED: HashMap
+            self._store_entity(entity)
         
         return entities
     
+    def _store_entity(self, entity: ExtractedEntity):
+        
+        previous = self.entities.get(entity.value)
+        self.entities.put(entity.value, entity)  # DSA-USED: HashMap
+        if previous is not None and previous.entity_type != entity.entity_type:
+            self.entities_by_type.get(previous.entity_type, {}).pop(entity.value, None)
+        self.entities_by_type.setdefault(entity.entity_type, {})[entity.value] = None
+        if previous is None:
+            self.entity_trigrams.add(entity.value, entity.value)  # DSA-USED: TrigramIndex
+    
+    def _store_mention(self, mention: BrandMention):
+        
+        previous = self.mentions.get(mention.mention_id)
+        if previous is not None:
+            previous_key = (previous.discovered_at, previous.mention_id)
+            self.mention_timeline.delete(previous_key)
+            keyword_timeline = self.mentions_by_keyword.get(previous.keyword.lower())
+            if keyword_timeline is not None:
+                keyword_timeline.delete(previous_key)
+        
+        self.mentions.put(mention.mention_id, mention)  # DSA-USED: HashMap
+        key = (mention.discovered_at, mention.mention_id)
+        self.mention_timeline.insert(key, mention)  # DSA-USED: SkipList
+        self.mentions_by_keyword.setdefault(mention.keyword.lower(), SkipList()).insert(key, mention)
+    
     def _extract_onion_links(self, content: str) -> List[str]:
         
         v2_pattern = r'[a-z2-7]{16}\.onion'
@@ -391,14 +464,10 @@ class DarkWatch:
     
     def _check_keyword_matches(self, content: str) -> List[str]:
         
-        matches = []
-        content_lower = content.lower()
-        
-        for keyword in self.monitored_keywords:
-            if keyword.lower() in content_lower:
-                matches.append(keyword)
+        if not self.monitored_keywords:
+            return []
         
-        return matches
+        return self.text_analyzer.analyze(content).keywords
     
     def _crawl_site_real(self, onion_url: str) -> Dict[str, Any]:
         
@@ -409,6 +478,86 @@ class DarkWatch:
 
             return self._crawl_with_site_analyzer(onion_url)
     
+    async def _crawl_site_real_async(self, onion_url: str, crawler: AsyncTorCrawler) -> Dict[str, Any]:
+        
+        loop = asyncio.get_running_loop()
+        
+        if self.monitored_keywords:
+            try:
+                # Connectors are per thread; each executor call takes its own thread's connector from the pool
+                url_data = await loop.run_in_executor(None, self._get_url_record, onion_url)
+                if url_data:
+                    result = await crawler.crawl(url_data[0], self.connector_pool)
+                    if result.get("status") == "online":
+                        return self._keyword_monitor_page(result, result.get("links", []))
+                    logger.debug(f"[DarkWatch] Async keyword monitor crawl for {onion_url} - Status: {result.get('status', 'unknown')}")
+            except Exception as e:
+                logger.error(f"[DarkWatch] Error in async keyword monitor crawl for {onion_url}: {e}", exc_info=True)
+        
+        try:
+            site_data = await crawler.crawl_onion_site(onion_url)
+            if site_data.get("status") == "online":
+                return self._site_analyzer_page(site_data)
+            logger.debug(f"[DarkWatch] Async site analyzer crawl for {onion_url} - Status: {site_data.get('status', 'unknown')}")
+        except Exception as e:
+            logger.error(f"[DarkWatch] Error in async site analyzer crawl for {onion_url}: {e}", exc_info=True)
+        
+        return self._empty_page()
+    
+    def _get_connector(self) -> TorConnector:
+        
+        return self.connector_pool.get()
+    
+    def _get_url_record(self, onion_url: str, connector: Optional[TorConnector] = None) -> List[Tuple]:
+        
+        connector = connector or self._get_connector()
+        url_data = connector.database.select_url(url=onion_url)
+        if not url_data:
+            logger.debug(f"[DarkWatch] URL not in database, saving {onion_url}")
+            connector.database.save(
+                url=onion_url,
+                source="Script",
+                type="URI",
+                baseurl=onion_url
+            )
+            url_data = connector.database.select_url(url=onion_url)
+        return url_data
+    
+    def _keyword_monitor_page(self, result: Dict[str, Any], linked_onions: List[str]) -> Dict[str, Any]:
+        
+        return {
+            "title": result.get("title", "Untitled"),
+            "content": result.get("content", ""),
+            "category": self._map_category_from_string(result.get("category", "unknown")),
+            "linked_onions": linked_onions or [],
+            "keywords_matched": result.get("keywords_matched", ""),
+            "score_categorie": result.get("score_categorie", 0),
+            "score_keywords": result.get("score_keywords", 0)
+        }
+    
+    def _site_analyzer_page(self, site_data: Dict[str, Any]) -> Dict[str, Any]:
+        
+        return {
+            "title": site_data.get("title", "Untitled"),
+            "content": site_data.get("text", ""),
+            "linked_onions": [link.replace("http://", "").replace("https://", "") 
+                             for link in site_data.get("links", []) 
+                             if ".onion" in link],
+            "emails": site_data.get("emails", []),
+            "bitcoin_addresses": site_data.get("bitcoin_addresses", []),
+            "language": site_data.get("language", "unknown"),
+            **{key: site_data[key] for key in ("entity_matches", "simhash") if key in site_data}
+        }
+    
+    def _empty_page(self) -> Dict[str, Any]:
+        
+        return {
+            "title": "Unknown",
+            "content": "",
+            "category": SiteCategory.UNKNOWN,
+            "linked_onions": []
+        }
+    
     def _crawl_with_keyword_monitor(self, onion_url: str) -> Dict[str, Any]:
         
         crawl_start_time = time.time()
@@ -416,35 +565,15 @@ class DarkWatch:
         
         try:
 
-            logger.debug(f"[DarkWatch] Initializing TorConnector for {onion_url}")
-            connector = TorConnector(
-                proxy_host=settings.TOR_PROXY_HOST,
-                proxy_port=settings.TOR_PROXY_PORT,
-                proxy_type=settings.TOR_PROXY_TYPE,
-                timeout=settings.TOR_TIMEOUT,
-                score_categorie=settings.CRAWLER_SCORE_CATEGORIE,
-                score_keywords=settings.CRAWLER_SCORE_KEYWORDS,
-                count_categories=settings.CRAWLER_COUNT_CATEGORIES,
-                db_path=str(settings.DATA_DIR / settings.CRAWLER_DB_PATH),
-                db_name=settings.CRAWLER_DB_NAME
-            )
+            logger.debug(f"[DarkWatch] Acquiring pooled TorConnector for {onion_url}")
+            connector = self._get_connector()
             
 
             logger.debug(f"[DarkWatch] Checking database for {onion_url}")
             db_check_start = time.time()
-            url_data = connector.database.select_url(url=onion_url)
+            url_data = self._get_url_record(onion_url, connector)
             db_check_time = time.time() - db_check_start
             
-            if not url_data:
-                logger.debug(f"[DarkWatch] URL not in database, saving {onion_url}")
-                connector.database.save(
-                    url=onion_url,
-                    source="Script",
-                    type="URI",
-                    baseurl=onion_url
-                )
-                url_data = connector.database.select_url(url=onion_url)
-            
             if url_data:
                 logger.debug(f"[DarkWatch] Starting crawler for URL ID {url_data[0]} (database check took {db_check_time:.2f}s)")
                 crawl_start = time.time()
@@ -455,15 +584,8 @@ class DarkWatch:
                 if result.get("status") == "online":
                     keywords_matched = result.get("keywords_matched", "")
                     logger.debug(f"[DarkWatch] Crawl completed for {onion_url} in {crawl_time:.2f}s - Status: online, Keywords matched: {keywords_matched}, Score: {result.get('score_keywords', 0)}")
-                    return {
-                        "title": result.get("title", "Untitled"),
-                        "content": result.get("content", ""),
-                        "category": self._map_category_from_string(result.get("category", "unknown")),
-                        "linked_onions": connector.more_urls(onion_url) or [],
-                        "keywords_matched": result.get("keywords_matched", ""),
-                        "score_categorie": result.get("score_categorie", 0),
-                        "score_keywords": result.get("score_keywords", 0)
-                    }
+                    # Links come from the same parse as the text and title; no second fetch of the page
+                    return self._keyword_monitor_page(result, result.get("links", []))
                 else:
                     logger.debug(f"[DarkWatch] Crawl completed for {onion_url} in {crawl_time:.2f}s - Status: {result.get('status', 'unknown')}")
         
@@ -497,17 +619,7 @@ class DarkWatch:
                 bitcoin_count = len(site_data.get("bitcoin_addresses", []))
                 links_count = len(site_data.get("links", []))
                 logger.debug(f"[DarkWatch] Site analyzer crawl completed for {onion_url} in {crawl_time:.2f}s - Status: online, Emails: {emails_count}, Bitcoin: {bitcoin_count}, Links: {links_count}")
-                return {
-                    "title": site_data.get("title", "Untitled"),
-                    "content": site_data.get("text", ""),
-                    "category": self._categorize_site(site_data.get("text", ""), site_data.get("title", "")),
-                    "linked_onions": [link.replace("http://", "").replace("https://", "") 
-                                     for link in site_data.get("links", []) 
-                                     if ".onion" in link],
-                    "emails": site_data.get("emails", []),
-                    "bitcoin_addresses": site_data.get("bitcoin_addresses", []),
-                    "language": site_data.get("language", "unknown")
-                }
+                return self._site_analyzer_page(site_data)
             else:
                 logger.debug(f"[DarkWatch] Site analyzer crawl completed for {onion_url} in {crawl_time:.2f}s - Status: {site_data.get('status', 'unknown')}")
         
@@ -515,12 +627,7 @@ class DarkWatch:
             crawl_error_time = time.time() - crawl_start_time
             logger.error(f"[DarkWatch] Error in site analyzer crawl for {onion_url} after {crawl_error_time:.2f}s: {e}", exc_info=True)
         
-        return {
-            "title": "Unknown",
-            "content": "",
-            "category": SiteCategory.UNKNOWN,
-            "linked_onions": []
-        }
+        return self._empty_page()
     
     def _map_category_from_string(self, category_str: str) -> SiteCategory:
         
@@ -658,21 +765,30 @@ class DarkWatch:
         )
         return unique_urls
     
-    def crawl_site(self, onion_url: str, depth: int = 1) -> OnionSite:
+    def _get_crawled_site(self, onion_url: str) -> Optional[OnionSite]:
         
-        crawl_start_time = time.time()
-        logger.info(f"[DarkWatch] crawl_site called for {onion_url} (depth={depth})")
-        
-
         if self.url_filter.contains(onion_url):  # DSA-USED: BloomFilter
             existing = self.sites.get(self._generate_site_id(onion_url))  # DSA-USED: HashMap
             if existing:
                 logger.debug(f"[DarkWatch] Site {onion_url} already crawled, returning cached result")
                 return existing
         
-
         self.url_filter.add(onion_url)  # DSA-USED: BloomFilter
         logger.debug(f"[DarkWatch] Added {onion_url} to URL filter")
+        return None
+    
+    def crawl_site(self, onion_url: str, depth: int = 1) -> OnionSite:
+        
+        crawl_start_time = time.time()
+        logger.info(f"[DarkWatch] crawl_site called for {onion_url} (depth={depth})")
+        
+        existing = self._get_crawled_site(onion_url)
+        if existing:
+            return existing
+        
+        stored_page = self._load_stored_page(onion_url)
+        if stored_page is not None:
+            return self._index_site(onion_url, stored_page, depth, crawl_start_time)
         
 
         logger.info(f"[DarkWatch] Starting real crawl for {onion_url}")
@@ -681,6 +797,121 @@ class DarkWatch:
         crawl_time = time.time() - crawl_start
         logger.info(f"[DarkWatch] Real crawl completed for {onion_url} in {crawl_time:.2f}s")
         
+        site = self._index_site(onion_url, page_data, depth, crawl_start_time)
+        self._store_site(site, page_data)
+        self._record_visit(site, page_data)
+        return site
+    
+    async def crawl_site_async(self, onion_url: str, crawler: AsyncTorCrawler, depth: int = 1) -> OnionSite:
+        
+        crawl_start_time = time.time()
+        logger.info(f"[DarkWatch] crawl_site_async called for {onion_url} (depth={depth})")
+        
+        existing = self._get_crawled_site(onion_url)
+        if existing:
+            return existing
+        
+        loop = asyncio.get_running_loop()
+        stored_page = await loop.run_in_executor(None, self._load_stored_page, onion_url)
+        if stored_page is not None:
+            return await loop.run_in_executor(
+                None, self._index_site, onion_url, stored_page, depth, crawl_start_time
+            )
+        
+        page_data = await self._crawl_site_real_async(onion_url, crawler)
+        logger.info(f"[DarkWatch] Async crawl completed for {onion_url} in {time.time() - crawl_start_time:.2f}s")
+        
+        site = await loop.run_in_executor(
+            None, self._index_site, onion_url, page_data, depth, crawl_start_time
+        )
+        await loop.run_in_executor(None, self._store_site, site, page_data)
+        await loop.run_in_executor(None, self._record_visit, site, page_data)
+        return site
+    
+    def _load_stored_page(self, onion_url: str) -> Optional[Dict[str, Any]]:
+        
+        if self.intel_store is None:
+            return None
+        
+        try:
+            # Scheduled runs reuse a copy for the site's whole revisit interval; ad-hoc jobs only
+            # use it to refetch frequently changing sites sooner than the store-wide max age
+            max_age = self.revisit_policy.max_age(onion_url) if self.revisit_policy else None
+            if max_age is not None and not self.scheduled_run:
+                max_age = min(max_age, self.intel_store.max_age)
+            record = self.intel_store.get(onion_url, max_age=max_age)
+        except Exception as e:
+            logger.warning(f"[DarkWatch] Intel store lookup failed for {onion_url}: {e}")
+            return None
+        if record is None:
+            return None
+        
+        try:
+            category = SiteCategory(record["category"])
+        except ValueError:
+            category = SiteCategory.UNKNOWN
+        
+        entities = [
+            ExtractedEntity(
+                entity_type=entity["type"],
+                value=entity["value"],
+                context=entity.get("context", ""),
+                source_url=entity.get("source_url", onion_url),
+                discovered_at=datetime.fromisoformat(entity["discovered_at"]),
+                confidence=entity.get("confidence", 1.0)
+            )
+            for entity in record["entities"]
+        ]
+        
+        age = time.time() - record["last_crawled"]
+        logger.info(f"[DarkWatch] Reusing stored intel for {onion_url} (crawled {age:.0f}s ago), skipping Tor fetch")
+        return {
+            "title": record["title"],
+            "content": record["content"],
+            "category": category,
+            "language": record["language"],
+            "linked_onions": list(record["outlinks"]),
+            "entities": entities,
+            "first_seen": datetime.fromtimestamp(record["first_seen"])
+        }
+    
+    def _store_site(self, site: OnionSite, page_data: Dict[str, Any]):
+        
+        # Failed crawls come back with no content; don't let them mask the site until it goes stale
+        if self.intel_store is None or not page_data.get("content"):
+            return
+        
+        try:
+            self.intel_store.put(
+                onion_url=site.onion_url,
+                title=site.title,
+                category=site.category.value,
+                language=site.language,
+                content=page_data["content"],
+                content_hash=site.content_hash,
+                entities=[entity.to_dict() for entity in site.extracted_entities],
+                outlinks=site.linked_sites
+            )
+        except Exception as e:
+            logger.warning(f"[DarkWatch] Failed to store intel for {site.onion_url}: {e}")
+    
+    def _record_visit(self, site: OnionSite, page_data: Dict[str, Any]):
+        
+        if self.revisit_policy is None:
+            return
+        
+        online = bool(page_data.get("content"))
+        try:
+            state = self.revisit_policy.record(site.onion_url, site.content_hash if online else None, online)
+            logger.debug(
+                f"[DarkWatch] Next visit of {site.onion_url} in {state.interval:.0f}s "
+                f"({state.changes} changes in {state.visits} visits, {state.failures} failures)"
+            )
+        except Exception as e:
+            logger.warning(f"[DarkWatch] Failed to record visit for {site.onion_url}: {e}")
+    
+    def _index_site(self, onion_url: str, page_data: Dict[str, Any], depth: int, crawl_start_time: float) -> OnionSite:
+        
         site_id = self._generate_site_id(onion_url)
         content = page_data["content"]
         title = page_data["title"]
@@ -688,10 +919,16 @@ class DarkWatch:
         logger.debug(f"[DarkWatch] Extracted data for {onion_url}: Title='{title}', Content length={content_length} chars")
         
 
-        entity_extract_start = time.time()
-        entities = self._extract_entities(content, onion_url)
-        entity_extract_time = time.time() - entity_extract_start
-        logger.debug(f"[DarkWatch] Extracted {len(entities)} entities from {onion_url} in {entity_extract_time:.2f}s")
+        if "entities" in page_data:
+            entities = list(page_data["entities"])
+            for entity in entities:
+                self._store_entity(entity)
+            logger.debug(f"[DarkWatch] Using {len(entities)} stored entities for {onion_url}")
+        else:
+            entity_extract_start = time.time()
+            entities = self._extract_entities(content, onion_url, page_data.get("entity_matches"))
+            entity_extract_time = time.time() - entity_extract_start
+            logger.debug(f"[DarkWatch] Extracted {len(entities)} entities from {onion_url} in {entity_extract_time:.2f}s")
         
 
         now = datetime.now()
@@ -730,16 +967,16 @@ class DarkWatch:
         logger.debug(f"[DarkWatch] Found {len(linked_sites)} linked onion sites for {onion_url}")
         
 
-        category_start = time.time()
-        category = page_data.get("category", self._categorize_site(content, title))
-        category_time = time.time() - category_start
-        logger.debug(f"[DarkWatch] Categorized {onion_url} as '{category.value}' in {category_time:.3f}s")
-        
-
-        keyword_check_start = time.time()
-        keywords_matched = self._check_keyword_matches(content)
-        keyword_check_time = time.time() - keyword_check_start
-        logger.debug(f"[DarkWatch] Keyword check for {onion_url}: {len(keywords_matched)} matches found in {keyword_check_time:.3f}s - Matches: {keywords_matched}")
+        analysis_start = time.time()
+        analysis = self.text_analyzer.analyze(f"{title} {content}")  # one tokenizing pass for all three
+        category = page_data.get("category")
+        if category is None or category == SiteCategory.UNKNOWN:
+            # UNKNOWN is truthy, so an `or` chain would never fall back to the analyzer
+            category = analysis.category or SiteCategory.UNKNOWN
+        keywords_matched = analysis.keywords
+        analysis_time = time.time() - analysis_start
+        logger.debug(f"[DarkWatch] Categorized {onion_url} as '{category.value}' in {analysis_time:.3f}s")
+        logger.debug(f"[DarkWatch] Keyword check for {onion_url}: {len(keywords_matched)} matches found - Matches: {keywords_matched}")
         
 
         risk_calc_start = time.time()
@@ -754,10 +991,8 @@ class DarkWatch:
             language = page_data["language"]
             logger.debug(f"[DarkWatch] Language for {onion_url} from page_data: {language}")
         else:
-            lang_detect_start = time.time()
-            language = self._detect_language(content)
-            lang_detect_time = time.time() - lang_detect_start
-            logger.debug(f"[DarkWatch] Detected language for {onion_url}: {language} (detected in {lang_detect_time:.3f}s)")
+            language = analysis.language if len(content) >= 10 else "unknown"
+            logger.debug(f"[DarkWatch] Detected language for {onion_url}: {language}")
         
 
         site = OnionSite(
@@ -765,11 +1000,12 @@ class DarkWatch:
             site_id=site_id,
             title=title,
             category=category,
-            first_seen=now,
+            first_seen=page_data.get("first_seen", now),
             last_seen=now,
             is_online=True,
             language=language,
             content_hash=self._hash_content(content),
+            simhash=page_data["simhash"] if "simhash" in page_data else simhash(content),
             linked_sites=linked_sites,
             extracted_entities=entities,
             keywords_matched=keywords_matched,
@@ -779,6 +1015,8 @@ class DarkWatch:
         
 
         self.sites.put(site_id, site)  # DSA-USED: HashMap
+        if site.simhash:
+            self.clone_index.add(site_id, site.simhash)  # DSA-USED: SimHashIndex
         logger.debug(f"[DarkWatch] Stored site {site_id} in sites HashMap")
         
 
@@ -844,7 +1082,7 @@ class DarkWatch:
                 threat_level=threat_level,
                 is_data_leak=category == SiteCategory.LEAK_SITE
             )
-            self.mentions.put(mention_id, mention)  # DSA-USED: HashMap
+            self._store_mention(mention)
             self.stats["brand_mentions"] += 1
         
         if keywords_matched:
@@ -887,21 +1125,81 @@ class DarkWatch:
         
         return results
     
+    def crawl_recursive(
+        self,
+        seed_urls: List[str],
+        depth: int = 1,
+        max_pages: int = 50,
+        frontier: Optional[CrawlFrontier] = None
+    ) -> List[OnionSite]:
+        """Crawl seed URLs and follow their onion links down to depth.
+        
+        DSA-USED:
+        - None: Pending URLs live in the persistent CrawlFrontier; sites are indexed
+          through crawl_site (HashMap, Graph, BloomFilter)
+        
+        Args:
+            seed_urls: Onion URLs to start from
+            depth: Link depth to follow from the seeds
+            max_pages: Maximum number of sites to crawl
+            frontier: Frontier to use; pass one with a fixed ID to resume an interrupted crawl
+        
+        Returns:
+            List of crawled sites in crawl order
+        """
+        frontier = frontier or CrawlFrontier(f"darkwatch-{uuid.uuid4().hex[:12]}")
+        frontier.push_many(seed_urls, depth)
+        
+        results = []
+        try:
+            while len(results) < max_pages:
+                entries = frontier.claim(1)
+                if not entries:
+                    if frontier.pending_count() == 0:
+                        break
+                    time.sleep(frontier.next_ready_in() or 1.0)
+                    continue
+                
+                entry = entries[0]
+                try:
+                    site = self.crawl_site(entry.url, depth=entry.depth)
+                except Exception as e:
+                    logger.warning(f"[DarkWatch] Recursive crawl failed for {entry.url}: {e}")
+                    frontier.fail(entry)
+                    continue
+                frontier.complete(entry, site.linked_sites, site.risk_score)
+                results.append(site)
+        finally:
+            frontier.release()
+        
+        logger.info(f"[DarkWatch] Recursive crawl finished: {len(results)} sites, frontier={frontier.get_stats()}")
+        return results
+    
     def search_entities(
         self,
         entity_type: Optional[str] = None,
         value_pattern: Optional[str] = None
     ) -> List[ExtractedEntity]:
         
-        results = []
+        values = None
+        if entity_type:
+            values = self.entities_by_type.get(entity_type, {}).keys()
         
-        for key in self.entities.keys():
-            entity = self.entities.get(key)  # DSA-USED: HashMap
-            if entity:
-                if entity_type and entity.entity_type != entity_type:
-                    continue
-                if value_pattern and not re.search(value_pattern, entity.value, re.I):
-                    continue
+        matcher = None
+        if value_pattern:
+            matcher = re.compile(value_pattern, re.I)
+            # Only values containing every literal run of the pattern can match it
+            narrowed = self.entity_trigrams.search_regex(value_pattern)  # DSA-USED: TrigramIndex
+            if narrowed is not None:
+                values = narrowed if values is None else narrowed & values
+        
+        if values is None:
+            values = self.entities.keys()
+        
+        results = []
+        for value in values:
+            entity = self.entities.get(value)  # DSA-USED: HashMap
+            if entity and (matcher is None or matcher.search(entity.value)):
                 results.append(entity)
         
         return results
@@ -912,22 +1210,19 @@ class DarkWatch:
         min_threat_level: ThreatLevel = ThreatLevel.INFO
     ) -> List[BrandMention]:
         
-        results = []
         level_order = [ThreatLevel.INFO, ThreatLevel.LOW, ThreatLevel.MEDIUM, 
                        ThreatLevel.HIGH, ThreatLevel.CRITICAL]
         min_level_idx = level_order.index(min_threat_level)
         
-        for key in self.mentions.keys():
-            mention = self.mentions.get(key)
-            if mention:
-                if keyword and mention.keyword.lower() != keyword.lower():
-                    continue
-                mention_level_idx = level_order.index(mention.threat_level)
-                if mention_level_idx < min_level_idx:
-                    continue
-                results.append(mention)
+        timeline = self.mentions_by_keyword.get(keyword.lower()) if keyword else self.mention_timeline
+        if timeline is None:
+            return []
         
-        return sorted(results, key=lambda m: m.discovered_at, reverse=True)
+        # The timeline is already ordered by discovery time; walk it newest first
+        return [
+            mention for _, mention in reversed(timeline.to_list())  # DSA-USED: SkipList
+            if level_order.index(mention.threat_level) >= min_level_idx
+        ]
     
     def get_site_network(self, site_id: str, depth: int = 2) -> Dict[str, Any]:
         
@@ -982,21 +1277,34 @@ class DarkWatch:
         
         return {"nodes": nodes, "edges": edges}
     
-    def find_clones(self, site_id: str) -> List[OnionSite]:
-        
-        target_site = self.sites.get(site_id)
+    def find_clones(self, site_id: str, threshold: float = 0.9) -> List[Tuple[OnionSite, float]]:
+        """Find sites whose content is a near-duplicate of the given site.
+        
+        DSA-USED:
+        - SimHashIndex: Block-partitioned lookup of fingerprints within the
+          Hamming distance implied by threshold
+        - HashMap: Site lookup by ID
+        
+        Args:
+            site_id: Site to find clones of
+            threshold: Minimum SimHash similarity (1 - hamming distance / 64)
+        
+        Returns:
+            List of (site, similarity) tuples, most similar first
+        """
+        target_site = self.sites.get(site_id)  # DSA-USED: HashMap
         if not target_site:
             return []
         
         clones = []
-        target_hash = target_site.content_hash
-        
-        for key in self.sites.keys():
-            if key == site_id:
-                continue
-            site = self.sites.get(key)
-            if site and site.content_hash == target_hash:
-                clones.append(site)
+        if target_site.simhash:
+            max_distance = int((1.0 - threshold) * FINGERPRINT_BITS)
+            for key, distance in self.clone_index.query(target_site.simhash, max_distance):  # DSA-USED: SimHashIndex
+                if key == site_id:
+                    continue
+                site = self.sites.get(key)  # DSA-USED: HashMap
+                if site:
+                    clones.append((site, 1.0 - distance / FINGERPRINT_BITS))
         
         return clones
     
@@ -1023,10 +1331,8 @@ class DarkWatch:
             if site and site.last_seen >= cutoff:
                 recent_sites.append(site)
         
-        for key in self.mentions.keys():
-            mention = self.mentions.get(key)
-            if mention and mention.discovered_at >= cutoff:
-                recent_mentions.append(mention)
+        for _, mention in self.mention_timeline.range_query((cutoff, ""), (datetime.max, "")):  # DSA-USED: SkipList
+            recent_mentions.append(mention)
         
         return {
             "period_hours": hours,
@@ -1052,7 +1358,8 @@ class DarkWatch:
             "graph_sites": self.site_graph.vertex_count(),
             "graph_connections": self.site_graph.edge_count(),
             "queue_size": len(self.crawl_queue),
-            "monitored_keywords": len(self.monitored_keywords)
+            "monitored_keywords": len(self.monitored_keywords),
+            "intel_store": self.intel_store.get_stats() if self.intel_store else None
         }
     
     def export_intel(self, format: str = "json") -> str:
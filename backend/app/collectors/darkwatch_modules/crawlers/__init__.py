@@ -1,4 +1,8 @@
 from .tor_connector import TorConnector
 from .url_database import URLDatabase
+from .connector_pool import TorConnectorPool
+from .crawl_frontier import CrawlFrontier, FrontierEntry
+from .revisit_policy import RevisitPolicy, RevisitState
+from .async_crawler import AsyncTorCrawler, ASYNC_CRAWL_AVAILABLE
 
-__all__ = ['TorConnector', 'URLDatabase']
+__all__ = ['TorConnector', 'URLDatabase', 'TorConnectorPool', 'CrawlFrontier', 'FrontierEntry', 'RevisitPolicy', 'RevisitState', 'AsyncTorCrawler', 'ASYNC_CRAWL_AVAILABLE']
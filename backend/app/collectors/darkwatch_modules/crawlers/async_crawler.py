@@ -0,0 +1,328 @@
+"""Asynchronous Tor crawl engine.
+
+This module fetches onion pages over one pooled aiohttp session routed through
+the Tor SOCKS proxy. A global semaphore caps the number of requests in flight
+and per-host limits keep the crawler polite towards individual hidden
+services. Results use the same dict shapes as crawl_onion_site and
+TorConnector.crawler so callers can switch engines without other changes.
+
+This module does not use custom DSA concepts from app.core.dsa.
+"""
+
+import asyncio
+import time
+from random import choice
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+from loguru import logger
+
+try:
+    import aiohttp
+    from aiohttp_socks import ProxyConnector
+    ASYNC_CRAWL_AVAILABLE = True
+except ImportError:
+    ASYNC_CRAWL_AVAILABLE = False
+
+from app.config import settings
+from app.collectors.darkwatch_modules.crawlers.connector_pool import TorConnectorPool
+from app.collectors.darkwatch_modules.extractors.site_crawler import new_crawl_result
+from app.collectors.darkwatch_modules.extractors.page_analyzer import get_page_analysis_pool
+from app.collectors.darkwatch_modules.extractors.utils.bounded_body import read_bounded_async
+
+
+class AsyncTorCrawler:
+
+    def __init__(
+        self,
+        proxy_host: Optional[str] = None,
+        proxy_port: Optional[int] = None,
+        proxy_type: Optional[str] = None,
+        timeout: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        per_host_concurrency: Optional[int] = None,
+        per_host_delay: Optional[float] = None
+    ):
+        self.proxy_host = proxy_host or settings.TOR_PROXY_HOST
+        self.proxy_port = proxy_port or settings.TOR_PROXY_PORT
+        self.proxy_type = proxy_type or settings.TOR_PROXY_TYPE
+        self.timeout = timeout or settings.TOR_TIMEOUT
+        self.concurrency = concurrency or settings.DARKWEB_ASYNC_CONCURRENCY
+        self.per_host_concurrency = per_host_concurrency or settings.DARKWEB_PER_HOST_CONCURRENCY
+        self.per_host_delay = settings.DARKWEB_PER_HOST_DELAY if per_host_delay is None else per_host_delay
+        self.desktop_agents = [
+            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.13; rv:60.0) Gecko/20100101 Firefox/60.0'
+        ]
+
+        self._session = None
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._host_next_slot: Dict[str, float] = {}
+        self.stats = {
+            "requests": 0,
+            "errors": 0,
+            "in_flight": 0,
+            "max_in_flight": 0,
+            "bytes_received": 0,
+            "truncated": 0,
+            "skipped": 0
+        }
+
+    async def __aenter__(self) -> "AsyncTorCrawler":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {
+            'User-Agent': choice(self.desktop_agents),
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
+        }
+
+    async def start(self):
+        """Open the shared SOCKS-proxied session.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Raises:
+            RuntimeError: If aiohttp or aiohttp-socks is not installed
+        """
+        if self._session is not None:
+            return
+        if not ASYNC_CRAWL_AVAILABLE:
+            raise RuntimeError("aiohttp and aiohttp-socks are required for async Tor crawling")
+
+        # socks5h means "resolve through the proxy"; aiohttp-socks expresses that with rdns
+        scheme = "socks5" if self.proxy_type.startswith("socks5") else self.proxy_type.rstrip("h")
+        connector = ProxyConnector.from_url(
+            f"{scheme}://{self.proxy_host}:{self.proxy_port}",
+            rdns=True,
+            limit=self.concurrency,
+            limit_per_host=self.per_host_concurrency
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+        logger.info(
+            f"[AsyncTorCrawler] Session opened via {scheme}://{self.proxy_host}:{self.proxy_port} - "
+            f"concurrency={self.concurrency}, per_host={self.per_host_concurrency}, delay={self.per_host_delay}s"
+        )
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    @staticmethod
+    def _normalize_url(url: str) -> str:
+        if not url.startswith('http://') and not url.startswith('https://'):
+            return f"http://{url}"
+        return url
+
+    async def _wait_for_host_slot(self, host: str):
+        now = time.monotonic()
+        slot = max(now, self._host_next_slot.get(host, 0.0))
+        self._host_next_slot[host] = slot + self.per_host_delay
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def fetch(self, url: str) -> Dict[str, Any]:
+        """Fetch a single page through Tor.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            url: Onion URL, with or without scheme
+
+        Returns:
+            Dictionary with status, status_code, raw content (at most DARKWEB_MAX_RESPONSE_BYTES),
+            decoded text, truncation flag and error
+        """
+        await self.start()
+        url = self._normalize_url(url)
+        host = urlsplit(url).hostname or url
+        result = {
+            "url": url,
+            "status": "unknown",
+            "status_code": None,
+            "content": b"",
+            "text": "",
+            "content_type": None,
+            "charset": None,
+            "truncated": False,
+            "error": None
+        }
+
+        host_semaphore = self._host_semaphores.get(host)
+        if host_semaphore is None:
+            host_semaphore = asyncio.Semaphore(self.per_host_concurrency)
+            self._host_semaphores[host] = host_semaphore
+
+        # Wait for the host's slot and politeness delay before taking a global slot, so requests
+        # queued behind one slow host don't hold global capacity other hosts could use
+        async with host_semaphore:
+            await self._wait_for_host_slot(host)
+            async with self._semaphore:
+                self.stats["requests"] += 1
+                self.stats["in_flight"] += 1
+                self.stats["max_in_flight"] = max(self.stats["max_in_flight"], self.stats["in_flight"])
+                request_start = time.time()
+                try:
+                    async with self._session.get(url, headers=self.headers) as response:
+                        body = await read_bounded_async(response)
+                        result["status"] = "online" if response.status == 200 else "offline"
+                        result["status_code"] = response.status
+                        result["content"] = body.content
+                        result["charset"] = response.charset
+                        result["text"] = body.text
+                        result["content_type"] = response.headers.get("Content-Type")
+                        result["truncated"] = body.truncated
+                        self.stats["bytes_received"] += len(body)
+                        if body.truncated:
+                            self.stats["truncated"] += 1
+                        if body.skipped_content_type:
+                            self.stats["skipped"] += 1
+                    logger.debug(
+                        f"[AsyncTorCrawler] {url} -> {result['status_code']} "
+                        f"({len(result['content'])} bytes) in {time.time() - request_start:.2f}s"
+                    )
+                except asyncio.TimeoutError as e:
+                    result["status"] = "timeout"
+                    result["error"] = str(e) or "timeout"
+                    self.stats["errors"] += 1
+                except (aiohttp.ClientError, OSError) as e:
+                    result["status"] = "offline"
+                    result["error"] = str(e)
+                    self.stats["errors"] += 1
+                except Exception as e:
+                    logger.error(f"[AsyncTorCrawler] Error fetching {url}: {e}")
+                    result["status"] = "error"
+                    result["error"] = str(e)
+                    self.stats["errors"] += 1
+                finally:
+                    self.stats["in_flight"] -= 1
+
+        return result
+
+    async def crawl_onion_site(self, url: str) -> Dict[str, Any]:
+        """Async counterpart of site_crawler.crawl_onion_site with the same result shape.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            url: Onion URL to crawl
+
+        Returns:
+            Dictionary in the crawl_onion_site result format
+        """
+        url = self._normalize_url(url)
+        result = new_crawl_result(url)
+        fetched = await self.fetch(url)
+
+        result["status"] = fetched["status"]
+        result["error"] = fetched["error"]
+        if fetched["status_code"] is not None:
+            result["status_code"] = fetched["status_code"]
+
+        result["truncated"] = fetched["truncated"]
+        if fetched["status_code"] == 200 and fetched["content"]:
+            # HTML parsing is CPU-bound; hand the raw bytes to the analysis process pool
+            result.update(await get_page_analysis_pool().analyze_async(url, fetched["content"], fetched["charset"]))
+        return result
+
+    @staticmethod
+    def _with_connector(connectors: TorConnectorPool, method: str, *args: Any) -> Any:
+        # Runs in the executor thread, so the call uses that thread's own connector
+        return getattr(connectors.get(), method)(*args)
+
+    async def crawl(self, url: List, connectors: TorConnectorPool) -> Dict[str, Any]:
+        """Async counterpart of TorConnector.crawler with the same result shape.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            url: URL record tuple from URLDatabase (id, type, url, ...)
+            connectors: Pool of per-thread TorConnectors used for YARA scoring and
+                database bookkeeping
+
+        Returns:
+            Dictionary in the TorConnector.crawler result format
+        """
+        if url is None or len(url) < 3:
+            logger.warning("[AsyncTorCrawler] Invalid URL tuple provided to crawl")
+            return {}
+
+        fetched = await self.fetch(url[2])
+        loop = asyncio.get_running_loop()
+        if fetched["status_code"] is None:
+            return await loop.run_in_executor(
+                None, self._with_connector, connectors, "record_failure", url, Exception(fetched["error"])
+            )
+        result = await loop.run_in_executor(
+            None, self._with_connector, connectors, "process_response", url, fetched["status_code"], fetched["content"]
+        )
+        result["truncated"] = fetched["truncated"]
+        return result
+
+    async def more_urls(self, url: str, connectors: TorConnectorPool) -> List[str]:
+        """Async counterpart of TorConnector.more_urls.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            url: Onion URL without scheme
+            connectors: Pool of per-thread TorConnectors providing the link extraction rules
+
+        Returns:
+            List of discovered URLs
+        """
+        fetched = await self.fetch(url)
+        if fetched["status_code"] != 200:
+            return []
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self._with_connector, connectors, "extract_more_urls", url, fetched["content"]
+        )
+
+    async def crawl_many(
+        self,
+        urls: Iterable[str],
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """Crawl many sites concurrently, bounded by the global and per-host limits.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            urls: Onion URLs to crawl
+            on_result: Optional callback invoked as each result completes
+
+        Returns:
+            List of crawl_onion_site-shaped results in completion order
+        """
+        tasks = [asyncio.create_task(self.crawl_onion_site(url)) for url in urls]
+        results = []
+        for task in asyncio.as_completed(tasks):
+            result = await task
+            results.append(result)
+            if on_result:
+                on_result(result)
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "hosts_seen": len(self._host_semaphores),
+            "concurrency": self.concurrency,
+            "per_host_concurrency": self.per_host_concurrency
+        }
@@ -0,0 +1,57 @@
+"""Per-worker TorConnector pool.
+
+Building a TorConnector opens the URL database (running its schema check) and
+creates a fresh requests session, which is wasted work when done for every
+crawled page. This module hands each worker thread one long-lived connector
+that is reused across pages, keeping the requests session and its pooled
+proxy connections warm. Connectors are not shared between threads because
+requests sessions are not thread-safe.
+
+This module does not use custom DSA concepts from app.core.dsa.
+"""
+
+import threading
+from typing import Any, Dict
+
+from loguru import logger
+
+from .tor_connector import TorConnector
+
+
+class TorConnectorPool:
+
+    def __init__(self, **connector_kwargs: Any):
+        self.connector_kwargs = connector_kwargs
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._reused = 0
+
+    def get(self) -> TorConnector:
+        """Get the connector owned by the calling thread, creating it on first use.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Returns:
+            TorConnector reserved for the current thread
+        """
+        connector = getattr(self._local, "connector", None)
+        if connector is not None:
+            with self._lock:
+                self._reused += 1
+            return connector
+
+        connector = TorConnector(**self.connector_kwargs)
+        self._local.connector = connector
+        with self._lock:
+            self._created += 1
+        logger.debug(f"[TorConnectorPool] Created connector for thread {threading.current_thread().name}")
+        return connector
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "connectors_created": self._created,
+                "connectors_reused": self._reused
+            }
@@ -0,0 +1,207 @@
+"""Persistent, resumable crawl frontier.
+
+This module keeps the set of onion URLs still to be crawled in the crawler's
+URLDatabase (FRONTIER table) instead of in memory, so a long recursive crawl
+survives a job ending or a process restart. Every state change is committed
+immediately, which makes the table its own checkpoint: claimed rows whose
+worker disappeared are handed out again once their lease expires, and URLs
+already marked done are never re-added.
+
+Workers claim URLs highest priority first. Links discovered on a page inherit
+that page's risk score as their priority, so the neighbourhood of risky sites
+is explored first. A host with an outstanding claim is not handed to a second
+worker, and claims against the same host are spaced by a minimum delay.
+
+This module does not use custom DSA concepts from app.core.dsa.
+"""
+
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+from loguru import logger
+
+from app.config import settings
+from .url_database import URLDatabase
+
+
+SEED_PRIORITY = 1000.0
+
+
+@dataclass
+class FrontierEntry:
+    url: str
+    host: str
+    depth: int
+    priority: float
+    attempts: int = 0
+
+
+def normalize_onion_url(url: str) -> str:
+    url = url.strip()
+    if "://" not in url:
+        url = f"http://{url}"
+    return url
+
+
+class CrawlFrontier:
+
+    def __init__(
+        self,
+        frontier_id: str,
+        database: Optional[URLDatabase] = None,
+        host_delay: Optional[float] = None,
+        lease_timeout: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        max_depth: Optional[int] = None
+    ):
+        self.frontier_id = frontier_id
+        self.database = database or URLDatabase(
+            dbpath=str(settings.DATA_DIR / settings.CRAWLER_DB_PATH),
+            dbname=settings.CRAWLER_DB_NAME
+        )
+        self.host_delay = settings.DARKWEB_PER_HOST_DELAY if host_delay is None else host_delay
+        self.lease_timeout = lease_timeout or settings.DARKWEB_FRONTIER_LEASE_TIMEOUT
+        self.max_attempts = max_attempts or settings.DARKWEB_FRONTIER_MAX_ATTEMPTS
+        self.max_depth = settings.DARKWEB_FRONTIER_MAX_DEPTH if max_depth is None else max_depth
+        self.worker_id = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._lock = threading.Lock()
+        self._host_next_slot: Dict[str, float] = {}
+        self._claimed: Dict[str, FrontierEntry] = {}
+
+        released = self.release_stale()
+        if released:
+            logger.info(f"[CrawlFrontier] Resuming '{frontier_id}': re-queued {released} interrupted URLs")
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return urlsplit(url).netloc.lower()
+
+    def push_many(
+        self,
+        urls: Iterable[str],
+        depth: int,
+        priority: float = SEED_PRIORITY,
+        parent: Optional[str] = None
+    ) -> int:
+        """Add URLs to the frontier, ignoring ones it already holds in any state.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            urls: Onion URLs (with or without scheme)
+            depth: Remaining link depth for these URLs
+            priority: Claim priority (seeds default to SEED_PRIORITY)
+            parent: URL the links were discovered on
+
+        Returns:
+            Number of URLs newly added
+        """
+        if depth < 0:
+            return 0
+        depth = min(depth, self.max_depth)
+        entries = []
+        for url in dict.fromkeys(normalize_onion_url(u) for u in urls if u):
+            host = self.host_of(url)
+            if host.endswith(".onion"):
+                entries.append((url, host, depth, priority, parent))
+        return self.database.frontier_add(self.frontier_id, entries)
+
+    def claim(self, limit: int = 1) -> List[FrontierEntry]:
+        """Claim up to limit URLs, at most one per host and respecting host spacing.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            limit: Maximum number of URLs to claim
+
+        Returns:
+            Claimed entries, highest priority first
+        """
+        claimed: List[FrontierEntry] = []
+        with self._lock:
+            now = time.monotonic()
+            hosts_taken = set()
+            for url, host, depth, priority, attempts in self.database.frontier_candidates(
+                self.frontier_id, max(limit * 4, 64)
+            ):
+                if len(claimed) >= limit:
+                    break
+                if host in hosts_taken or self._host_next_slot.get(host, 0.0) > now:
+                    continue
+                if not self.database.frontier_claim(self.frontier_id, url, self.worker_id):
+                    continue
+                hosts_taken.add(host)
+                self._host_next_slot[host] = now + self.host_delay
+                entry = FrontierEntry(url, host, depth, priority, attempts)
+                self._claimed[url] = entry
+                claimed.append(entry)
+        return claimed
+
+    def complete(self, entry: FrontierEntry, linked_urls: Iterable[str] = (), risk_score: float = 0.0) -> int:
+        """Mark a claimed URL done and enqueue its links one level deeper.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            entry: Entry returned by claim()
+            linked_urls: Onion links found on the page
+            risk_score: Page risk score, used as the links' priority
+
+        Returns:
+            Number of linked URLs newly added
+        """
+        self.database.frontier_finish(self.frontier_id, entry.url, "done", entry.priority)
+        with self._lock:
+            self._claimed.pop(entry.url, None)
+        if entry.depth <= 0:
+            return 0
+        return self.push_many(linked_urls, entry.depth - 1, priority=risk_score, parent=entry.url)
+
+    def fail(self, entry: FrontierEntry):
+        """Return a failed URL to the queue at lower priority, or retire it after max_attempts."""
+        attempts = entry.attempts + 1
+        state = "failed" if attempts >= self.max_attempts else "pending"
+        self.database.frontier_finish(self.frontier_id, entry.url, state, entry.priority / 2, failed=True)
+        with self._lock:
+            self._claimed.pop(entry.url, None)
+
+    def release(self):
+        """Hand back every URL this instance still holds so a later run can pick them up."""
+        with self._lock:
+            entries = list(self._claimed.values())
+            self._claimed.clear()
+        for entry in entries:
+            self.database.frontier_finish(self.frontier_id, entry.url, "pending", entry.priority)
+
+    def release_stale(self) -> int:
+        return self.database.frontier_release_stale(self.frontier_id, time.time() - self.lease_timeout)
+
+    def next_ready_in(self) -> float:
+        """Seconds until the earliest host politeness slot opens (0 if one is open now)."""
+        with self._lock:
+            now = time.monotonic()
+            upcoming = [slot for slot in self._host_next_slot.values() if slot > now]
+        return min(upcoming) - now if upcoming else 0.0
+
+    def counts(self) -> Dict[str, int]:
+        return self.database.frontier_counts(self.frontier_id)
+
+    def pending_count(self) -> int:
+        return self.counts().get("pending", 0)
+
+    def get_stats(self) -> Dict[str, int]:
+        counts = self.counts()
+        return {
+            "pending": counts.get("pending", 0),
+            "claimed": counts.get("claimed", 0),
+            "done": counts.get("done", 0),
+            "failed": counts.get("failed", 0)
+        }
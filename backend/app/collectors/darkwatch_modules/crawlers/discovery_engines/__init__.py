@@ -1,5 +1,9 @@
 from .onionsearch import DarkWebEngine
+from .search_scheduler import DiscoveryScheduler, SearchResultCache, get_search_result_cache
 
 __all__ = [
-    'DarkWebEngine'
+    'DarkWebEngine',
+    'DiscoveryScheduler',
+    'SearchResultCache',
+    'get_search_result_cache'
 ]
@@ -8,7 +8,7 @@ import math
 import re
 import time
 from random import choice
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from urllib.parse import quote, unquote, parse_qs, urlparse, urlencode
 
 import requests
@@ -293,7 +293,7 @@ def link_finder(engine_str: str, data_obj, debug: bool = False) -> List[Dict[str
     return found_links
 
 
-def ahmia(
+def fetch_ahmia_page(
     searchstr: str,
     proxies: Dict[str, str],
     timeout: Optional[int] = None,
@@ -301,56 +301,67 @@ def ahmia(
     debug: bool = False
 ) -> List[Dict[str, str]]:
     
-    engine_start = time.time()
-    loguru_logger.info(f"[OnionSearch] [Ahmia] Starting search for: {searchstr}")
-    results = []
-
     ahmia_base = ENGINES['ahmia']
     
-    try:
 
-        loguru_logger.debug(f"[OnionSearch] [Ahmia] Getting search page to extract CSRF token")
-        if debug:
-            logger.debug(f"Ahmia: Getting search page to extract CSRF token")
-        search_page_resp = safe_request(
-            'GET', ahmia_base + "/",
-            proxies=proxies,
-            headers=random_headers(),
-            timeout=timeout,
-            max_retries=max_retries,
-            debug=debug
-        )
-        search_page_soup = BeautifulSoup(search_page_resp.text, 'html5lib')
-        
+    loguru_logger.debug(f"[OnionSearch] [Ahmia] Getting search page to extract CSRF token")
+    if debug:
+        logger.debug(f"Ahmia: Getting search page to extract CSRF token")
+    search_page_resp = safe_request(
+        'GET', ahmia_base + "/",
+        proxies=proxies,
+        headers=random_headers(),
+        timeout=timeout,
+        max_retries=max_retries,
+        debug=debug
+    )
+    search_page_soup = BeautifulSoup(search_page_resp.text, 'html5lib')
+    
 
-        csrf_params = {}
-        forms = search_page_soup.find_all('form')
-        for form in forms:
-            hidden_inputs = form.find_all('input', type='hidden')
-            for inp in hidden_inputs:
-                csrf_params[inp.get('name')] = inp.get('value', '')
-        
+    csrf_params = {}
+    forms = search_page_soup.find_all('form')
+    for form in forms:
+        hidden_inputs = form.find_all('input', type='hidden')
+        for inp in hidden_inputs:
+            csrf_params[inp.get('name')] = inp.get('value', '')
+    
 
-        search_params = {'q': searchstr}
-        search_params.update(csrf_params)
-        
+    search_params = {'q': searchstr}
+    search_params.update(csrf_params)
+    
 
-        ahmia_search_url = ahmia_base + "/search/?" + urlencode(search_params)
-        
-        loguru_logger.debug(f"[OnionSearch] [Ahmia] Requesting search with CSRF token")
-        if debug:
-            logger.debug(f"Ahmia: Requesting search with CSRF token: {ahmia_search_url[:150]}...")
-        
-        response = safe_request(
-            'GET', ahmia_search_url,
-            proxies=proxies,
-            headers=random_headers(),
-            timeout=timeout,
-            max_retries=max_retries,
-            debug=debug
-        )
-        soup = BeautifulSoup(response.text, 'html5lib')
-        results = link_finder("ahmia", soup, debug=debug)
+    ahmia_search_url = ahmia_base + "/search/?" + urlencode(search_params)
+    
+    loguru_logger.debug(f"[OnionSearch] [Ahmia] Requesting search with CSRF token")
+    if debug:
+        logger.debug(f"Ahmia: Requesting search with CSRF token: {ahmia_search_url[:150]}...")
+    
+    response = safe_request(
+        'GET', ahmia_search_url,
+        proxies=proxies,
+        headers=random_headers(),
+        timeout=timeout,
+        max_retries=max_retries,
+        debug=debug
+    )
+    soup = BeautifulSoup(response.text, 'html5lib')
+    return link_finder("ahmia", soup, debug=debug)
+
+
+def ahmia(
+    searchstr: str,
+    proxies: Dict[str, str],
+    timeout: Optional[int] = None,
+    max_retries: int = 2,
+    debug: bool = False
+) -> List[Dict[str, str]]:
+    
+    engine_start = time.time()
+    loguru_logger.info(f"[OnionSearch] [Ahmia] Starting search for: {searchstr}")
+    results = []
+    
+    try:
+        results = fetch_ahmia_page(searchstr, proxies, timeout, max_retries, debug)
         
         engine_time = time.time() - engine_start
         
@@ -387,6 +398,52 @@ def ahmia(
     return results
 
 
+def fetch_tor66_page(
+    searchstr: str,
+    page: int,
+    proxies: Dict[str, str],
+    timeout: Optional[int] = None,
+    max_retries: int = 2,
+    max_pages: int = 30,
+    debug: bool = False
+) -> Tuple[List[Dict[str, str]], int]:
+    
+    tor66_url = ENGINES['tor66'] + "/search?q={}&sorttype=rel&page={}"
+    url = tor66_url.format(quote(searchstr), page)
+    loguru_logger.debug(f"[OnionSearch] [Tor66] Requesting page {page}: {url[:100]}...")
+    if debug:
+        logger.debug(f"Tor66: Requesting {url}")
+    
+    resp = safe_request(
+        'GET', url,
+        proxies=proxies,
+        headers=random_headers(),
+        timeout=timeout,
+        max_retries=max_retries,
+        debug=debug
+    )
+    soup = BeautifulSoup(resp.text, 'html5lib')
+
+    # Only the first page is used to size the result set
+    page_number = page
+    if page == 1:
+        approx_re = re.search(r"\.Onion\ssites\sfound\s:\s([0-9]+)", resp.text)
+        if approx_re is not None:
+            nb_res = int(approx_re.group(1))
+            results_per_page = 20
+            page_number = math.ceil(float(nb_res / results_per_page))
+            if page_number > max_pages:
+                page_number = max_pages
+            loguru_logger.info(
+                f"[OnionSearch] [Tor66] Found {nb_res} total results, "
+                f"will fetch {page_number} pages"
+            )
+
+    results = link_finder("tor66", soup, debug=debug)
+    loguru_logger.debug(f"[OnionSearch] [Tor66] Page {page}: Found {len(results)} results")
+    return results, page_number
+
+
 def tor66(
     searchstr: str,
     proxies: Dict[str, str],
@@ -399,69 +456,23 @@ def tor66(
     engine_start = time.time()
     loguru_logger.info(f"[OnionSearch] [Tor66] Starting search for: {searchstr} (max_pages={max_pages})")
     results = []
-    tor66_url = ENGINES['tor66'] + "/search?q={}&sorttype=rel&page={}"
     
     try:
-        with requests.Session() as s:
-            s.proxies = proxies
-            s.headers = random_headers()
+        results, page_number = fetch_tor66_page(searchstr, 1, proxies, timeout, max_retries, max_pages, debug)
 
-            url = tor66_url.format(quote(searchstr), 1)
-            loguru_logger.debug(f"[OnionSearch] [Tor66] Requesting page 1: {url[:100]}...")
-            if debug:
-                logger.debug(f"Tor66: Requesting {url}")
-            
-            resp = safe_request(
-                'GET', url,
-                proxies=proxies,
-                headers=random_headers(),
-                timeout=timeout,
-                max_retries=max_retries,
-                debug=debug
-            )
-            soup = BeautifulSoup(resp.text, 'html5lib')
-
-            page_number = 1
-            approx_re = re.search(r"\.Onion\ssites\sfound\s:\s([0-9]+)", resp.text)
-            if approx_re is not None:
-                nb_res = int(approx_re.group(1))
-                results_per_page = 20
-                page_number = math.ceil(float(nb_res / results_per_page))
-                if page_number > max_pages:
-                    page_number = max_pages
-                loguru_logger.info(
-                    f"[OnionSearch] [Tor66] Found {nb_res} total results, "
-                    f"will fetch {page_number} pages"
+        for n in range(2, page_number + 1):
+            try:
+                ret, _ = fetch_tor66_page(searchstr, n, proxies, timeout, max_retries, max_pages, debug)
+                results.extend(ret)
+            except (requests.exceptions.RequestException, ConnectionError) as e:
+                loguru_logger.warning(
+                    f"[OnionSearch] [Tor66] Error fetching page {n}/{page_number}: {e}"
                 )
-
-            results = link_finder("tor66", soup, debug=debug)
-            loguru_logger.debug(f"[OnionSearch] [Tor66] Page 1: Found {len(results)} results")
-
-            for n in range(2, page_number + 1):
-                try:
-                    url = tor66_url.format(quote(searchstr), n)
-                    loguru_logger.debug(f"[OnionSearch] [Tor66] Requesting page {n}/{page_number}")
-                    resp = safe_request(
-                        'GET', url,
-                        proxies=proxies,
-                        headers=random_headers(),
-                        timeout=timeout,
-                        max_retries=max_retries,
-                        debug=debug
-                    )
-                    soup = BeautifulSoup(resp.text, 'html5lib')
-                    ret = link_finder("tor66", soup, debug=debug)
-                    loguru_logger.debug(f"[OnionSearch] [Tor66] Page {n}: Found {len(ret)} results")
-                    results.extend(ret)
-                except (requests.exceptions.RequestException, ConnectionError) as e:
-                    loguru_logger.warning(
-                        f"[OnionSearch] [Tor66] Error fetching page {n}/{page_number}: {e}"
-                    )
-                    logger.warning(f"Tor66: Error fetching page {n}: {e}")
-                    if debug:
-                        import traceback
-                        logger.debug(traceback.format_exc())
-                    break 
+                logger.warning(f"Tor66: Error fetching page {n}: {e}")
+                if debug:
+                    import traceback
+                    logger.debug(traceback.format_exc())
+                break 
 
     except Exception as e:
         engine_time = time.time() - engine_start
@@ -577,6 +588,18 @@ def search_all_engines(
             continue
     
 
+    unique_urls = extract_onion_urls(all_results)
+    
+    search_time = time.time() - search_start
+    loguru_logger.info(
+        f"[OnionSearch] [search_all_engines] Completed in {search_time:.2f}s with {len(unique_urls)} unique URLs"
+    )
+    logger.info(f"Total unique URLs found: {len(unique_urls)}")
+    return unique_urls
+
+
+def extract_onion_urls(all_results: List[Dict[str, str]]) -> List[str]:
+    
     unique_urls = set()
     processed_count = 0
     rejected_count = 0
@@ -657,11 +680,9 @@ def search_all_engines(
             )
             continue
     
-    search_time = time.time() - search_start
     total_filtered = rejected_count + duplicate_count
     loguru_logger.info(
-        f"[OnionSearch] [search_all_engines] Completed in {search_time:.2f}s. "
-        f"Processed: {processed_count}, Accepted (unique): {len(unique_urls)}, "
+        f"[OnionSearch] [search_all_engines] Processed: {processed_count}, Accepted (unique): {len(unique_urls)}, "
         f"Rejected: {rejected_count}, Duplicates: {duplicate_count}, Total filtered: {total_filtered}. "
         f"Rejection reasons: {rejection_reasons}"
     )
@@ -677,7 +698,6 @@ def search_all_engines(
             f"Rejection breakdown: {rejection_reasons}"
         )
     
-    logger.info(f"Total unique URLs found: {len(unique_urls)}")
     return list(unique_urls)
 
 
@@ -736,6 +756,9 @@ class DarkWebEngine:
         
         loguru_logger.info(f"[DarkWebEngine] Starting discovery with {len(search_queries)} search queries: {search_queries}")
         
+        if settings.ONIONSEARCH_PARALLEL:
+            return self._discover_urls_parallel(search_queries, discovery_start)
+        
         all_urls = []
         
         try:
@@ -770,14 +793,7 @@ class DarkWebEngine:
                     continue
             
 
-            unique_urls = []
-            seen = set()
-            for url in all_urls:
-
-                normalized = url.strip().lower()
-                if normalized not in seen and '.onion' in normalized:
-                    seen.add(normalized)
-                    unique_urls.append(url)
+            unique_urls = self._unique_urls(all_urls)
             
             total_time = time.time() - discovery_start
             loguru_logger.info(
@@ -790,4 +806,51 @@ class DarkWebEngine:
             error_time = time.time() - discovery_start
             loguru_logger.error(f"[DarkWebEngine] Error after {error_time:.2f}s: {e}", exc_info=True)
             return []
+    
+    def _discover_urls_parallel(self, search_queries: List[str], discovery_start: float) -> List[str]:
+        
+        from .search_scheduler import DiscoveryScheduler
+        
+        all_urls = []
+        
+        try:
+            scheduler = DiscoveryScheduler(
+                proxies=self.proxies,
+                timeout=self.timeout,
+                max_retries=2,
+                max_pages=self.max_pages,
+                debug=settings.DEBUG
+            )
+            raw_results = scheduler.run(search_queries, self.engines)
+            
+            for query, results in raw_results.items():
+                urls = extract_onion_urls(results)
+                loguru_logger.info(f"[DarkWebEngine] Query '{query}' found {len(urls)} URLs")
+                all_urls.extend(urls)
+            
+            unique_urls = self._unique_urls(all_urls)
+            
+            total_time = time.time() - discovery_start
+            loguru_logger.info(
+                f"[DarkWebEngine] Parallel discovery completed in {total_time:.2f}s. "
+                f"Found {len(unique_urls)} unique .onion URLs from {len(all_urls)} total results"
+            )
+            return unique_urls
+        
+        except Exception as e:
+            error_time = time.time() - discovery_start
+            loguru_logger.error(f"[DarkWebEngine] Parallel discovery error after {error_time:.2f}s: {e}", exc_info=True)
+            return []
+    
+    def _unique_urls(self, all_urls: List[str]) -> List[str]:
+        
+        unique_urls = []
+        seen = set()
+        for url in all_urls:
+
+            normalized = url.strip().lower()
+            if normalized not in seen and '.onion' in normalized:
+                seen.add(normalized)
+                unique_urls.append(url)
+        return unique_urls
 
@@ -0,0 +1,244 @@
+"""Concurrent onion search discovery scheduler.
+
+This module fans search work out over (query x engine x page) on a thread
+pool. Each engine has its own concurrency cap and minimum spacing between
+request starts so parallel discovery does not hammer a single search engine.
+Result pages are kept in a process-wide TTL cache keyed by engine, query and
+page, so scheduled re-runs of the same keywords are served from memory.
+
+This module does not use custom DSA concepts from app.core.dsa.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from app.config import settings
+from .onionsearch import fetch_ahmia_page, fetch_tor66_page
+
+
+PageKey = Tuple[str, str, int]
+
+
+class SearchResultCache:
+
+    def __init__(self, ttl: Optional[float] = None, max_entries: Optional[int] = None):
+        self.ttl = settings.ONIONSEARCH_CACHE_TTL if ttl is None else ttl
+        self.max_entries = max_entries or settings.ONIONSEARCH_CACHE_MAX_ENTRIES
+        self._entries: "OrderedDict[PageKey, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(engine: str, query: str, page: int = 1) -> PageKey:
+        return (engine, query.strip().lower(), page)
+
+    def get(self, key: PageKey) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: PageKey, value: Any):
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "ttl": self.ttl
+            }
+
+
+class EngineRateLimiter:
+
+    def __init__(self, concurrency: int, min_interval: float):
+        self.min_interval = min_interval
+        self._semaphore = threading.BoundedSemaphore(max(1, concurrency))
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def __enter__(self):
+        self._semaphore.acquire()
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._semaphore.release()
+
+
+_result_cache: Optional[SearchResultCache] = None
+
+
+def get_search_result_cache() -> SearchResultCache:
+
+    global _result_cache
+    if _result_cache is None:
+        _result_cache = SearchResultCache()
+    return _result_cache
+
+
+class DiscoveryScheduler:
+
+    def __init__(
+        self,
+        proxies: Dict[str, str],
+        timeout: Optional[int] = None,
+        max_retries: int = 2,
+        max_pages: int = 5,
+        max_workers: Optional[int] = None,
+        cache: Optional[SearchResultCache] = None,
+        debug: bool = False
+    ):
+        self.proxies = proxies
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.max_pages = max_pages
+        self.max_workers = max_workers or settings.ONIONSEARCH_MAX_WORKERS
+        self.cache = cache or get_search_result_cache()
+        self.debug = debug
+        self._limiters: Dict[str, EngineRateLimiter] = {}
+
+    def _limiter(self, engine: str) -> EngineRateLimiter:
+        limiter = self._limiters.get(engine)
+        if limiter is None:
+            limiter = EngineRateLimiter(
+                settings.ONIONSEARCH_ENGINE_CONCURRENCY,
+                settings.ONIONSEARCH_ENGINE_MIN_INTERVAL
+            )
+            self._limiters[engine] = limiter
+        return limiter
+
+    def _fetch_page(self, engine: str, query: str, page: int) -> Tuple[List[Dict[str, str]], int]:
+        """Fetch one (engine, query, page) result page, honouring the cache and rate limits.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            engine: Engine name ("ahmia" or "tor66")
+            query: Search query
+            page: 1-based result page
+
+        Returns:
+            Tuple of (result dicts, total page count known for this query)
+        """
+        key = SearchResultCache.make_key(engine, query, page)
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.debug(f"[DiscoveryScheduler] Cache hit for {engine} '{query}' page {page}")
+            return cached
+
+        with self._limiter(engine):
+            if engine == "ahmia":
+                page_result = (
+                    fetch_ahmia_page(query, self.proxies, self.timeout, self.max_retries, self.debug),
+                    1
+                )
+            else:
+                page_result = fetch_tor66_page(
+                    query, page, self.proxies, self.timeout, self.max_retries, self.max_pages, self.debug
+                )
+
+        self.cache.put(key, page_result)
+        return page_result
+
+    def run(
+        self,
+        queries: List[str],
+        engines: List[str],
+        on_query_complete: Optional[Callable[[str, List[Dict[str, str]]], None]] = None
+    ) -> Dict[str, List[Dict[str, str]]]:
+        """Search every query on every engine concurrently, following tor66 pagination.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            queries: Search queries
+            engines: Engine names to use; unknown engines are skipped
+            on_query_complete: Optional callback invoked once all pages for a query are done
+
+        Returns:
+            Dictionary mapping each query to its raw result dicts
+        """
+        run_start = time.time()
+        supported = [e for e in engines if e in ("ahmia", "tor66")]
+        for engine in engines:
+            if engine not in supported:
+                logger.warning(f"[DiscoveryScheduler] Unknown engine: {engine}, skipping")
+
+        results: Dict[str, List[Dict[str, str]]] = {query: [] for query in queries}
+        outstanding: Dict[str, int] = {query: 0 for query in queries}
+        future_to_task: Dict[Future, PageKey] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+
+            def submit(engine: str, query: str, page: int):
+                future = executor.submit(self._fetch_page, engine, query, page)
+                future_to_task[future] = (engine, query, page)
+                outstanding[query] += 1
+
+            for query in queries:
+                for engine in supported:
+                    submit(engine, query, 1)
+
+            pending = set(future_to_task)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    engine, query, page = future_to_task.pop(future)
+                    outstanding[query] -= 1
+                    try:
+                        page_results, page_count = future.result()
+                        results[query].extend(page_results)
+                        logger.debug(
+                            f"[DiscoveryScheduler] {engine} '{query}' page {page}: {len(page_results)} results"
+                        )
+                        if page == 1:
+                            for n in range(2, page_count + 1):
+                                submit(engine, query, n)
+                    except Exception as e:
+                        logger.warning(f"[DiscoveryScheduler] {engine} '{query}' page {page} failed: {e}")
+
+                    if outstanding[query] == 0 and on_query_complete:
+                        try:
+                            on_query_complete(query, results[query])
+                        except Exception as callback_error:
+                            logger.warning(f"[DiscoveryScheduler] Callback error for '{query}': {callback_error}")
+
+                pending |= {f for f in future_to_task if f not in pending}
+
+        logger.info(
+            f"[DiscoveryScheduler] {len(queries)} queries x {len(supported)} engines completed in "
+            f"{time.time() - run_start:.2f}s - cache: {self.cache.get_stats()}"
+        )
+        return results
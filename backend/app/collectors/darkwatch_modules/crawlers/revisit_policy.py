@@ -0,0 +1,199 @@
+"""Adaptive revisit scheduling for crawled onion sites.
+
+Scheduled dark web searches used to recrawl every discovered site on each
+cron tick. This module keeps a change history per URL in the crawler's
+URLDatabase (REVISIT table: content hash, visits, changes, failures, last
+visit) and derives a revisit interval from it. A visit that finds new content
+halves the interval, an unchanged page or an offline site doubles it, bounded
+by a minimum and maximum. Leak sites that change often are therefore revisited
+every run while static and dead sites fade out exponentially.
+
+plan() turns that into a per-run crawl list: sites never crawled before come
+first, then due sites ordered by how often they change and how overdue they
+are, cut off at the run's crawl budget. Everything else is deferred to a
+later run.
+
+This module does not use custom DSA concepts from app.core.dsa.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.config import settings
+from .crawl_frontier import normalize_onion_url
+from .url_database import URLDatabase
+
+
+@dataclass
+class RevisitState:
+    url: str
+    content_hash: Optional[str]
+    visits: int
+    changes: int
+    failures: int
+    last_visit: float
+    last_change: Optional[float]
+    interval: float
+    next_visit: float
+
+    @property
+    def change_rate(self) -> float:
+        # The first visit only establishes a baseline, so it cannot count as a change
+        return self.changes / max(self.visits - 1, 1)
+
+    def as_row(self) -> Tuple:
+        return (
+            self.url, self.content_hash, self.visits, self.changes, self.failures,
+            self.last_visit, self.last_change, self.interval, self.next_visit
+        )
+
+
+class RevisitPolicy:
+
+    def __init__(
+        self,
+        database: Optional[URLDatabase] = None,
+        min_interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        backoff: Optional[float] = None
+    ):
+        self.database = database or URLDatabase(
+            dbpath=str(settings.DATA_DIR / settings.CRAWLER_DB_PATH),
+            dbname=settings.CRAWLER_DB_NAME
+        )
+        self.min_interval = min_interval or settings.DARKWEB_REVISIT_MIN_INTERVAL
+        self.max_interval = max(max_interval or settings.DARKWEB_REVISIT_MAX_INTERVAL, self.min_interval)
+        self.backoff = backoff or settings.DARKWEB_REVISIT_BACKOFF
+        self._lock = threading.Lock()
+        self._states: Dict[str, RevisitState] = {}
+
+    def history(self, urls: Iterable[str]) -> Dict[str, RevisitState]:
+        """Load the change history of urls, keyed by the URL as given.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            urls: Onion URLs (with or without scheme)
+
+        Returns:
+            RevisitState for every URL that has been crawled before
+        """
+        by_key = {normalize_onion_url(url): url for url in urls if url}
+        rows = self.database.revisit_history(list(by_key))
+        states = {}
+        with self._lock:
+            for key, row in rows.items():
+                state = RevisitState(*row)
+                self._states[key] = state
+                states[by_key[key]] = state
+        return states
+
+    def plan(self, urls: List[str], budget: Optional[int] = None, now: Optional[float] = None) -> Tuple[List[str], List[str]]:
+        """Choose which urls to crawl this run.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            urls: Candidate onion URLs, e.g. from discovery engines
+            budget: Max URLs to crawl (None = every due URL)
+            now: Current time (default: time.time())
+
+        Returns:
+            (URLs to crawl, most urgent first; URLs deferred to a later run)
+        """
+        now = time.time() if now is None else now
+        states = self.history(urls)
+
+        unseen = []
+        due = []
+        deferred = []
+        for url in dict.fromkeys(urls):
+            state = states.get(url)
+            if state is None:
+                unseen.append(url)
+            elif state.next_visit <= now:
+                due.append(url)
+            else:
+                deferred.append(url)
+
+        due.sort(key=lambda url: (-states[url].change_rate, states[url].next_visit))
+        ordered = unseen + due
+        if budget is not None and len(ordered) > budget:
+            deferred = ordered[budget:] + deferred
+            ordered = ordered[:budget]
+        return ordered, deferred
+
+    def max_age(self, url: str) -> Optional[float]:
+        """Seconds a stored copy of url may be reused instead of refetching it.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            url: Onion URL
+
+        Returns:
+            The URL's current revisit interval, or None if it has no history
+        """
+        state = self._state(normalize_onion_url(url))
+        return state.interval if state else None
+
+    def _state(self, key: str) -> Optional[RevisitState]:
+        with self._lock:
+            state = self._states.get(key)
+        return state if state is not None else self.history([key]).get(key)
+
+    def record(self, url: str, content_hash: Optional[str], online: bool, now: Optional[float] = None) -> RevisitState:
+        """Record a crawl of url and reschedule it.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            url: Onion URL that was crawled
+            content_hash: Hash of the page text (ignored when offline)
+            online: Whether the crawl returned content
+            now: Crawl time (default: time.time())
+
+        Returns:
+            Updated RevisitState
+        """
+        now = time.time() if now is None else now
+        key = normalize_onion_url(url)
+        state = self._state(key)
+
+        if state is None:
+            state = RevisitState(key, None, 0, 0, 0, now, None, self.min_interval, now)
+            if online:
+                state.content_hash = content_hash
+                state.visits = 1
+            else:
+                state.failures = 1
+                state.interval = min(self.min_interval * self.backoff, self.max_interval)
+        elif not online:
+            state.failures += 1
+            state.interval = min(state.interval * self.backoff, self.max_interval)
+        else:
+            state.visits += 1
+            state.failures = 0
+            if state.content_hash is None:
+                # First successful fetch of a site that was offline until now
+                state.content_hash = content_hash
+            elif content_hash != state.content_hash:
+                state.content_hash = content_hash
+                state.changes += 1
+                state.last_change = now
+                state.interval = max(state.interval / self.backoff, self.min_interval)
+            else:
+                state.interval = min(state.interval * self.backoff, self.max_interval)
+
+        state.last_visit = now
+        state.next_visit = now + state.interval
+        with self._lock:
+            self._states[key] = state
+        self.database.revisit_save(state.as_row())
+        return state
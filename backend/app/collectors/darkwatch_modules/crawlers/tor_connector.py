@@ -7,11 +7,11 @@ import os
 import re
 import json
 import requests
+import threading
 import time
 from random import choice
-from bs4 import BeautifulSoup
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from loguru import logger
 try:
     import yara
@@ -21,6 +21,58 @@ except ImportError:
 
 from app.config import settings
 from .url_database import URLDatabase
+from ..extractors.utils.html_parser import ParsedPage, parse_html
+from ..extractors.utils.bounded_body import read_bounded
+
+
+YARA_RULES_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "data", "yara")
+)
+YARA_CATEGORIES_FILE = os.path.join(YARA_RULES_DIR, "categories.yar")
+YARA_KEYWORDS_FILE = os.path.join(YARA_RULES_DIR, "keywords.yar")
+
+# Process-wide cache of compiled YARA rules: path -> (mtime, rules)
+_compiled_rules: Dict[str, Tuple[float, Any]] = {}
+_compiled_rules_lock = threading.Lock()
+
+
+def get_compiled_rules(yarafile: str) -> Any:
+    """Get compiled YARA rules for a file, compiling only when the file changes.
+
+    DSA-USED:
+    - None: This function does not use custom DSA structures from app.core.dsa.
+
+    Args:
+        yarafile: Path to the .yar rule file
+
+    Returns:
+        Compiled yara.Rules object
+
+    Raises:
+        OSError: If the rule file cannot be read
+        yara.Error: If the rules fail to compile
+    """
+    path = os.path.abspath(yarafile)
+    mtime = os.path.getmtime(path)
+    cached = _compiled_rules.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with _compiled_rules_lock:
+        cached = _compiled_rules.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        compile_start = time.time()
+        rules = yara.compile(filepath=path)
+        _compiled_rules[path] = (mtime, rules)
+        logger.info(f"[TorConnector] Compiled YARA rules {path} in {time.time() - compile_start:.3f}s")
+        return rules
+
+
+def clear_compiled_rules():
+
+    with _compiled_rules_lock:
+        _compiled_rules.clear()
 
 
 class TorConnector:
@@ -55,7 +107,12 @@ class TorConnector:
         db_path = db_path or str(settings.DATA_DIR / settings.CRAWLER_DB_PATH)
         db_name = db_name or settings.CRAWLER_DB_NAME
         logger.info(f"[TorConnector] Connecting to database: {db_path}/{db_name}")
-        self.database = URLDatabase(dbpath=db_path, dbname=db_name)
+        self.database = URLDatabase(
+            dbpath=db_path,
+            dbname=db_name,
+            batch_size=settings.CRAWLER_DB_BATCH_SIZE,
+            flush_interval=settings.CRAWLER_DB_FLUSH_INTERVAL
+        )
         logger.info(f"[TorConnector] Database connection established")
         
         self.urls = urls or []
@@ -89,7 +146,7 @@ class TorConnector:
             return []
         
         try:
-            rules = yara.compile(filepath=yarafile)
+            rules = get_compiled_rules(yarafile)
             matches = rules.match(data=raw.encode())
             return matches
         except Exception as e:
@@ -98,11 +155,7 @@ class TorConnector:
     
     def text(self, response: bytes) -> str:
         
-        soup = BeautifulSoup(response, features="lxml")
-        for s in soup(['script', 'style']):
-            s.decompose()
-        
-        return ' '.join(soup.stripped_strings)
+        return parse_html(response).text
     
     def crawler(self, url: List) -> Dict[str, Any]:
         
@@ -126,119 +179,24 @@ class TorConnector:
                 f"http://{url_str}",
                 proxies=self.proxies,
                 headers=self.headers,
-                timeout=self.timeout
+                timeout=self.timeout,
+                stream=True
             )
+            body = read_bounded(request)
             request_time = time.time() - request_start
-            response_size = len(request.content) if request.content else 0
             logger.info(
                 f"[TorConnector] Request to {url_str} completed in {request_time:.2f}s - "
-                f"Status: {request.status_code}, Response size: {response_size} bytes, "
+                f"Status: {request.status_code}, Response size: {len(body)} bytes"
+                f"{' (truncated)' if body.truncated else ''}, "
                 f"Content-Type: {request.headers.get('Content-Type', 'unknown')}"
             )
+            if body.skipped_content_type:
+                logger.info(f"[TorConnector] Skipped body of {url_str}: non-text content type {body.skipped_content_type}")
             
-            if request.status_code == 200:
-                logger.info(f"[TorConnector] Updating url status {url_str} for 200.")
-                
-                self.database.update_status(
-                    id=url_id,
-                    url=url_str,
-                    result=200,
-                    count_categories=self.count_categories
-                )
-                
-
-                logger.debug(f"[TorConnector] Extracting text content from {url_str}")
-                text_extract_start = time.time()
-                text_content = self.text(response=request.content).lower()
-                text_extract_time = time.time() - text_extract_start
-                logger.info(f"[TorConnector] Extracted {len(text_content)} chars of text in {text_extract_time:.3f}s")
-                
-
-                logger.debug(f"[TorConnector] Checking YARA rules for categories on {url_str}")
-                yara_file_categories = os.path.join(
-                    os.path.dirname(__file__), "..", "..", "..", "..", "data", "yara", "categories.yar"
-                )
-                yara_check_start = time.time()
-                full_match_yara = self.check_yara(raw=text_content, yarafile=yara_file_categories)
-                yara_check_time = time.time() - yara_check_start
-                logger.info(f"[TorConnector] YARA category check completed in {yara_check_time:.3f}s, matches={len(full_match_yara)}")
-                
-                if len(full_match_yara) == 0:
-                    full_match_yara_str = "no_match"
-                    categorie = "no_match"
-                    score_categorie = 0
-                else:
-                    full_match_yara_str = str(full_match_yara)
-                    categorie = str(full_match_yara[0])
-                    score_categorie = sum(int(match.meta.get('score', 0)) for match in full_match_yara)
-                
-
-                logger.debug(f"[TorConnector] Checking YARA rules for keywords on {url_str}")
-                yara_file_keywords = os.path.join(
-                    os.path.dirname(__file__), "..", "..", "..", "..", "data", "yara", "keywords.yar"
-                )
-                yara_keywords_start = time.time()
-                full_match_keywords = self.check_yara(raw=text_content, yarafile=yara_file_keywords)
-                yara_keywords_time = time.time() - yara_keywords_start
-                logger.info(f"[TorConnector] YARA keyword check completed in {yara_keywords_time:.3f}s, matches={len(full_match_keywords)}, score={score_keywords if len(full_match_keywords) > 0 else 0}")
-                
-                if len(full_match_keywords) == 0:
-                    full_match_keywords_str = "no_match"
-                    score_keywords = 0
-                else:
-                    full_match_keywords_str = str(full_match_keywords)
-                    score_keywords = sum(int(match.meta.get('score', 0)) for match in full_match_keywords)
-                
-
-                logger.debug(f"[TorConnector] Extracting title from {url_str}")
-                soup = BeautifulSoup(request.content, features="lxml")
-                try:
-                    title = soup.find('title').get_text() \
-                        .replace(r'\s', '') \
-                        .replace('\t', '') \
-                        .replace('\n', '') \
-                        .replace("'", "") \
-                        .replace("  ", "") \
-                        .replace("   ", "")
-                    logger.info(f"[TorConnector] Extracted title: {title[:50]}..." if title and len(title) > 50 else f"[TorConnector] Extracted title: {title}")
-                except:
-                    title = None
-                    logger.warning(f"[TorConnector] Could not extract title from {url_str}")
-                
-
-                logger.debug(f"[TorConnector] Updating database for {url_str}")
-                self.database.update_categorie(
-                    id=url_id,
-                    categorie=categorie,
-                    full_match_categorie=full_match_yara_str,
-                    title=title,
-                    score_categorie=score_categorie,
-                    score_keywords=score_keywords,
-                    full_match_keywords=full_match_keywords_str
-                )
-                
-                total_crawl_time = time.time() - crawl_start
-                logger.info(f"[TorConnector] Crawl completed for {url_str} in {total_crawl_time:.2f}s - Category: {categorie}, Score: {score_keywords}")
-                
-                return {
-                    "status": "online",
-                    "title": title,
-                    "content": text_content,
-                    "category": categorie,
-                    "score_categorie": score_categorie,
-                    "score_keywords": score_keywords,
-                    "keywords_matched": full_match_keywords_str
-                }
-            else:
-                logger.warning(f"[TorConnector] URL {url_str} returned status {request.status_code}")
-                self.database.update_status(
-                    id=url_id,
-                    url=url_str,
-                    result=404,
-                    count_categories=self.count_categories
-                )
-                return {"status": "offline", "status_code": request.status_code}
-                
+            result = self.process_response(url, request.status_code, body.content)
+            result["truncated"] = body.truncated
+            return result
+        
         except (requests.exceptions.ConnectionError,
                 requests.exceptions.ChunkedEncodingError,
                 requests.exceptions.ReadTimeout,
@@ -259,81 +217,189 @@ class TorConnector:
             )
             return {"status": "error", "error": str(e)}
     
+    def process_response(self, url: List, status_code: int, content: bytes) -> Dict[str, Any]:
+        
+        url_str = url[2]
+        url_id = url[0]
+        crawl_start = time.time()
+        
+        if status_code == 200:
+            logger.info(f"[TorConnector] Updating url status {url_str} for 200.")
+            
+            self.database.update_status(
+                id=url_id,
+                url=url_str,
+                result=200,
+                count_categories=self.count_categories
+            )
+            
+
+            logger.debug(f"[TorConnector] Parsing {url_str}")
+            text_extract_start = time.time()
+            page = parse_html(content)
+            text_content = page.text.lower()
+            text_extract_time = time.time() - text_extract_start
+            logger.info(f"[TorConnector] Extracted {len(text_content)} chars of text in {text_extract_time:.3f}s")
+            
+
+            logger.debug(f"[TorConnector] Checking YARA rules for categories on {url_str}")
+            yara_file_categories = YARA_CATEGORIES_FILE
+            yara_check_start = time.time()
+            full_match_yara = self.check_yara(raw=text_content, yarafile=yara_file_categories)
+            yara_check_time = time.time() - yara_check_start
+            logger.info(f"[TorConnector] YARA category check completed in {yara_check_time:.3f}s, matches={len(full_match_yara)}")
+            
+            if len(full_match_yara) == 0:
+                full_match_yara_str = "no_match"
+                categorie = "no_match"
+                score_categorie = 0
+            else:
+                full_match_yara_str = str(full_match_yara)
+                categorie = str(full_match_yara[0])
+                score_categorie = sum(int(match.meta.get('score', 0)) for match in full_match_yara)
+            
+
+            logger.debug(f"[TorConnector] Checking YARA rules for keywords on {url_str}")
+            yara_file_keywords = YARA_KEYWORDS_FILE
+            yara_keywords_start = time.time()
+            full_match_keywords = self.check_yara(raw=text_content, yarafile=yara_file_keywords)
+            yara_keywords_time = time.time() - yara_keywords_start
+            logger.info(f"[TorConnector] YARA keyword check completed in {yara_keywords_time:.3f}s, matches={len(full_match_keywords)}, score={score_keywords if len(full_match_keywords) > 0 else 0}")
+            
+            if len(full_match_keywords) == 0:
+                full_match_keywords_str = "no_match"
+                score_keywords = 0
+            else:
+                full_match_keywords_str = str(full_match_keywords)
+                score_keywords = sum(int(match.meta.get('score', 0)) for match in full_match_keywords)
+            
+
+            logger.debug(f"[TorConnector] Extracting title from {url_str}")
+            try:
+                title = page.title \
+                    .replace(r'\s', '') \
+                    .replace('\t', '') \
+                    .replace('\n', '') \
+                    .replace("'", "") \
+                    .replace("  ", "") \
+                    .replace("   ", "")
+                logger.info(f"[TorConnector] Extracted title: {title[:50]}..." if title and len(title) > 50 else f"[TorConnector] Extracted title: {title}")
+            except:
+                title = None
+                logger.warning(f"[TorConnector] Could not extract title from {url_str}")
+            
+
+            logger.debug(f"[TorConnector] Updating database for {url_str}")
+            self.database.update_categorie(
+                id=url_id,
+                categorie=categorie,
+                full_match_categorie=full_match_yara_str,
+                title=title,
+                score_categorie=score_categorie,
+                score_keywords=score_keywords,
+                full_match_keywords=full_match_keywords_str
+            )
+            
+            total_crawl_time = time.time() - crawl_start
+            logger.info(f"[TorConnector] Crawl completed for {url_str} in {total_crawl_time:.2f}s - Category: {categorie}, Score: {score_keywords}")
+            
+            return {
+                "status": "online",
+                "title": title,
+                "content": text_content,
+                "category": categorie,
+                "score_categorie": score_categorie,
+                "score_keywords": score_keywords,
+                "keywords_matched": full_match_keywords_str,
+                "links": self.links_from_page(url_str, page)
+            }
+        else:
+            logger.warning(f"[TorConnector] URL {url_str} returned status {status_code}")
+            self.database.update_status(
+                id=url_id,
+                url=url_str,
+                result=404,
+                count_categories=self.count_categories
+            )
+            return {"status": "offline", "status_code": status_code}
+    
     def more_urls(self, url: str) -> Optional[List[str]]:
         
-        self.logger.info(f"Searching for new urls in: {url}")
+        logger.info(f"[TorConnector] Searching for new urls in: {url}")
         try:
             request = self.session.get(
                 f"http://{url}",
                 proxies=self.proxies,
                 headers=self.headers,
-                timeout=self.timeout
+                timeout=self.timeout,
+                stream=True
             )
+            body = read_bounded(request)
             
             if request.status_code == 200:
-                pages = []
-                soup = BeautifulSoup(request.content, features="lxml")
-                try:
-                    for raw in soup.find('body').findAll():
-                        mosturl = str(raw.get('href'))
-                        if raw.get('href') is not None:
-                            if '/' in mosturl \
-                                    and '/' != mosturl \
-                                    and 'http://' not in mosturl \
-                                    and 'https://' not in mosturl \
-                                    and '://' not in mosturl \
-                                    and 'www' not in mosturl \
-                                    and ' ' not in mosturl \
-                                    and "'" not in mosturl \
-                                    and '(' not in mosturl \
-                                    and '.m3u' not in mosturl \
-                                    and '.zip' not in mosturl \
-                                    and '.exe' not in mosturl \
-                                    and '.onion' not in mosturl:
-                                
-                                pages.append(f"{url}{mosturl}")
-                                self.logger.debug(f'Found URL: {url}{mosturl}')
-                            
-                            elif '/' not in mosturl \
-                                    and '.m3u' not in mosturl \
-                                    and '.zip' not in mosturl \
-                                    and '.exe' not in mosturl \
-                                    and url not in mosturl \
-                                    and ('.php' in mosturl or '.htm' in mosturl) \
-                                    and '.onion' not in mosturl:
-                                pages.append(f"{url}/{mosturl}")
-                                self.logger.debug(f'Found URL: {url}/{mosturl}')
-                            
-                            elif url in mosturl \
-                                    and ('http://' in mosturl or 'https://' in mosturl) \
-                                    and ('.php' in mosturl or '.htm' in mosturl):
-                                pages.append(f"{mosturl}".replace('http://', '').replace('https://', ''))
-                                self.logger.debug(f'Found URL: {mosturl}')
-                            
-                            elif '.onion' in mosturl \
-                                    and '.m3u' not in mosturl \
-                                    and '.zip' not in mosturl \
-                                    and '.exe' not in mosturl \
-                                    and 'http://' in mosturl \
-                                    and url not in mosturl:
-                                pages.append(f"{mosturl}".replace('http://', '').replace('https://', ''))
-                                self.logger.debug(f'Found onion URL: {mosturl}')
-                    
-                    return pages
-                    
-                except AttributeError as e:
-                    self.logger.error(f"No text found on page: {e}")
-                    return []
-                    
+                return self.extract_more_urls(url, body.content)
+        
         except (requests.exceptions.ConnectionError,
                 requests.exceptions.ChunkedEncodingError,
                 requests.exceptions.ReadTimeout,
                 requests.exceptions.InvalidURL) as e:
-            self.logger.debug(f"Error occurred: {str(e)}")
+            logger.debug(f"[TorConnector] Error occurred: {str(e)}")
             return []
         
         return []
     
+    def extract_more_urls(self, url: str, content: bytes) -> List[str]:
+        
+        return self.links_from_page(url, parse_html(content))
+    
+    def links_from_page(self, url: str, page: ParsedPage) -> List[str]:
+        
+        pages = []
+        for mosturl in page.body_hrefs:
+            if '/' in mosturl \
+                    and '/' != mosturl \
+                    and 'http://' not in mosturl \
+                    and 'https://' not in mosturl \
+                    and '://' not in mosturl \
+                    and 'www' not in mosturl \
+                    and ' ' not in mosturl \
+                    and "'" not in mosturl \
+                    and '(' not in mosturl \
+                    and '.m3u' not in mosturl \
+                    and '.zip' not in mosturl \
+                    and '.exe' not in mosturl \
+                    and '.onion' not in mosturl:
+                
+                pages.append(f"{url}{mosturl}")
+                logger.debug(f'Found URL: {url}{mosturl}')
+            
+            elif '/' not in mosturl \
+                    and '.m3u' not in mosturl \
+                    and '.zip' not in mosturl \
+                    and '.exe' not in mosturl \
+                    and url not in mosturl \
+                    and ('.php' in mosturl or '.htm' in mosturl) \
+                    and '.onion' not in mosturl:
+                pages.append(f"{url}/{mosturl}")
+                logger.debug(f'Found URL: {url}/{mosturl}')
+            
+            elif url in mosturl \
+                    and ('http://' in mosturl or 'https://' in mosturl) \
+                    and ('.php' in mosturl or '.htm' in mosturl):
+                pages.append(f"{mosturl}".replace('http://', '').replace('https://', ''))
+                logger.debug(f'Found URL: {mosturl}')
+            
+            elif '.onion' in mosturl \
+                    and '.m3u' not in mosturl \
+                    and '.zip' not in mosturl \
+                    and '.exe' not in mosturl \
+                    and 'http://' in mosturl \
+                    and url not in mosturl:
+                pages.append(f"{mosturl}".replace('http://', '').replace('https://', ''))
+                logger.debug(f'Found onion URL: {mosturl}')
+        
+        return pages
+    
     def crawl_url(self, url_str: str) -> Dict[str, Any]:
         
 
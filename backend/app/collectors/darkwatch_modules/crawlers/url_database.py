@@ -5,36 +5,202 @@ import sqlite3
 import os
 import logging
 import datetime
+import threading
 import time
-from typing import List, Optional, Tuple
+import atexit
+import weakref
+from typing import Dict, List, Optional, Set, Tuple
 
 
-class URLDatabase:
+_SELECT_URL_SQL = "SELECT * FROM URL WHERE url=?;"
+_INSERT_URL_SQL = "INSERT INTO URL (type,url,source,baseurl,discovery_date) VALUES (?,?,?,?,?);"
+_UPDATE_STATUS_ONLINE_SQL = """
+    UPDATE URL
+    SET status = 'Online',
+    count_status = 0,
+    lastscan = ?
+    WHERE id = ?
+"""
+# Failure bookkeeping is computed in SQL so queued updates never need a read first
+_UPDATE_STATUS_FAILED_SQL = """
+    UPDATE URL
+    SET status = CASE WHEN COALESCE(count_status, 0) <= ? THEN 'Unknown' ELSE 'Offline' END,
+    count_status = COALESCE(count_status, 0) + 1,
+    lastscan = ?
+    WHERE id = ?
+"""
+_UPDATE_CATEGORIE_SQL = """
+    UPDATE URL
+    SET categorie = ?,
+    title = ?,
+    full_match_categorie = ?,
+    score_categorie = ?,
+    keywords = ?,
+    score_keywords = ?
+    WHERE id = ?
+"""
+
+# Persistent crawl frontier; one row per (frontier, url), higher priority first
+_CREATE_FRONTIER_SQL = """
+    CREATE TABLE IF NOT EXISTS "FRONTIER" (
+        "frontier"	TEXT NOT NULL,
+        "url"	TEXT NOT NULL,
+        "host"	TEXT,
+        "depth"	INTEGER,
+        "priority"	REAL,
+        "state"	TEXT,
+        "attempts"	INTEGER DEFAULT 0,
+        "parent"	TEXT,
+        "claimed_by"	TEXT,
+        "claimed_at"	REAL,
+        "discovered_at"	REAL,
+        PRIMARY KEY ("frontier", "url")
+    );
+"""
+_INSERT_FRONTIER_SQL = """
+    INSERT OR IGNORE INTO FRONTIER (frontier,url,host,depth,priority,state,parent,discovered_at)
+    VALUES (?,?,?,?,?,'pending',?,?);
+"""
+# Hosts with an outstanding claim are skipped so each host is fetched by one worker at a time
+_SELECT_FRONTIER_CANDIDATES_SQL = """
+    SELECT url, host, depth, priority, attempts FROM FRONTIER
+    WHERE frontier = ? AND state = 'pending'
+    AND host NOT IN (SELECT host FROM FRONTIER WHERE frontier = ? AND state = 'claimed')
+    ORDER BY priority DESC, discovered_at
+    LIMIT ?;
+"""
+_CLAIM_FRONTIER_SQL = """
+    UPDATE FRONTIER SET state = 'claimed', claimed_by = ?, claimed_at = ?
+    WHERE frontier = ? AND url = ? AND state = 'pending';
+"""
+_FINISH_FRONTIER_SQL = """
+    UPDATE FRONTIER SET state = ?, attempts = attempts + ?, priority = ?, claimed_by = NULL, claimed_at = NULL
+    WHERE frontier = ? AND url = ?;
+"""
+_RELEASE_STALE_FRONTIER_SQL = """
+    UPDATE FRONTIER SET state = 'pending', claimed_by = NULL, claimed_at = NULL
+    WHERE frontier = ? AND state = 'claimed' AND claimed_at < ?;
+"""
+_COUNT_FRONTIER_SQL = "SELECT state, COUNT(*) FROM FRONTIER WHERE frontier = ? GROUP BY state;"
+
+# Per-URL change history driving revisit scheduling; one row per crawled URL
+_CREATE_REVISIT_SQL = """
+    CREATE TABLE IF NOT EXISTS "REVISIT" (
+        "url"	TEXT PRIMARY KEY,
+        "content_hash"	TEXT,
+        "visits"	INTEGER DEFAULT 0,
+        "changes"	INTEGER DEFAULT 0,
+        "failures"	INTEGER DEFAULT 0,
+        "last_visit"	REAL,
+        "last_change"	REAL,
+        "interval"	REAL,
+        "next_visit"	REAL
+    );
+"""
+_SELECT_REVISIT_SQL = """
+    SELECT url, content_hash, visits, changes, failures, last_visit, last_change, interval, next_visit
+    FROM REVISIT WHERE url IN ({placeholders});
+"""
+_UPSERT_REVISIT_SQL = """
+    INSERT INTO REVISIT (url,content_hash,visits,changes,failures,last_visit,last_change,interval,next_visit)
+    VALUES (?,?,?,?,?,?,?,?,?)
+    ON CONFLICT(url) DO UPDATE SET
+    content_hash = excluded.content_hash,
+    visits = excluded.visits,
+    changes = excluded.changes,
+    failures = excluded.failures,
+    last_visit = excluded.last_visit,
+    last_change = excluded.last_change,
+    interval = excluded.interval,
+    next_visit = excluded.next_visit;
+"""
+
+
+class _WriteQueue:
+    """Pending status/category updates for one database file, shared by all instances."""
     
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.items: List[Tuple[str, Tuple]] = []
+        self.ids: Set[int] = set()
+        self.first_queued = 0.0
+        self.timer: Optional[threading.Timer] = None
+
+
+_write_queues: Dict[str, _WriteQueue] = {}
+_initialized_files: Set[str] = set()
+_registry_lock = threading.Lock()
+_open_databases: "weakref.WeakSet[URLDatabase]" = weakref.WeakSet()
+
+
+def _flush_all():
+    for database in list(_open_databases):
+        try:
+            database.flush()
+        except Exception:
+            logging.getLogger(__name__).exception("Failed to flush URL database on exit.")
+
+
+atexit.register(_flush_all)
+
+
+class URLDatabase:
     
-    def __init__(self, dbpath: str, dbname: str):
+
+    def __init__(
+        self,
+        dbpath: str,
+        dbname: str,
+        batch_size: int = 1,
+        flush_interval: float = 2.0
+    ):
         
         self.logger = logging.getLogger(__name__)
         self.logger.debug("Checking Database.")
         self.dbpath = dbpath
         self.dbname = dbname
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
         
 
         os.makedirs(self.dbpath, exist_ok=True)
         
-        db_file = os.path.join(self.dbpath, self.dbname)
+        self.db_file = os.path.abspath(os.path.join(self.dbpath, self.dbname))
+        self._local = threading.local()
         
-        if not os.path.exists(db_file):
-            self._create_database(db_file)
-        else:
-
-            self._create_database(db_file)
+        with _registry_lock:
+            if self.db_file not in _initialized_files:
+                self._create_database(self.db_file)
+                _initialized_files.add(self.db_file)
+            self._queue = _write_queues.setdefault(self.db_file, _WriteQueue())
+            _open_databases.add(self)
+    
+    def _connection(self) -> sqlite3.Connection:
+        
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_file, timeout=30, cached_statements=64)
+            conn.execute("PRAGMA journal_mode=WAL;")
+            conn.execute("PRAGMA synchronous=NORMAL;")
+            self._local.conn = conn
+        return conn
+    
+    def close(self):
+        
+        self.flush()
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+        with _registry_lock:
+            _open_databases.discard(self)
     
     def _create_database(self, db_file: str):
         
         conn = sqlite3.connect(db_file)
         cursor = conn.cursor()
         
+        cursor.execute("PRAGMA journal_mode=WAL;")
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS "URL" (
                 "id"	INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT UNIQUE,
@@ -54,17 +220,78 @@ class URLDatabase:
                 "full_match_categorie"	TEXT
             );
         """)
+        # Every lookup and dedup check filters on url; without this each one is a full scan
+        cursor.execute('CREATE INDEX IF NOT EXISTS "idx_url_url" ON "URL" ("url");')
+        cursor.execute('CREATE INDEX IF NOT EXISTS "idx_url_status" ON "URL" ("status");')
+        cursor.execute(_CREATE_FRONTIER_SQL)
+        cursor.execute(
+            'CREATE INDEX IF NOT EXISTS "idx_frontier_pending" ON "FRONTIER" ("frontier", "state", "priority" DESC);'
+        )
+        cursor.execute(_CREATE_REVISIT_SQL)
         conn.commit()
         conn.close()
     
+    def _enqueue(self, sql: str, params: Tuple, id: int):
+        
+        queue = self._queue
+        with queue.lock:
+            if not queue.items:
+                queue.first_queued = time.monotonic()
+            queue.items.append((sql, params))
+            queue.ids.add(id)
+            should_flush = (
+                len(queue.items) >= self.batch_size
+                or time.monotonic() - queue.first_queued >= self.flush_interval
+            )
+            if not should_flush and queue.timer is None:
+                # Flush a quiet queue on time even if nothing else is ever enqueued
+                queue.timer = threading.Timer(self.flush_interval, self._timed_flush)
+                queue.timer.daemon = True
+                queue.timer.start()
+        if should_flush:
+            self.flush()
+    
+    def _timed_flush(self):
+        
+        try:
+            self.flush()
+        except Exception:
+            self.logger.exception("Timed flush of queued URL updates failed.")
+    
+    def _has_pending(self, ids: List[int]) -> bool:
+        
+        queue = self._queue
+        with queue.lock:
+            return any(id in queue.ids for id in ids)
+    
+    def flush(self) -> int:
+        
+        queue = self._queue
+        with queue.lock:
+            if queue.timer is not None:
+                queue.timer.cancel()
+                queue.timer = None
+            if not queue.items:
+                return 0
+            items = queue.items
+            queue.items = []
+            queue.ids = set()
+            
+            conn = self._connection()
+            with conn:
+                for sql, params in items:
+                    conn.execute(sql, params)
+        
+        self.logger.debug(f"Flushed {len(items)} queued URL updates.")
+        return len(items)
+    
+    def pending_count(self) -> int:
+        
+        return len(self._queue.items)
+    
     def compare(self, url: str) -> List[Tuple]:
         
-        conn = sqlite3.connect(os.path.join(self.dbpath, self.dbname))
-        cursor = conn.cursor()
-        r = cursor.execute("SELECT * FROM URL WHERE url=?;", (url,))
-        results = r.fetchall()
-        conn.close()
-        return results
+        return self.select_url(url=url)
     
     def save(
         self,
@@ -74,15 +301,10 @@ class URLDatabase:
         baseurl: Optional[str] = None
     ):
         
-        conn = sqlite3.connect(os.path.join(self.dbpath, self.dbname))
-        cursor = conn.cursor()
+        conn = self._connection()
         date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
-        cursor.execute(
-            "INSERT INTO URL (type,url,source,baseurl,discovery_date) VALUES (?,?,?,?,?);",
-            (type, url, source, baseurl, date)
-        )
-        conn.commit()
-        conn.close()
+        with conn:
+            conn.execute(_INSERT_URL_SQL, (type, url, source, baseurl, date))
     
     def batch_save(
         self,
@@ -95,14 +317,14 @@ class URLDatabase:
         if not urls:
             return 0
         
-        conn = sqlite3.connect(os.path.join(self.dbpath, self.dbname))
+        conn = self._connection()
         cursor = conn.cursor()
         date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
         
 
         existing_urls = set()
         if urls:
-
+            
             placeholders = ','.join(['?' for _ in urls])
             cursor.execute(f"SELECT url FROM URL WHERE url IN ({placeholders});", urls)
             existing_urls = {row[0] for row in cursor.fetchall()}
@@ -111,7 +333,6 @@ class URLDatabase:
         new_urls = [url for url in urls if url not in existing_urls]
         
         if not new_urls:
-            conn.close()
             return 0
         
 
@@ -121,12 +342,8 @@ class URLDatabase:
         ]
         
 
-        cursor.executemany(
-            "INSERT INTO URL (type,url,source,baseurl,discovery_date) VALUES (?,?,?,?,?);",
-            insert_data
-        )
-        conn.commit()
-        conn.close()
+        with conn:
+            conn.executemany(_INSERT_URL_SQL, insert_data)
         
         return len(new_urls)
     
@@ -136,8 +353,8 @@ class URLDatabase:
         score_keywords: Optional[int] = None
     ) -> List[Tuple]:
         
-        conn = sqlite3.connect(os.path.join(self.dbpath, self.dbname))
-        cursor = conn.cursor()
+        self.flush()
+        conn = self._connection()
         
 
         query = "SELECT * FROM URL WHERE (status IS NULL OR status != 'Offline')"
@@ -151,19 +368,16 @@ class URLDatabase:
             query += " AND (score_keywords >= ? OR score_keywords IS NULL)"
             params.append(score_keywords)
         
-        r = cursor.execute(query, params)
-        results = r.fetchall()
-        conn.close()
-        return results
+        return conn.execute(query, params).fetchall()
     
     def select_url(self, url: str) -> List[Tuple]:
         
-        conn = sqlite3.connect(os.path.join(self.dbpath, self.dbname))
-        cursor = conn.cursor()
-        r = cursor.execute("SELECT * FROM URL WHERE url=?;", (url,))
-        results = r.fetchall()
-        conn.close()
-        return results
+        # Only flush when a queued update targets this URL's row, so lookups don't defeat batching
+        rows = self._connection().execute(_SELECT_URL_SQL, (url,)).fetchall()
+        if rows and self._has_pending([row[0] for row in rows]):
+            self.flush()
+            rows = self._connection().execute(_SELECT_URL_SQL, (url,)).fetchall()
+        return rows
     
     def update_status(
         self,
@@ -173,38 +387,11 @@ class URLDatabase:
         count_categories: int
     ):
         
+        date = datetime.datetime.now().strftime("%Y-%m-%d")
         if result == 404:
-            existing = self.select_url(url=url)
-            if existing and len(existing) > 0:
-                current_count = existing[0][6] if existing[0][6] is not None else 0
-                if current_count <= count_categories:
-                    count_status = current_count + 1
-                    status = "Unknown"
-                else:
-                    status = "Offline"
-                    count_status = current_count + 1
-            else:
-                count_status = 1
-                status = "Unknown"
+            self._enqueue(_UPDATE_STATUS_FAILED_SQL, (count_categories, date, id), id)
         else:
-            status = "Online"
-            count_status = 0
-        
-        date = datetime.datetime.now().strftime("%Y-%m-%d")
-        conn = sqlite3.connect(os.path.join(self.dbpath, self.dbname))
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            UPDATE URL
-            SET status = ?, 
-            count_status = ?, 
-            lastscan = ?
-            WHERE id = ?
-            """,
-            (status, count_status, date, id)
-        )
-        conn.commit()
-        conn.close()
+            self._enqueue(_UPDATE_STATUS_ONLINE_SQL, (date, id), id)
     
     def update_categorie(
         self,
@@ -217,27 +404,89 @@ class URLDatabase:
         full_match_keywords: str
     ):
         
-        conn = sqlite3.connect(os.path.join(self.dbpath, self.dbname))
-        cursor = conn.cursor()
-        
         if title is not None and len(title) > 0:
             title = title
         else:
             title = 'Untitled'
         
-        cursor.execute(
-            """
-            UPDATE URL
-            SET categorie = ?, 
-            title = ?, 
-            full_match_categorie = ?, 
-            score_categorie = ?, 
-            keywords = ?, 
-            score_keywords = ?
-            WHERE id = ?
-            """,
+        self._enqueue(
+            _UPDATE_CATEGORIE_SQL,
             (categorie, title, full_match_categorie, score_categorie,
-             full_match_keywords, score_keywords, id)
+             full_match_keywords, score_keywords, id),
+            id
         )
-        conn.commit()
-        conn.close()
+    
+    def frontier_add(
+        self,
+        frontier: str,
+        entries: List[Tuple[str, str, int, float, Optional[str]]]
+    ) -> int:
+        
+        if not entries:
+            return 0
+        
+        now = time.time()
+        conn = self._connection()
+        before = conn.total_changes
+        with conn:
+            conn.executemany(
+                _INSERT_FRONTIER_SQL,
+                [(frontier, url, host, depth, priority, parent, now)
+                 for url, host, depth, priority, parent in entries]
+            )
+        return conn.total_changes - before
+    
+    def frontier_candidates(self, frontier: str, limit: int) -> List[Tuple]:
+        
+        return self._connection().execute(
+            _SELECT_FRONTIER_CANDIDATES_SQL, (frontier, frontier, limit)
+        ).fetchall()
+    
+    def frontier_claim(self, frontier: str, url: str, worker: str) -> bool:
+        
+        conn = self._connection()
+        with conn:
+            cursor = conn.execute(_CLAIM_FRONTIER_SQL, (worker, time.time(), frontier, url))
+        return cursor.rowcount == 1
+    
+    def frontier_finish(
+        self,
+        frontier: str,
+        url: str,
+        state: str,
+        priority: float,
+        failed: bool = False
+    ):
+        
+        conn = self._connection()
+        with conn:
+            conn.execute(_FINISH_FRONTIER_SQL, (state, 1 if failed else 0, priority, frontier, url))
+    
+    def frontier_release_stale(self, frontier: str, older_than: float) -> int:
+        
+        conn = self._connection()
+        with conn:
+            cursor = conn.execute(_RELEASE_STALE_FRONTIER_SQL, (frontier, older_than))
+        return cursor.rowcount
+    
+    def frontier_counts(self, frontier: str) -> Dict[str, int]:
+        
+        return dict(self._connection().execute(_COUNT_FRONTIER_SQL, (frontier,)).fetchall())
+    
+    def revisit_history(self, urls: List[str]) -> Dict[str, Tuple]:
+        
+        history = {}
+        conn = self._connection()
+        # Stay well under SQLite's bound-parameter limit
+        for start in range(0, len(urls), 500):
+            chunk = urls[start:start + 500]
+            sql = _SELECT_REVISIT_SQL.format(placeholders=",".join("?" for _ in chunk))
+            for row in conn.execute(sql, chunk):
+                history[row[0]] = row
+        return history
+    
+    def revisit_save(self, row: Tuple):
+        
+        conn = self._connection()
+        with conn:
+            conn.execute(_UPSERT_REVISIT_SQL, row)
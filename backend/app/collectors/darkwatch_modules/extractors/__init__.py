@@ -1,3 +1,17 @@
-from .site_crawler import crawl_onion_site, extract_entities
+from .entity_engine import EntityExtractionEngine, EntityMatch, ENTITY_PATTERNS, get_entity_engine
+from .site_crawler import crawl_onion_site, analyze_onion_page, new_crawl_result, extract_entities
+from .page_analyzer import PageAnalysisPool, analyze_page, get_page_analysis_pool
 
-__all__ = ['crawl_onion_site', 'extract_entities']
+__all__ = [
+    'EntityExtractionEngine',
+    'EntityMatch',
+    'ENTITY_PATTERNS',
+    'get_entity_engine',
+    'crawl_onion_site',
+    'analyze_onion_page',
+    'new_crawl_result',
+    'extract_entities',
+    'PageAnalysisPool',
+    'analyze_page',
+    'get_page_analysis_pool'
+]
@@ -0,0 +1,148 @@
+"""Single-pass entity extraction engine.
+
+This module provides the compiled entity extractor shared by DarkWatch and
+the darkwatch extractors. Instead of running every pattern over the whole
+page, the text is split once into candidate tokens (runs of characters that
+can appear in an entity). Tokens are deduplicated, purely alphabetic tokens
+are dropped because no entity pattern can match them, and the targeted
+patterns run only over the small remaining candidate set. Patterns that
+span whitespace (such as the PGP block header) are matched against the full
+text. Results are deduplicated per page.
+
+This module does not use custom DSA concepts from app.core.dsa.
+"""
+
+import re
+import threading
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+
+ENTITY_PATTERNS: Dict[str, str] = {
+    "email": r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
+    "bitcoin": r'\b[13][a-km-zA-HJ-NP-Z1-9]{25,34}\b',
+    "bitcoin_bech32": r'\bbc1[a-zA-HJ-NP-Z0-9]{39,59}\b',
+    "monero": r'\b4[0-9AB][1-9A-HJ-NP-Za-km-z]{93}\b',
+    "ethereum": r'\b0x[a-fA-F0-9]{40}\b',
+    "onion_v2": r'\b[a-z2-7]{16}\.onion\b',
+    "onion_v3": r'\b[a-z2-7]{56}\.onion\b',
+    "ssh_fingerprint": r'\b(?:SHA256|MD5):[A-Za-z0-9+/=:]{32,64}\b',
+    "pgp_key": r'-----BEGIN PGP PUBLIC KEY BLOCK-----',
+    "phone": r'\b\+?[1-9]\d{1,14}\b',
+    "ip_address": r'\b(?:\d{1,3}\.){3}\d{1,3}\b',
+    "credit_card": r'\b(?:4[0-9]{12}(?:[0-9]{3})?|5[1-5][0-9]{14}|3[47][0-9]{13})\b',
+}
+
+# Every character a token-level pattern can match; anything else separates tokens
+TOKEN_CHARS = r'\w.%+\-:/=@|'
+_WHITESPACE_PATTERN = re.compile(r'(?<!\\)(?: |\\s)')
+
+
+class EntityMatch(NamedTuple):
+    entity_type: str
+    value: str
+    start: int
+
+
+class EntityExtractionEngine:
+
+    def __init__(
+        self,
+        patterns: Optional[Dict[str, str]] = None,
+        validators: Optional[Dict[str, Callable[[str], bool]]] = None,
+        flags: int = re.IGNORECASE
+    ):
+        self.patterns = dict(patterns or ENTITY_PATTERNS)
+        self.validators = dict(validators or {})
+        self._token_re = re.compile(f'[{TOKEN_CHARS}]+')
+        self._token_patterns: Dict[str, re.Pattern] = {}
+        self._text_patterns: Dict[str, re.Pattern] = {}
+        for entity_type, pattern in self.patterns.items():
+            compiled = re.compile(pattern, flags)
+            if _WHITESPACE_PATTERN.search(pattern):
+                self._text_patterns[entity_type] = compiled
+            else:
+                self._token_patterns[entity_type] = compiled
+
+    def _candidates(self, text: str) -> str:
+        tokens = dict.fromkeys(self._token_re.findall(text))
+        return "\n".join([token for token in tokens if not token.isalpha()])
+
+    def extract(self, text: str, types: Optional[Iterable[str]] = None) -> List[EntityMatch]:
+        """Extract unique entities from text in a single tokenization pass.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            text: Page text to scan
+            types: Entity types to extract (default: all configured types)
+
+        Returns:
+            List of EntityMatch, one per distinct (type, value), with the offset of
+            the value's first occurrence in the text
+        """
+        if not text:
+            return []
+        wanted = set(types) if types is not None else None
+
+        matches: List[EntityMatch] = []
+        token_patterns = [
+            (entity_type, pattern) for entity_type, pattern in self._token_patterns.items()
+            if wanted is None or entity_type in wanted
+        ]
+        if token_patterns:
+            candidates = self._candidates(text)
+            if candidates:
+                for entity_type, pattern in token_patterns:
+                    validator = self.validators.get(entity_type)
+                    for value in dict.fromkeys(pattern.findall(candidates)):
+                        if validator is None or validator(value):
+                            matches.append(EntityMatch(entity_type, value, text.find(value)))
+
+        for entity_type, pattern in self._text_patterns.items():
+            if wanted is not None and entity_type not in wanted:
+                continue
+            validator = self.validators.get(entity_type)
+            seen = set()
+            for match in pattern.finditer(text):
+                value = match.group()
+                if value in seen or (validator is not None and not validator(value)):
+                    continue
+                seen.add(value)
+                matches.append(EntityMatch(entity_type, value, match.start()))
+
+        return matches
+
+    def extract_values(self, text: str, types: Optional[Iterable[str]] = None) -> Dict[str, List[str]]:
+        """Extract unique entity values grouped by type.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            text: Page text to scan
+            types: Entity types to extract (default: all configured types)
+
+        Returns:
+            Dictionary mapping each requested type to its unique values
+        """
+        values: Dict[str, List[str]] = {
+            entity_type: [] for entity_type in (types if types is not None else self.patterns)
+        }
+        for match in self.extract(text, types):
+            values[match.entity_type].append(match.value)
+        return values
+
+
+_entity_engine: Optional[EntityExtractionEngine] = None
+_entity_engine_lock = threading.Lock()
+
+
+def get_entity_engine() -> EntityExtractionEngine:
+
+    global _entity_engine
+    if _entity_engine is None:
+        with _entity_engine_lock:
+            if _entity_engine is None:
+                _entity_engine = EntityExtractionEngine()
+    return _entity_engine
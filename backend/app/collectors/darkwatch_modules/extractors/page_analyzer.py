@@ -0,0 +1,170 @@
+"""Process-pool page analysis stage.
+
+Crawling is split into an I/O stage (fetching bytes over Tor, done by threads
+or the async crawler) and this CPU stage. Raw page bytes are sent to a
+ProcessPoolExecutor where HTML parsing, text extraction, language detection,
+email/bitcoin extraction, entity extraction and SimHash fingerprinting run
+outside the crawler's GIL. Workers return a compact result without the raw
+HTML, so analysis throughput scales with CPU cores instead of competing with
+the fetch threads.
+
+This module uses the following DSA concepts from app.core.dsa:
+- SimHash: Content fingerprint computed in the worker for clone detection
+"""
+
+import asyncio
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+from app.config import settings
+from app.core.dsa.simhash import simhash
+from .entity_engine import get_entity_engine
+from .site_crawler import analyze_onion_page, new_crawl_result
+
+
+def analyze_page(url: str, content: bytes, charset: Optional[str] = None) -> Dict[str, Any]:
+    """Analyze one fetched page; runs inside a pool worker process.
+
+    DSA-USED:
+    - SimHash: Fingerprint of the extracted page text
+
+    Args:
+        url: Page URL
+        content: Raw response body
+        charset: Response charset (default: utf-8)
+
+    Returns:
+        Compact analysis dict: title, text, language, emails, bitcoin_addresses,
+        interesting_paths, links, forms, entity_matches (type, value, start) and simhash
+    """
+    text = content.decode(charset or "utf-8", errors="replace")
+    page = new_crawl_result(url)
+    analyze_onion_page(page, url, content, text)
+
+    page_text = page["text"] or ""
+    return {
+        "title": page["title"],
+        "text": page_text,
+        "language": page["language"],
+        "emails": page["emails"],
+        "bitcoin_addresses": page["bitcoin_addresses"],
+        "interesting_paths": page["interesting_paths"],
+        "links": page["links"],
+        "forms": page["forms"],
+        "entity_matches": [tuple(match) for match in get_entity_engine().extract(page_text)],
+        "simhash": simhash(page_text)
+    }
+
+
+class PageAnalysisPool:
+
+    def __init__(self, processes: Optional[int] = None):
+        processes = settings.DARKWEB_ANALYZE_PROCESSES if processes is None else processes
+        self.processes = (os.cpu_count() or 1) if processes == 0 else processes
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.stats = {"pool": 0, "inline": 0, "restarts": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.processes > 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # Forking a process that already runs crawler threads is unsafe; start clean workers instead
+                method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=multiprocessing.get_context(method)
+                )
+                logger.info(f"[PageAnalysisPool] Started {self.processes} analysis processes ({method})")
+            return self._executor
+
+    def _reset(self, error: Exception):
+        logger.warning(f"[PageAnalysisPool] Worker pool broke ({error}); restarting and analyzing in-process")
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+            self.stats["restarts"] += 1
+
+    def analyze(self, url: str, content: bytes, charset: Optional[str] = None) -> Dict[str, Any]:
+        """Analyze a page in the pool, blocking the calling thread until done.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            url: Page URL
+            content: Raw response body
+            charset: Response charset
+
+        Returns:
+            analyze_page() result
+        """
+        if self.enabled:
+            try:
+                result = self._get_executor().submit(analyze_page, url, content, charset).result()
+                self.stats["pool"] += 1
+                return result
+            except BrokenProcessPool as e:
+                self._reset(e)
+        self.stats["inline"] += 1
+        return analyze_page(url, content, charset)
+
+    async def analyze_async(self, url: str, content: bytes, charset: Optional[str] = None) -> Dict[str, Any]:
+        """Analyze a page in the pool without blocking the event loop.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            url: Page URL
+            content: Raw response body
+            charset: Response charset
+
+        Returns:
+            analyze_page() result
+        """
+        loop = asyncio.get_running_loop()
+        if self.enabled:
+            try:
+                result = await loop.run_in_executor(self._get_executor(), analyze_page, url, content, charset)
+                self.stats["pool"] += 1
+                return result
+            except BrokenProcessPool as e:
+                self._reset(e)
+        self.stats["inline"] += 1
+        return await loop.run_in_executor(None, analyze_page, url, content, charset)
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "processes": self.processes, "running": self._executor is not None}
+
+
+_analysis_pool: Optional[PageAnalysisPool] = None
+_analysis_pool_lock = threading.Lock()
+
+
+def get_page_analysis_pool() -> PageAnalysisPool:
+
+    global _analysis_pool
+    if _analysis_pool is None:
+        with _analysis_pool_lock:
+            if _analysis_pool is None:
+                _analysis_pool = PageAnalysisPool()
+                atexit.register(_analysis_pool.shutdown)
+    return _analysis_pool
@@ -3,12 +3,12 @@
 import requests
 import logging
 from typing import Dict, List, Optional, Any
-from bs4 import BeautifulSoup
 from app.config import settings
+from .entity_engine import EntityExtractionEngine
+from .utils import email_util, bitcoin_util
 from .utils import (
-    extract_emails,
-    extract_bitcoin_addresses,
-    extract_text_from_html,
+    parse_html,
+    read_bounded,
     detect_language,
     scan_ports,
     find_interesting_paths_in_content
@@ -17,6 +17,33 @@ from .utils import (
 
 logger = logging.getLogger(__name__)
 
+# Email and bitcoin extraction share one tokenization pass per page
+_entity_engine = EntityExtractionEngine(
+    {"email": email_util.REGEX.pattern, "bitcoin": bitcoin_util.REGEX.pattern},
+    validators={"email": email_util.is_valid_email, "bitcoin": bitcoin_util.is_valid_bitcoin},
+    flags=0
+)
+
+
+def new_crawl_result(url: str) -> Dict[str, Any]:
+    
+    return {
+        "url": url,
+        "status": "unknown",
+        "title": None,
+        "content": None,
+        "text": None,
+        "language": "unknown",
+        "emails": [],
+        "bitcoin_addresses": [],
+        "interesting_paths": [],
+        "open_ports": [],
+        "links": [],
+        "forms": [],
+        "truncated": False,
+        "error": None
+    }
+
 
 def crawl_onion_site(
     url: str,
@@ -40,20 +67,7 @@ def crawl_onion_site(
     if not url.startswith('http://') and not url.startswith('https://'):
         url = f"http://{url}"
     
-    result = {
-        "url": url,
-        "status": "unknown",
-        "title": None,
-        "content": None,
-        "text": None,
-        "language": "unknown",
-        "emails": [],
-        "bitcoin_addresses": [],
-        "interesting_paths": [],
-        "open_ports": [],
-        "links": [],
-        "error": None
-    }
+    result = new_crawl_result(url)
     
     try:
         logger.info(f"Crawling {url}")
@@ -67,54 +81,27 @@ def crawl_onion_site(
             url,
             proxies=proxies,
             headers=headers,
-            timeout=timeout
+            timeout=timeout,
+            stream=True
         )
         
         result["status"] = "online" if response.status_code == 200 else "offline"
         result["status_code"] = response.status_code
         
-        if response.status_code == 200:
-
-            soup = BeautifulSoup(response.content, features="lxml")
-            title_tag = soup.find('title')
-            if title_tag:
-                result["title"] = title_tag.get_text().strip()
-            
-
-            result["text"] = extract_text_from_html(response.content)
-            result["content"] = response.text
-            
-
-            if result["text"]:
-                result["language"] = detect_language(result["text"])
-            
-
-            result["emails"] = extract_emails(result["text"])
-            result["bitcoin_addresses"] = extract_bitcoin_addresses(result["text"])
+        if response.status_code != 200:
+            response.close()
+        else:
+            body = read_bounded(response)
+            result["truncated"] = body.truncated
+            if body.skipped_content_type:
+                logger.debug(f"Skipping {url}: non-text content type {body.skipped_content_type}")
+                return result
+            if body.truncated:
+                logger.debug(f"Truncated {url} at {len(body)} bytes")
             
-
-            result["interesting_paths"] = list(
-                find_interesting_paths_in_content(result["content"], url)
-            )
-            
-
-            links = []
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                if href:
-
-                    if href.startswith('http://') or href.startswith('https://'):
-                        links.append(href)
-                    elif href.startswith('/'):
-                        links.append(f"{url.rstrip('/')}{href}")
-                    elif '.onion' in href:
-                        links.append(href)
-            result["links"] = list(set(links))
-            
-
-
-            hostname = url.replace('http://', '').replace('https://', '').split('/')[0]
-
+            # CPU-bound parsing runs in the shared analysis process pool
+            from .page_analyzer import get_page_analysis_pool
+            result.update(get_page_analysis_pool().analyze(url, body.content, body.encoding))
     
     except requests.exceptions.ConnectionError as e:
         logger.debug(f"Connection error for {url}: {e}")
@@ -132,26 +119,50 @@ def crawl_onion_site(
     return result
 
 
-def extract_entities(content: str, url: str) -> List[Dict[str, Any]]:
+def analyze_onion_page(result: Dict[str, Any], url: str, content: bytes, text: str) -> Dict[str, Any]:
     
-    entities = []
+    page = parse_html(content)
+    result["title"] = page.title
+    result["text"] = page.text
+    result["forms"] = page.forms
+    result["content"] = text
     
 
-    emails = extract_emails(content)
-    for email in emails:
-        entities.append({
-            "type": "email",
-            "value": email,
-            "source_url": url
-        })
+    if result["text"]:
+        result["language"] = detect_language(result["text"])
     
 
-    bitcoin_addrs = extract_bitcoin_addresses(content)
-    for addr in bitcoin_addrs:
-        entities.append({
-            "type": "bitcoin",
-            "value": addr,
-            "source_url": url
-        })
+    entity_values = _entity_engine.extract_values(result["text"])
+    result["emails"] = entity_values["email"]
+    result["bitcoin_addresses"] = entity_values["bitcoin"]
+    
+
+    result["interesting_paths"] = list(
+        find_interesting_paths_in_content(result["content"], url)
+    )
+    
+
+    links = []
+    for href in page.links:
+
+        if href.startswith('http://') or href.startswith('https://'):
+            links.append(href)
+        elif href.startswith('/'):
+            links.append(f"{url.rstrip('/')}{href}")
+        elif '.onion' in href:
+            links.append(href)
+    result["links"] = list(set(links))
     
-    return entities
+    return result
+
+
+def extract_entities(content: str, url: str) -> List[Dict[str, Any]]:
+    
+    return [
+        {
+            "type": match.entity_type,
+            "value": match.value,
+            "source_url": url
+        }
+        for match in _entity_engine.extract(content)
+    ]
@@ -1,8 +1,11 @@
 from .bitcoin_util import extract_bitcoin_addresses, is_valid_bitcoin
 from .email_util import extract_emails
 from .portscanner import scan_ports
+from .bounded_body import BoundedBody, is_text_content_type, read_bounded, read_bounded_async
+from .html_parser import ParsedPage, parse_html
 from .text_processor import clean_text, extract_text_from_html
 from .language_detector import detect_language
+from .text_analytics import TextAnalysis, TextAnalyzer
 from .interesting_paths import find_interesting_paths_in_content
 
 __all__ = [
@@ -10,8 +13,16 @@ __all__ = [
     'is_valid_bitcoin',
     'extract_emails',
     'scan_ports',
+    'BoundedBody',
+    'is_text_content_type',
+    'read_bounded',
+    'read_bounded_async',
+    'ParsedPage',
+    'parse_html',
     'clean_text',
     'extract_text_from_html',
     'detect_language',
+    'TextAnalysis',
+    'TextAnalyzer',
     'find_interesting_paths_in_content'
 ]
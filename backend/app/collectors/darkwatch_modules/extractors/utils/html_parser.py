@@ -0,0 +1,120 @@
+"""Single-pass HTML parsing for crawled pages.
+
+Every consumer of a crawled page (site analysis, the Tor connector's YARA
+scoring and title, link discovery) needs the same handful of facts about the
+document. This module parses the bytes once with lxml and collects the title,
+visible text, anchor links, body hrefs and forms in one walk over the tree,
+so callers share a ParsedPage instead of each building their own soup.
+
+This module does not use custom DSA concepts from app.core.dsa.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Union
+
+from lxml import etree, html
+
+
+SKIPPED_TEXT_TAGS = frozenset({"script", "style"})
+FORM_FIELD_TAGS = frozenset({"input", "select", "textarea", "button"})
+
+
+@dataclass
+class ParsedPage:
+    title: Optional[str] = None
+    text: str = ""
+    links: List[str] = field(default_factory=list)
+    body_hrefs: List[str] = field(default_factory=list)
+    forms: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def parse_html(content: Union[bytes, str]) -> ParsedPage:
+    """Parse a page once and extract everything the crawl pipeline uses.
+
+    Visible text matches BeautifulSoup's stripped_strings after removing
+    script and style elements: each text node stripped, empty ones dropped,
+    joined by single spaces.
+
+    DSA-USED:
+    - None: This function does not use custom DSA structures from app.core.dsa.
+
+    Args:
+        content: Raw response body (bytes are decoded using the page's declared charset)
+
+    Returns:
+        ParsedPage with title, text, links (<a href> values in document order),
+        body_hrefs (href of every element inside <body>) and forms
+        (action, method, input names)
+    """
+    page = ParsedPage()
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    try:
+        root = html.document_fromstring(content, parser=_parser_for(content))
+    except (etree.ParserError, ValueError):
+        return page
+
+    strings: List[str] = []
+    body_depth = 0
+    form: Optional[Dict[str, Any]] = None
+
+    for event, element in etree.iterwalk(root, events=("start", "end", "comment", "pi")):
+        tag = element.tag
+        if event in ("comment", "pi"):
+            # Only the text after a comment or processing instruction is document text
+            if element.tail:
+                _add_string(strings, element.tail)
+        elif event == "start":
+            if element.text and tag not in SKIPPED_TEXT_TAGS:
+                _add_string(strings, element.text)
+
+            if tag == "title" and page.title is None:
+                page.title = (element.text or "").strip()
+            elif tag == "body":
+                body_depth += 1
+                continue
+
+            href = element.get("href")
+            if href is not None:
+                if body_depth:
+                    page.body_hrefs.append(href)
+                if tag == "a" and href:
+                    page.links.append(href)
+
+            if tag == "form":
+                form = {
+                    "action": element.get("action", ""),
+                    "method": (element.get("method") or "get").upper(),
+                    "inputs": []
+                }
+                page.forms.append(form)
+            elif form is not None and tag in FORM_FIELD_TAGS:
+                name = element.get("name")
+                if name:
+                    form["inputs"].append(name)
+        else:
+            if tag == "body":
+                body_depth -= 1
+            elif tag == "form":
+                form = None
+            if element.tail:
+                _add_string(strings, element.tail)
+
+    page.text = " ".join(strings)
+    return page
+
+
+def _parser_for(content: bytes) -> html.HTMLParser:
+    # lxml falls back to latin-1 for pages without a charset declaration; most
+    # onion pages are UTF-8, so prefer it whenever the bytes decode cleanly
+    try:
+        content.decode("utf-8")
+    except UnicodeDecodeError:
+        return html.HTMLParser()
+    return html.HTMLParser(encoding="utf-8")
+
+
+def _add_string(strings: List[str], value: str):
+    value = value.strip()
+    if value:
+        strings.append(value)
@@ -1,40 +1,79 @@
 
 
 import re
-from typing import Optional
+from collections import Counter
+from typing import Dict, Mapping, Optional
 
 
+TOKEN_RE = re.compile(r'\w+')
 
-LANGUAGE_PATTERNS = {
-    'en': [r'\bthe\b', r'\band\b', r'\bor\b', r'\bis\b'],
-    'es': [r'\bel\b', r'\bla\b', r'\bde\b', r'\bque\b'],
-    'fr': [r'\ble\b', r'\bla\b', r'\bde\b', r'\bet\b'],
-    'de': [r'\bder\b', r'\bdie\b', r'\bdas\b', r'\bund\b'],
-    'ru': [r'[а-яА-Я]'],
-    'zh': [r'[\u4e00-\u9fff]'],
-    'ar': [r'[\u0600-\u06FF]'],
+LANGUAGE_WORDS = {
+    'en': ('the', 'and', 'or', 'is'),
+    'es': ('el', 'la', 'de', 'que'),
+    'fr': ('le', 'la', 'de', 'et'),
+    'de': ('der', 'die', 'das', 'und'),
 }
 
+# Languages scored by how many characters of their script appear
+LANGUAGE_SCRIPTS = {
+    'ru': 'cyrillic',
+    'zh': 'han',
+    'ar': 'arabic',
+}
 
-def detect_language(text: str) -> str:
+SCRIPT_RANGES = {
+    'cyrillic': ((0x0410, 0x044F),),
+    'han': ((0x4E00, 0x9FFF),),
+    'arabic': ((0x0600, 0x06FF),),
+}
+
+LANGUAGE_ORDER = ('en', 'es', 'fr', 'de', 'ru', 'zh', 'ar')
+
+
+def _script_of(char: str) -> Optional[str]:
     
-    if not text or len(text) < 10:
-        return 'unknown'
+    code = ord(char)
+    for script, ranges in SCRIPT_RANGES.items():
+        for low, high in ranges:
+            if low <= code <= high:
+                return script
+    return None
+
+
+def script_histogram(token_counts: Mapping[str, int]) -> Counter:
     
-    text_lower = text.lower()
-    scores = {}
+    scripts = Counter()
+    for token, count in token_counts.items():
+        if token.isascii():
+            continue
+        for char in token:
+            script = _script_of(char)
+            if script:
+                scripts[script] += count
+    return scripts
+
+
+def language_from_counts(token_counts: Mapping[str, int], script_counts: Mapping[str, int]) -> str:
     
-    for lang, patterns in LANGUAGE_PATTERNS.items():
-        score = 0
-        for pattern in patterns:
-            matches = len(re.findall(pattern, text_lower, re.IGNORECASE))
-            score += matches
-        scores[lang] = score
+    scores: Dict[str, int] = {}
+    for lang in LANGUAGE_ORDER:
+        if lang in LANGUAGE_WORDS:
+            scores[lang] = sum(token_counts.get(word, 0) for word in LANGUAGE_WORDS[lang])
+        else:
+            scores[lang] = script_counts.get(LANGUAGE_SCRIPTS[lang], 0)
     
-    if scores:
-        detected = max(scores, key=scores.get)
-        if scores[detected] > 0:
-            return detected
+    detected = max(scores, key=scores.get)
+    if scores[detected] > 0:
+        return detected
     
 
     return 'en'
+
+
+def detect_language(text: str) -> str:
+    
+    if not text or len(text) < 10:
+        return 'unknown'
+    
+    token_counts = Counter(TOKEN_RE.findall(text.lower()))
+    return language_from_counts(token_counts, script_histogram(token_counts))
@@ -0,0 +1,143 @@
+"""One-pass text analytics for crawled pages.
+
+Language detection, site categorization and monitored keyword matching all
+used to rescan the page text: one regex per language pattern, one substring
+search per category keyword, one more pass for keywords. TextAnalyzer
+tokenizes the text once into a token-frequency map and a script histogram,
+and derives all three from those. Term lookups are hash probes per distinct
+token, so the cost per page depends on the page's vocabulary rather than on
+how many categories or keywords are configured.
+
+Term matching is word based. A category term matches words that start with
+it ("hack" matches "hacking"). A monitored keyword must match whole words.
+Multi-word terms must appear as consecutive words.
+
+This module does not use custom DSA concepts from app.core.dsa.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, Iterable, List, Mapping, Optional, Set, Tuple
+
+from .language_detector import TOKEN_RE, language_from_counts, script_histogram
+
+
+@dataclass
+class TextAnalysis:
+    language: str
+    category: Optional[Hashable]
+    category_scores: Dict[Hashable, int] = field(default_factory=dict)
+    keywords: List[str] = field(default_factory=list)
+    token_counts: Counter = field(default_factory=Counter)
+    script_counts: Counter = field(default_factory=Counter)
+
+
+@dataclass(frozen=True)
+class _Term:
+    text: str
+    tokens: Tuple[str, ...]
+    prefix: bool
+    category: Optional[Hashable] = None
+
+
+class TextAnalyzer:
+
+    def __init__(
+        self,
+        categories: Optional[Mapping[Hashable, Iterable[str]]] = None,
+        keywords: Iterable[str] = ()
+    ):
+        self._terms: List[_Term] = []
+        self._exact: Dict[str, List[int]] = {}
+        self._prefix: Dict[str, List[int]] = {}
+        self._prefix_lengths: Set[int] = set()
+        self._phrases: Dict[str, List[int]] = {}
+        self._untokenized: List[int] = []
+
+        for category, terms in (categories or {}).items():
+            for term in terms:
+                self.add_category_term(category, term)
+        for keyword in keywords:
+            self.add_keyword(keyword)
+
+    def add_category_term(self, category: Hashable, term: str):
+        self._add(_Term(term, tuple(TOKEN_RE.findall(term.lower())), True, category))
+
+    def add_keyword(self, keyword: str):
+        self._add(_Term(keyword, tuple(TOKEN_RE.findall(keyword.lower())), False))
+
+    def _add(self, term: _Term):
+        index = len(self._terms)
+        self._terms.append(term)
+        if not term.tokens:
+            # Punctuation-only terms cannot be tokenized; fall back to a substring check
+            self._untokenized.append(index)
+        elif len(term.tokens) > 1:
+            self._phrases.setdefault(term.tokens[0], []).append(index)
+        elif term.prefix:
+            self._prefix.setdefault(term.tokens[0], []).append(index)
+            self._prefix_lengths.add(len(term.tokens[0]))
+        else:
+            self._exact.setdefault(term.tokens[0], []).append(index)
+
+    def _phrase_matches(self, term: _Term, words: List[str], start: int) -> bool:
+        end = start + len(term.tokens)
+        if end > len(words) or words[start:end - 1] != list(term.tokens[:-1]):
+            return False
+        last = words[end - 1]
+        return last.startswith(term.tokens[-1]) if term.prefix else last == term.tokens[-1]
+
+    def analyze(self, text: str) -> TextAnalysis:
+        """Tokenize text once and derive language, category scores and keyword hits.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            text: Page text (title and body)
+
+        Returns:
+            TextAnalysis; category is None when no category term matched and
+            language is 'unknown' for texts under 10 characters
+        """
+        lowered = (text or "").lower()
+        words = TOKEN_RE.findall(lowered)
+        token_counts = Counter(words)
+        script_counts = script_histogram(token_counts)
+
+        matched: Set[int] = set()
+        for token in token_counts:
+            matched.update(self._exact.get(token, ()))
+            for length in self._prefix_lengths:
+                if len(token) >= length:
+                    matched.update(self._prefix.get(token[:length], ()))
+
+        heads = self._phrases.keys() & token_counts.keys()
+        if heads:
+            for position, word in enumerate(words):
+                if word in heads:
+                    for index in self._phrases[word]:
+                        if index not in matched and self._phrase_matches(self._terms[index], words, position):
+                            matched.add(index)
+
+        for index in self._untokenized:
+            if self._terms[index].text.lower() in lowered:
+                matched.add(index)
+
+        category_scores: Dict[Hashable, int] = {}
+        keywords = []
+        for index in sorted(matched):
+            term = self._terms[index]
+            if term.category is not None:
+                category_scores[term.category] = category_scores.get(term.category, 0) + 1
+            else:
+                keywords.append(term.text)
+
+        return TextAnalysis(
+            language=language_from_counts(token_counts, script_counts) if len(lowered) >= 10 else "unknown",
+            category=max(category_scores, key=category_scores.get) if category_scores else None,
+            category_scores=category_scores,
+            keywords=keywords,
+            token_counts=token_counts,
+            script_counts=script_counts
+        )
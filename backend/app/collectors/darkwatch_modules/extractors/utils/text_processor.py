@@ -1,18 +1,12 @@
 
 
-from bs4 import BeautifulSoup
 from typing import Optional
+from .html_parser import parse_html
 
 
 def extract_text_from_html(html_content: bytes) -> str:
     
-    soup = BeautifulSoup(html_content, features="lxml")
-    
-
-    for s in soup(['script', 'style']):
-        s.decompose()
-    
-    return ' '.join(soup.stripped_strings)
+    return parse_html(html_content).text
 
 
 def clean_text(text: str) -> str:
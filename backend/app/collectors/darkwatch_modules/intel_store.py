@@ -0,0 +1,198 @@
+"""Shared dark web intelligence store.
+
+This module persists what was learned about each crawled onion site (page
+text, content hash, extracted entities, outlinks and when it was last
+crawled) in a SQLite database shared by every DarkWatch instance. Jobs and
+scheduled runs check the store before going to Tor, so a site is only
+refetched once its record is older than the configured max age, and keyword
+matching can re-run against the cached text. Page text lives in the shared
+blob store and rows keep only its digest, so mirrored pages are stored once.
+
+This module does not use custom DSA concepts from app.core.dsa.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from app.config import settings
+from app.core.database.blob_store import get_blob_store
+
+
+class DarkWebIntelStore:
+
+    def __init__(self, db_file: Optional[str] = None, max_age: Optional[int] = None):
+        self.db_file = db_file or str(settings.DATA_DIR / settings.DARKWEB_INTEL_STORE_PATH)
+        self.max_age = settings.DARKWEB_INTEL_MAX_AGE if max_age is None else max_age
+        self._local = threading.local()
+        self.stats = {"hits": 0, "stale": 0, "misses": 0, "writes": 0}
+
+        directory = os.path.dirname(self.db_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._create_schema()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_file, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL;")
+            conn.execute("PRAGMA synchronous=NORMAL;")
+            self._local.conn = conn
+        return conn
+
+    def _create_schema(self):
+        conn = self._connection()
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS site_intel (
+                    onion_url TEXT PRIMARY KEY,
+                    title TEXT,
+                    category TEXT,
+                    language TEXT,
+                    content BLOB,
+                    content_blob TEXT,
+                    content_hash TEXT,
+                    entities TEXT,
+                    outlinks TEXT,
+                    first_seen REAL,
+                    last_crawled REAL
+                );
+            """)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(site_intel);")}
+            if "content_blob" not in columns:
+                # Stores created before the blob store keep zlib text in content
+                conn.execute("ALTER TABLE site_intel ADD COLUMN content_blob TEXT;")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_site_intel_hash ON site_intel (content_hash);")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_site_intel_crawled ON site_intel (last_crawled);")
+
+    def get(self, onion_url: str, max_age: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Get the stored record for a site if it is fresh enough to reuse.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            onion_url: Onion URL as passed to DarkWatch.crawl_site
+            max_age: Max record age in seconds (default: store max_age)
+
+        Returns:
+            Record dictionary, or None if missing or stale
+        """
+        max_age = self.max_age if max_age is None else max_age
+        row = self._connection().execute(
+            "SELECT title, category, language, content, content_hash, entities, outlinks, first_seen, last_crawled, content_blob "
+            "FROM site_intel WHERE onion_url = ?;",
+            (onion_url,)
+        ).fetchone()
+
+        if row is None:
+            self.stats["misses"] += 1
+            return None
+        if time.time() - row[8] > max_age:
+            self.stats["stale"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        if row[9]:
+            content = get_blob_store().get_text(row[9]) or ""
+        else:
+            content = zlib.decompress(row[3]).decode("utf-8") if row[3] else ""
+        return {
+            "title": row[0],
+            "category": row[1],
+            "language": row[2],
+            "content": content,
+            "content_hash": row[4],
+            "entities": json.loads(row[5]) if row[5] else [],
+            "outlinks": json.loads(row[6]) if row[6] else [],
+            "first_seen": row[7],
+            "last_crawled": row[8]
+        }
+
+    def put(
+        self,
+        onion_url: str,
+        title: str,
+        category: str,
+        language: str,
+        content: str,
+        content_hash: str,
+        entities: List[Dict[str, Any]],
+        outlinks: List[str],
+        crawled_at: Optional[float] = None
+    ):
+        """Insert or refresh the record for a crawled site, keeping its first_seen time.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            onion_url: Onion URL as passed to DarkWatch.crawl_site
+            title: Page title
+            category: SiteCategory value
+            language: Detected language
+            content: Extracted page text
+            content_hash: Hash of the page text
+            entities: Extracted entities as ExtractedEntity.to_dict() dictionaries
+            outlinks: Linked onion URLs
+            crawled_at: Crawl timestamp (default: now)
+        """
+        crawled_at = crawled_at or time.time()
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                """
+                INSERT INTO site_intel
+                    (onion_url, title, category, language, content, content_blob, content_hash, entities, outlinks, first_seen, last_crawled)
+                VALUES (?, ?, ?, ?, NULL, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(onion_url) DO UPDATE SET
+                    title = excluded.title,
+                    category = excluded.category,
+                    language = excluded.language,
+                    content = excluded.content,
+                    content_blob = excluded.content_blob,
+                    content_hash = excluded.content_hash,
+                    entities = excluded.entities,
+                    outlinks = excluded.outlinks,
+                    last_crawled = excluded.last_crawled;
+                """,
+                (
+                    onion_url, title, category, language,
+                    get_blob_store().put_text(content), content_hash,
+                    json.dumps(entities), json.dumps(outlinks),
+                    crawled_at, crawled_at
+                )
+            )
+        self.stats["writes"] += 1
+
+    def delete(self, onion_url: str) -> bool:
+        conn = self._connection()
+        with conn:
+            cursor = conn.execute("DELETE FROM site_intel WHERE onion_url = ?;", (onion_url,))
+        return cursor.rowcount > 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        total = self._connection().execute("SELECT COUNT(*) FROM site_intel;").fetchone()[0]
+        return {**self.stats, "sites_stored": total, "max_age": self.max_age}
+
+
+_intel_store: Optional[DarkWebIntelStore] = None
+_intel_store_lock = threading.Lock()
+
+
+def get_intel_store() -> DarkWebIntelStore:
+
+    global _intel_store
+    if _intel_store is None:
+        with _intel_store_lock:
+            if _intel_store is None:
+                _intel_store = DarkWebIntelStore()
+                logger.info(f"[DarkWebIntelStore] Using {_intel_store.db_file} (max_age={_intel_store.max_age}s)")
+    return _intel_store
@@ -0,0 +1,222 @@
+"""Shared asyncio DNS resolver with caching.
+
+Collectors used to resolve names either with blocking socket.getaddrinfo in
+the default executor (WebRecon) or with dnspython's synchronous resolver
+called straight from coroutines (EmailAudit), which stalls the event loop for
+up to the resolver timeout per lookup. AsyncDNSResolver wraps dnspython's
+asyncio resolver and adds:
+
+- a positive cache that keeps each answer until its TTL expires
+- a negative cache for NXDOMAIN / NoAnswer, kept for the zone's SOA negative
+  TTL (capped by DNS_NEGATIVE_TTL)
+- coalescing, so concurrent lookups of the same name and type share one query
+  (run in its own task, so a cancelled caller only abandons its own wait)
+- a cap on queries in flight per event loop
+
+Timeouts and server failures are not cached. The backend is injectable:
+pass any object with an async resolve(qname, rdtype, lifetime=...) method, or
+point the default backend at a local stub server with nameservers/port.
+
+This module does not use custom DSA concepts from app.core.dsa.
+"""
+
+import asyncio
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import dns.asyncresolver
+import dns.rdatatype
+import dns.resolver
+from loguru import logger
+
+from app.config import settings
+
+
+NEGATIVE_ERRORS = (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer)
+
+
+class _LoopState:
+    """Per event loop concurrency limit and in-flight queries."""
+
+    def __init__(self, max_concurrency: int):
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+
+
+def _retrieve_exception(future: asyncio.Future):
+    # Avoids "exception was never retrieved" when no other caller was waiting
+    if not future.cancelled():
+        future.exception()
+
+
+class AsyncDNSResolver:
+
+    def __init__(
+        self,
+        backend: Optional[Any] = None,
+        nameservers: Optional[List[str]] = None,
+        port: Optional[int] = None,
+        timeout: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        negative_ttl: Optional[float] = None,
+        cache_size: Optional[int] = None
+    ):
+        self.timeout = timeout or settings.DNS_RESOLVER_TIMEOUT
+        self.max_concurrency = max_concurrency or settings.DNS_MAX_CONCURRENCY
+        self.negative_ttl = settings.DNS_NEGATIVE_TTL if negative_ttl is None else negative_ttl
+        self.cache_size = cache_size or settings.DNS_CACHE_SIZE
+
+        if backend is None:
+            backend = dns.asyncresolver.Resolver()
+            nameservers = nameservers or [ns.strip() for ns in settings.DNS_NAMESERVERS.split(",") if ns.strip()]
+            if nameservers:
+                backend.nameservers = nameservers
+            if port:
+                backend.port = port
+            backend.timeout = self.timeout
+            backend.lifetime = self.timeout
+        self.backend = backend
+
+        self.stats = {"queries": 0, "hits": 0, "negative_hits": 0, "coalesced": 0, "errors": 0}
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[float, Any, Optional[Exception]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._loops: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def _key(qname: Any, rdtype: Any) -> Tuple[str, str]:
+        if not isinstance(rdtype, str):
+            rdtype = dns.rdatatype.to_text(rdtype)
+        return str(qname).lower().rstrip("."), rdtype.upper()
+
+    def _loop_state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        state = self._loops.get(loop)
+        if state is None:
+            state = _LoopState(self.max_concurrency)
+            self._loops[loop] = state
+        return state
+
+    def _cached(self, key: Tuple[str, str]) -> Optional[Tuple[Any, Optional[Exception]]]:
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            expires, answer, error = entry
+            if expires <= time.time():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return answer, error
+
+    def _store(self, key: Tuple[str, str], expires: float, answer: Any, error: Optional[Exception]):
+        with self._cache_lock:
+            self._cache[key] = (expires, answer, error)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _negative_expiry(self, error: Exception) -> float:
+        # RFC 2308: negative answers live for min(SOA TTL, SOA MINIMUM) of the zone's authority record
+        ttl = self.negative_ttl
+        try:
+            if isinstance(error, dns.resolver.NXDOMAIN):
+                responses = list(error.responses().values())
+            else:
+                responses = [error.kwargs.get("response")]
+            for response in responses:
+                for rrset in getattr(response, "authority", None) or []:
+                    if rrset.rdtype == dns.rdatatype.SOA and len(rrset):
+                        ttl = min(ttl, rrset.ttl, rrset[0].minimum)
+        except Exception:
+            pass
+        return time.time() + ttl
+
+    async def resolve(self, qname: Any, rdtype: Any = "A", lifetime: Optional[float] = None) -> Any:
+        """Resolve qname, serving answers and negative results from cache while their TTL lasts.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            qname: Name to resolve (str or dns.name.Name)
+            rdtype: Record type (e.g. 'A', 'TXT', dns.rdatatype.PTR)
+            lifetime: Seconds allowed for this lookup (default: resolver timeout)
+
+        Returns:
+            dns.resolver.Answer
+
+        Raises:
+            dns.resolver.NXDOMAIN, dns.resolver.NoAnswer: Also when cached
+            dns.exception.DNSException: Timeouts and server failures (not cached)
+        """
+        key = self._key(qname, rdtype)
+        cached = self._cached(key)
+        if cached is not None:
+            answer, error = cached
+            if error is not None:
+                self.stats["negative_hits"] += 1
+                raise error.with_traceback(None)
+            self.stats["hits"] += 1
+            return answer
+
+        state = self._loop_state()
+        task = state.inflight.get(key)
+        if task is not None:
+            self.stats["coalesced"] += 1
+        else:
+            task = asyncio.ensure_future(self._query(state, key, qname, rdtype, lifetime))
+            task.add_done_callback(_retrieve_exception)
+            state.inflight[key] = task
+        # The query is not owned by any caller, so cancelling one caller leaves it running for the rest
+        return await asyncio.shield(task)
+
+    async def _query(self, state: _LoopState, key: Tuple[str, str], qname: Any, rdtype: Any, lifetime: Optional[float]) -> Any:
+        try:
+            async with state.semaphore:
+                self.stats["queries"] += 1
+                answer = await self.backend.resolve(qname, rdtype, lifetime=lifetime or self.timeout)
+            self._store(key, answer.expiration, answer, None)
+            return answer
+        except NEGATIVE_ERRORS as e:
+            self._store(key, self._negative_expiry(e), None, e)
+            raise
+        except Exception:
+            self.stats["errors"] += 1
+            raise
+        finally:
+            state.inflight.pop(key, None)
+
+    async def host_exists(self, hostname: str, lifetime: Optional[float] = None) -> bool:
+        try:
+            await self.resolve(hostname, "A", lifetime=lifetime)
+            return True
+        except Exception:
+            return False
+
+    def clear(self):
+        with self._cache_lock:
+            self._cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "cached": len(self._cache), "max_concurrency": self.max_concurrency}
+
+
+_dns_resolver: Optional[AsyncDNSResolver] = None
+_dns_resolver_lock = threading.Lock()
+
+
+def get_dns_resolver() -> AsyncDNSResolver:
+
+    global _dns_resolver
+    if _dns_resolver is None:
+        with _dns_resolver_lock:
+            if _dns_resolver is None:
+                _dns_resolver = AsyncDNSResolver()
+                logger.info(
+                    f"[AsyncDNSResolver] Shared resolver ready (max_concurrency={_dns_resolver.max_concurrency}, "
+                    f"negative_ttl={_dns_resolver.negative_ttl}s)"
+                )
+    return _dns_resolver
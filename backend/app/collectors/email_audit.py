@@ -20,6 +20,7 @@ import dns.reversename
 from loguru import logger
 
 from app.core.dsa import HashMap, AVLTree, Graph
+from app.collectors.dns_resolver import AsyncDNSResolver, get_dns_resolver
 
 
 class EmailAudit:
@@ -32,14 +33,12 @@ class EmailAudit:
         'mandrill', 'amazonses', 'sendgrid', 'mailchimp', 'postmark'
     ]
     
-    def __init__(self):
+    def __init__(self, resolver: Optional[AsyncDNSResolver] = None):
         """Initialize email auditor with DSA structures for caching and indexing."""
         self._dns_cache = HashMap()  # DNS record cache
         self._domain_index = AVLTree()  # Domain timestamp index
         self._infra_graph = Graph(directed=True)  # Infrastructure relationships
-        self._resolver = dns.resolver.Resolver()
-        self._resolver.timeout = 5
-        self._resolver.lifetime = 5
+        self._resolver = resolver or get_dns_resolver()
     
     async def audit(self, domain: str, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         config = config or {}
@@ -127,7 +126,7 @@ class EmailAudit:
             if cached:
                 return cached
             
-            answers = self._resolver.resolve(domain, 'TXT')
+            answers = await self._resolver.resolve(domain, 'TXT')
             
             for rdata in answers:
                 txt = rdata.to_text().strip('"')
@@ -183,27 +182,28 @@ class EmailAudit:
             "issues": []
         }
         
-        for selector in self.COMMON_DKIM_SELECTORS:
-            dkim_domain = f"{selector}._domainkey.{domain}"
-            
+        async def lookup(selector: str):
             try:
-                answers = self._resolver.resolve(dkim_domain, 'TXT')
-                
-                for rdata in answers:
-                    txt = rdata.to_text().strip('"')
-                    if 'v=DKIM1' in txt or 'p=' in txt:
-                        selector_info = {
-                            "selector": selector,
-                            "record": txt,
-                            "key_type": self._extract_dkim_key_type(txt)
-                        }
-                        result["selectors_found"].append(selector_info)
-                        break
-            
+                return await self._resolver.resolve(f"{selector}._domainkey.{domain}", 'TXT')
             except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
-                pass
+                return None
             except Exception:
-                pass
+                return None
+        
+        # Selectors are independent lookups, so query them together
+        selector_answers = await asyncio.gather(*(lookup(s) for s in self.COMMON_DKIM_SELECTORS))
+        
+        for selector, answers in zip(self.COMMON_DKIM_SELECTORS, selector_answers):
+            for rdata in answers or []:
+                txt = rdata.to_text().strip('"')
+                if 'v=DKIM1' in txt or 'p=' in txt:
+                    selector_info = {
+                        "selector": selector,
+                        "record": txt,
+                        "key_type": self._extract_dkim_key_type(txt)
+                    }
+                    result["selectors_found"].append(selector_info)
+                    break
         
         if not result["selectors_found"]:
             result["issues"].append({
@@ -232,7 +232,7 @@ class EmailAudit:
         dmarc_domain = f"_dmarc.{domain}"
         
         try:
-            answers = self._resolver.resolve(dmarc_domain, 'TXT')
+            answers = await self._resolver.resolve(dmarc_domain, 'TXT')
             
             for rdata in answers:
                 txt = rdata.to_text().strip('"')
@@ -296,7 +296,7 @@ class EmailAudit:
         mx_records = []
         
         try:
-            answers = self._resolver.resolve(domain, 'MX')
+            answers = await self._resolver.resolve(domain, 'MX')
             
             for rdata in answers:
                 mx_records.append({
@@ -324,7 +324,7 @@ class EmailAudit:
         
         try:
             bimi_domain = f"default._bimi.{domain}"
-            answers = self._resolver.resolve(bimi_domain, 'TXT')
+            answers = await self._resolver.resolve(bimi_domain, 'TXT')
             
             for rdata in answers:
                 txt = rdata.to_text().strip('"')
@@ -383,7 +383,7 @@ class EmailAudit:
         
         try:
             mta_sts_domain = f"_mta-sts.{domain}"
-            answers = self._resolver.resolve(mta_sts_domain, 'TXT')
+            answers = await self._resolver.resolve(mta_sts_domain, 'TXT')
             
             for rdata in answers:
                 txt = rdata.to_text().strip('"')
@@ -460,7 +460,7 @@ class EmailAudit:
             
             try:
                 tlsa_domain = f"_25._tcp.{mx_host}"
-                answers = self._resolver.resolve(tlsa_domain, 'TLSA')
+                answers = await self._resolver.resolve(tlsa_domain, 'TLSA')
                 
                 for rdata in answers:
                     result["exists"] = True
@@ -517,12 +517,12 @@ class EmailAudit:
             }
             
             try:
-                ip_answers = self._resolver.resolve(mx_host, 'A')
+                ip_answers = await self._resolver.resolve(mx_host, 'A')
                 for ip_rdata in ip_answers:
                     ip = str(ip_rdata)
                     
                     try:
-                        ptr_answers = self._resolver.resolve(dns.reversename.from_address(ip), 'PTR')
+                        ptr_answers = await self._resolver.resolve(dns.reversename.from_address(ip), 'PTR')
                         for ptr_rdata in ptr_answers:
                             mx_info["ptr_exists"] = True
                             mx_info["ptr_record"] = str(ptr_rdata).rstrip('.')
@@ -560,7 +560,7 @@ class EmailAudit:
         }
         
         try:
-            answers = self._resolver.resolve(domain, 'DNSKEY')
+            answers = await self._resolver.resolve(domain, 'DNSKEY')
             
             if answers:
                 result["signed"] = True
@@ -602,31 +602,31 @@ class EmailAudit:
             
             try:
                 try:
-                    mx_answers = self._resolver.resolve(subdomain_full, 'MX')
+                    mx_answers = await self._resolver.resolve(subdomain_full, 'MX')
                     if mx_answers:
                         subdomain_result["has_mx"] = True
-                except:
+                except Exception:
                     pass
                 
                 try:
-                    txt_answers = self._resolver.resolve(subdomain_full, 'TXT')
+                    txt_answers = await self._resolver.resolve(subdomain_full, 'TXT')
                     for rdata in txt_answers:
                         txt = rdata.to_text().strip('"')
                         if txt.startswith('v=spf1'):
                             subdomain_result["has_spf"] = True
                             break
-                except:
+                except Exception:
                     pass
                 
                 try:
                     dmarc_domain = f"_dmarc.{subdomain_full}"
-                    dmarc_answers = self._resolver.resolve(dmarc_domain, 'TXT')
+                    dmarc_answers = await self._resolver.resolve(dmarc_domain, 'TXT')
                     for rdata in dmarc_answers:
                         txt = rdata.to_text().strip('"')
                         if txt.startswith('v=DMARC1'):
                             subdomain_result["has_dmarc"] = True
                             break
-                except:
+                except Exception:
                     pass
                 
                 if any([subdomain_result["has_mx"], subdomain_result["has_spf"], 
@@ -0,0 +1,222 @@
+"""Pooled HTTP client with a shared request budget for scans.
+
+WebRecon used to open a new httpx.AsyncClient in every discovery phase, plus
+one more per redirect-following request, and fire every probe of a phase at
+once. ScanHttpPool gives a scan one keep-alive connection pool (HTTP/2 when
+the h2 package is installed) and one semaphore that every request of every
+phase goes through, plus a smaller per-host semaphore so a single target is
+not hit with more parallel connections than the pool allows per host. Large
+targets then queue on the budget instead of exhausting sockets, and phases
+that run side by side share the same warm connections.
+
+get_prefix() fetches only the first bytes of a body (a ranged GET that also
+stops reading when a server ignores the Range header), for probes that only
+need to classify a response rather than download it.
+
+This module does not use custom DSA concepts from app.core.dsa.
+"""
+
+import asyncio
+import re
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+from loguru import logger
+
+from app.config import settings
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+@dataclass
+class PartialResponse:
+    status_code: int
+    headers: httpx.Headers
+    url: str
+    content: bytes
+    content_length: int
+    complete: bool
+    not_modified: bool = False
+
+    @property
+    def text(self) -> str:
+        match = re.search(r"charset=([\w-]+)", self.headers.get("content-type", ""))
+        try:
+            return self.content.decode(match.group(1) if match else "utf-8", errors="replace")
+        except LookupError:
+            return self.content.decode("utf-8", errors="replace")
+
+
+class ScanHttpPool:
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        max_per_host: Optional[int] = None,
+        max_connections: Optional[int] = None,
+        http2: Optional[bool] = None,
+        timeout: Optional[float] = None
+    ):
+        self.max_concurrency = max_concurrency or settings.WEB_RECON_MAX_CONCURRENCY
+        self.max_per_host = max_per_host or settings.WEB_RECON_MAX_PER_HOST
+        self.max_connections = max_connections or settings.WEB_RECON_MAX_CONNECTIONS
+        self.http2 = (settings.WEB_RECON_HTTP2 if http2 is None else http2) and HTTP2_AVAILABLE
+        self.timeout = timeout or settings.WEB_RECON_TIMEOUT
+        self.stats = {"requests": 0, "errors": 0, "bytes": 0, "peak_in_flight": 0, "wait_time": 0.0}
+        self._budget = asyncio.Semaphore(self.max_concurrency)
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._in_flight = 0
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self) -> "ScanHttpPool":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def open(self):
+        if self._client is not None:
+            return
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            follow_redirects=False,
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+                keepalive_expiry=30.0
+            )
+        )
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc.lower()
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = asyncio.Semaphore(self.max_per_host)
+            self._host_slots[host] = slot
+        return slot
+
+    @asynccontextmanager
+    async def _slot(self, url: str) -> AsyncIterator[None]:
+        if self._client is None:
+            raise RuntimeError("ScanHttpPool.open() must be awaited before sending requests")
+
+        wait_start = time.monotonic()
+        # Host slot first: requests queued on one busy host must not hold budget that other hosts could use
+        async with self._host_slot(url), self._budget:
+            self.stats["wait_time"] += time.monotonic() - wait_start
+            self._in_flight += 1
+            self.stats["peak_in_flight"] = max(self.stats["peak_in_flight"], self._in_flight)
+            self.stats["requests"] += 1
+            try:
+                yield
+            except Exception:
+                self.stats["errors"] += 1
+                raise
+            finally:
+                self._in_flight -= 1
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request once both the scan budget and the host have a free slot.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            **kwargs: Passed to httpx.AsyncClient.request (timeout, headers,
+                follow_redirects, ...)
+
+        Returns:
+            httpx.Response with the body read
+        """
+        async with self._slot(url):
+            response = await self._client.request(method, url, **kwargs)
+            self.stats["bytes"] += len(response.content)
+            return response
+
+    async def get_prefix(self, url: str, max_bytes: int, **kwargs: Any) -> PartialResponse:
+        """GET at most the first max_bytes of url's body.
+
+        Sends a Range header and also stops reading once max_bytes have
+        arrived, for servers that ignore it. 206 responses are reported as 200
+        with the full size taken from Content-Range, and 416 (an empty body
+        cannot satisfy the range) as an empty 200.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            url: Absolute URL
+            max_bytes: Body bytes to read
+            **kwargs: Passed to httpx.AsyncClient.stream (headers,
+                follow_redirects, ...)
+
+        Returns:
+            PartialResponse with up to max_bytes of (decoded) body
+        """
+        headers = {**kwargs.pop("headers", {}), "Range": f"bytes=0-{max_bytes - 1}"}
+        async with self._slot(url):
+            async with self._client.stream("GET", url, headers=headers, **kwargs) as response:
+                chunks = []
+                received = 0
+                complete = True
+                async for chunk in response.aiter_bytes():
+                    chunks.append(chunk)
+                    received += len(chunk)
+                    if received >= max_bytes:
+                        complete = False
+                        break
+            self.stats["bytes"] += received
+
+        content = b"".join(chunks)[:max_bytes]
+        status = response.status_code
+        total = response.headers.get("content-range", "").rpartition("/")[2]
+        if status in (206, 416):
+            complete = status == 416 or (total.isdigit() and int(total) <= len(content))
+            status = 200
+        if total.isdigit():
+            content_length = int(total)
+        elif complete:
+            content_length = len(content)
+        else:
+            content_length = int(response.headers.get("content-length") or len(content))
+        return PartialResponse(status, response.headers, str(response.url), content, content_length, complete)
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def head(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("HEAD", url, **kwargs)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "wait_time": round(self.stats["wait_time"], 3),
+            "hosts": len(self._host_slots),
+            "http2": self.http2,
+            "max_concurrency": self.max_concurrency
+        }
+
+    def log_stats(self, label: str):
+        stats = self.get_stats()
+        logger.info(
+            f"[ScanHttpPool] [{label}] {stats['requests']} requests to {stats['hosts']} hosts, "
+            f"{stats['bytes'] / 1024:.1f} KB received, {stats['errors']} errors, peak in flight {stats['peak_in_flight']}/{self.max_concurrency}, "
+            f"http2={self.http2}"
+        )
@@ -0,0 +1,246 @@
+"""Low-transfer existence probes for sensitive paths.
+
+WebRecon's file, config, VCS and admin panel checks used to GET every
+candidate path in full, downloading whole backups, logs and error pages just
+to decide whether a path exists. PathProber answers the same question with as
+little transfer as possible:
+
+- A HEAD request first. 404/410 answers are discarded with no body at all.
+- A soft-404 baseline per origin. A random path is fetched once per scan; on
+  hosts that answer unknown paths with 200, 403 or a redirect instead of 404,
+  candidates whose response matches the baseline (same status and redirect
+  target, or same length allowing for an echoed path, or a near-identical
+  body once the template shared with the baseline is set aside) are
+  discarded. A body with a login form or one of the caller's indicators that
+  the baseline lacks is never treated as a soft-404.
+- A ranged GET of the first WEB_RECON_PROBE_BYTES of the body. Classification
+  (previews, secret keywords, login forms) only needs the start of the body.
+- Conditional requests. ETag/Last-Modified of probed paths are kept across
+  scans, so a rescan sends If-None-Match/If-Modified-Since and reuses the
+  stored response prefix when the server answers 304.
+
+This module does not use custom DSA concepts from app.core.dsa.
+"""
+
+import asyncio
+import difflib
+import os
+import secrets
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from loguru import logger
+
+from app.config import settings
+from app.collectors.http_pool import PartialResponse, ScanHttpPool
+
+
+HEAD_UNSUPPORTED = (400, 405, 501)
+
+LOGIN_FORM_MARKERS = ('type="password"', "type='password'", "type=password")
+
+
+@dataclass
+class Soft404Baseline:
+    path: str
+    status_code: int
+    redirected_to: Optional[str]
+    content_length: Optional[int]
+    body: str
+
+    def length_matches(self, length: int, path: str) -> bool:
+        # Error pages often echo the requested path once, so allow for the difference in path length
+        if self.content_length is None:
+            return False
+        return length in (self.content_length, self.content_length - len(self.path) + len(path))
+
+
+class ValidatorCache:
+    """Response prefixes of probed URLs that carry an ETag or Last-Modified, kept across scans."""
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries or settings.WEB_RECON_VALIDATOR_CACHE_SIZE
+        self._entries: "OrderedDict[str, PartialResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[PartialResponse]:
+        with self._lock:
+            response = self._entries.get(url)
+            if response is not None:
+                self._entries.move_to_end(url)
+            return response
+
+    def put(self, url: str, response: PartialResponse):
+        if not (response.headers.get("etag") or response.headers.get("last-modified")):
+            return
+        with self._lock:
+            self._entries[url] = response
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, url: str):
+        with self._lock:
+            self._entries.pop(url, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class PathProber:
+
+    def __init__(self, pool: ScanHttpPool, validators: ValidatorCache, max_bytes: Optional[int] = None):
+        self.pool = pool
+        self.validators = validators
+        self.max_bytes = max_bytes or settings.WEB_RECON_PROBE_BYTES
+        self.stats = {"head": 0, "ranged_get": 0, "not_found": 0, "soft_404": 0, "not_modified": 0}
+        self._baselines: Dict[Tuple[str, bool], asyncio.Future] = {}
+
+    @staticmethod
+    def _strip(value: str, path: str) -> str:
+        # Error pages and login redirects often echo the requested path, which would defeat the comparison
+        return value.replace(path, "") if path and path != "/" else value
+
+    @staticmethod
+    def _redirect_target(requested: str, final: str, path: str) -> Optional[str]:
+        return PathProber._strip(final, path) if final != requested else None
+
+    async def _fetch_baseline(self, origin: str, follow_redirects: bool) -> Optional[Soft404Baseline]:
+        path = f"/{secrets.token_hex(12)}"
+        url = f"{origin}{path}"
+        try:
+            response = await self.pool.get_prefix(url, self.max_bytes, follow_redirects=follow_redirects)
+        except Exception as e:
+            logger.debug(f"[PathProber] [origin={origin}] Soft-404 baseline request failed: {type(e).__name__}: {e}")
+            return None
+        if response.status_code in (404, 410):
+            return None
+        baseline = Soft404Baseline(
+            path,
+            response.status_code,
+            self._redirect_target(url, response.url, path),
+            response.content_length,
+            self._strip(response.text, path)
+        )
+        logger.info(
+            f"[PathProber] [origin={origin}] Unknown paths answer {baseline.status_code}"
+            f"{f' -> {baseline.redirected_to}' if baseline.redirected_to else ''} "
+            f"({baseline.content_length} bytes); filtering soft-404 responses"
+        )
+        return baseline
+
+    async def _baseline(self, url: str, follow_redirects: bool) -> Optional[Soft404Baseline]:
+        parts = urlsplit(url)
+        key = (f"{parts.scheme}://{parts.netloc}", follow_redirects)
+        future = self._baselines.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch_baseline(*key))
+            self._baselines[key] = future
+        return await asyncio.shield(future)
+
+    def _matches_head(self, baseline: Optional[Soft404Baseline], url: str, head: Any) -> bool:
+        if baseline is None or head.status_code != baseline.status_code:
+            return False
+        path = urlsplit(url).path
+        redirected_to = self._redirect_target(url, str(head.url), path)
+        if redirected_to is not None or baseline.redirected_to is not None:
+            return redirected_to == baseline.redirected_to
+        length = head.headers.get("content-length")
+        return length is not None and length.isdigit() and baseline.length_matches(int(length), path)
+
+    @staticmethod
+    def _unique_part(body: str, baseline_body: str) -> Tuple[str, str]:
+        # Themed error pages share the site's <head> and nav with real pages, so only compare what follows
+        prefix = len(os.path.commonprefix([body, baseline_body]))
+        return body[prefix:], baseline_body[prefix:]
+
+    def _matches_body(
+        self,
+        baseline: Optional[Soft404Baseline],
+        url: str,
+        response: PartialResponse,
+        indicators: Sequence[str] = ()
+    ) -> bool:
+        if baseline is None or response.status_code != baseline.status_code:
+            return False
+        path = urlsplit(url).path
+        redirected_to = self._redirect_target(url, response.url, path)
+        if redirected_to is not None or baseline.redirected_to is not None:
+            return redirected_to == baseline.redirected_to
+        body = self._strip(response.text, path)
+        if body == baseline.body:
+            return True
+        body_lower = body.lower()
+        baseline_lower = baseline.body.lower()
+        for marker in LOGIN_FORM_MARKERS + tuple(indicators):
+            if marker in body_lower and marker not in baseline_lower:
+                return False
+        body_rest, baseline_rest = self._unique_part(body, baseline.body)
+        return difflib.SequenceMatcher(None, body_rest[:2048], baseline_rest[:2048]).ratio() >= 0.9
+
+    async def fetch(
+        self,
+        url: str,
+        follow_redirects: bool = False,
+        indicators: Sequence[str] = ()
+    ) -> Optional[PartialResponse]:
+        """Fetch the start of url's body unless the path clearly does not exist.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            url: Candidate URL
+            follow_redirects: Follow redirects for the HEAD, GET and baseline
+            indicators: Lowercase strings that mark a real hit; a body containing one
+                the baseline lacks is never discarded as a soft-404
+
+        Returns:
+            PartialResponse (not_modified=True when reused after a 304), or
+            None for 404/410 and soft-404 responses
+        """
+        previous = self.validators.get(url)
+        if previous is not None:
+            headers = {}
+            if previous.headers.get("etag"):
+                headers["If-None-Match"] = previous.headers["etag"]
+            if previous.headers.get("last-modified"):
+                headers["If-Modified-Since"] = previous.headers["last-modified"]
+            self.stats["ranged_get"] += 1
+            response = await self.pool.get_prefix(url, self.max_bytes, headers=headers, follow_redirects=follow_redirects)
+            if response.status_code == 304:
+                self.stats["not_modified"] += 1
+                return replace(previous, not_modified=True)
+        else:
+            self.stats["head"] += 1
+            head = await self.pool.head(url, follow_redirects=follow_redirects)
+            if head.status_code in (404, 410):
+                self.stats["not_found"] += 1
+                return None
+            if head.status_code not in HEAD_UNSUPPORTED:
+                if self._matches_head(await self._baseline(url, follow_redirects), url, head):
+                    self.stats["soft_404"] += 1
+                    return None
+            self.stats["ranged_get"] += 1
+            response = await self.pool.get_prefix(url, self.max_bytes, follow_redirects=follow_redirects)
+
+        if response.status_code in (404, 410):
+            self.stats["not_found"] += 1
+            self.validators.discard(url)
+            return None
+        if self._matches_body(await self._baseline(url, follow_redirects), url, response, indicators):
+            self.stats["soft_404"] += 1
+            self.validators.discard(url)
+            return None
+        self.validators.put(url, response)
+        return response
+
+    def log_stats(self, label: str):
+        logger.info(
+            f"[PathProber] [{label}] {self.stats['head']} HEAD, {self.stats['ranged_get']} ranged GET - "
+            f"not found: {self.stats['not_found']}, soft-404: {self.stats['soft_404']}, "
+            f"not modified: {self.stats['not_modified']}"
+        )
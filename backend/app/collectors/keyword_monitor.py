@@ -4,7 +4,8 @@ This module provides keyword-based content monitoring with priority-based alerti
 and match history tracking for threat intelligence gathering.
 
 This module uses the following DSA concepts from app.core.dsa:
-- Trie: Keyword storage for efficient prefix matching and autocomplete
+- Trie: Keyword storage for efficient prefix matching and autocomplete, and
+  Aho-Corasick automatons scanning content once for every rule's terms
 - MaxHeap: Alert priority queue for severity-based alert ranking
 - DoublyLinkedList: Match history for chronological event tracking
 - HashMap: Rule storage, match storage, alert storage, and keyword-rule mapping for O(1) lookups
@@ -156,6 +157,10 @@ class KeywordMonitor:
 
         self.keyword_trie = Trie()
         
+        # Aho-Corasick automatons over every rule keyword and exclude keyword
+        self.folded_terms = Trie()
+        self.exact_terms = Trie()
+        
 
         self.rules = HashMap()
         
@@ -204,9 +209,14 @@ class KeywordMonitor:
         self.rules.put(rule.rule_id, rule)  # DSA-USED: HashMap
         
 
+        terms = self.exact_terms if rule.case_sensitive else self.folded_terms
+        for exclude in rule.exclude_keywords:
+            terms.insert(exclude if rule.case_sensitive else exclude.lower())  # DSA-USED: Trie
+        
         for keyword in rule.keywords:
             kw_lower = keyword.lower() if not rule.case_sensitive else keyword
             self.keyword_trie.insert(kw_lower)  # DSA-USED: Trie
+            terms.insert(kw_lower)  # DSA-USED: Trie
             
 
             existing = self.keyword_rules.get(kw_lower)  # DSA-USED: HashMap
@@ -264,11 +274,29 @@ class KeywordMonitor:
         self.stats["rules_count"] -= 1
         return True
     
+    def _find_terms(self, content: str) -> Dict[bool, Set[str]]:
+        """Find every rule term present in content with one pass per automaton.
+        
+        DSA-USED:
+        - Trie: Aho-Corasick scan, O(n + z) for any number of rule terms
+        
+        Args:
+            content: Content to scan
+        
+        Returns:
+            Dictionary mapping case_sensitive (True/False) to the set of terms found
+        """
+        return {
+            False: self.folded_terms.find_keys_in_text(content, fold_case=True) if len(self.folded_terms) else set(),  # DSA-USED: Trie
+            True: self.exact_terms.find_keys_in_text(content) if len(self.exact_terms) else set()  # DSA-USED: Trie
+        }
+    
     def _check_rule(
         self,
         rule: MonitorRule,
         content: str,
-        source_type: SourceType
+        source_type: SourceType,
+        found_terms: Optional[Dict[bool, Set[str]]] = None
     ) -> Optional[Dict[str, Any]]:
         
         if not rule.enabled:
@@ -278,12 +306,14 @@ class KeywordMonitor:
         if rule.source_filter and source_type not in rule.source_filter:
             return None
         
-        content_check = content if rule.case_sensitive else content.lower()
+        if found_terms is None:
+            found_terms = self._find_terms(content)
+        terms = found_terms[rule.case_sensitive]
         
 
         for exclude in rule.exclude_keywords:
             exclude_check = exclude if rule.case_sensitive else exclude.lower()
-            if exclude_check in content_check:
+            if exclude_check in terms:
                 return None
         
         matched_keywords = []
@@ -292,7 +322,7 @@ class KeywordMonitor:
 
         for keyword in rule.keywords:
             kw_check = keyword if rule.case_sensitive else keyword.lower()
-            if kw_check in content_check:
+            if kw_check in terms:
                 matched_keywords.append(keyword)
         
 
@@ -373,6 +403,7 @@ class KeywordMonitor:
         
         self.stats["content_scanned"] += 1
         matches = []
+        found_terms = self._find_terms(content)
         
 
         for rule_id in self.rules.keys():
@@ -380,7 +411,7 @@ class KeywordMonitor:
             if not rule:
                 continue
             
-            match_result = self._check_rule(rule, content, source_type)
+            match_result = self._check_rule(rule, content, source_type, found_terms)
             if not match_result:
                 continue
             
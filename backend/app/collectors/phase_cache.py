@@ -0,0 +1,111 @@
+"""TTL cache of scan phase results, keyed by domain and phase.
+
+WebRecon kept every finished scan in a HashMap that never expired, and
+deduplicated URLs with a process-lifetime Bloom filter, so a second scan of
+a domain skipped everything the first one had seen and came back empty.
+PhaseResultCache stores each phase's result on its own with an expiry time.
+A rescan reuses the phases whose results are still fresh and only re-runs
+(re-probes) the phases that expired, so repeated scheduled scans of the same
+domain stay cheap without ever returning stale-forever or empty results.
+
+This module uses the following DSA concepts from app.core.dsa:
+- HashMap: O(1) lookup of cached phase results by "domain|phase" key
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from app.config import settings
+from app.core.dsa import HashMap
+
+
+class PhaseResultCache:
+
+    def __init__(self, ttl: Optional[float] = None, max_entries: Optional[int] = None):
+        self.ttl = settings.WEB_RECON_CACHE_TTL if ttl is None else ttl
+        self.max_entries = max_entries or settings.WEB_RECON_CACHE_MAX_ENTRIES
+        self._entries = HashMap()  # "domain|phase" -> (expires, stored_at, items)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(domain: str, phase: str) -> str:
+        return f"{domain.strip().lower()}|{phase}"
+
+    def get(self, domain: str, phase: str) -> Optional[List[Dict[str, Any]]]:
+        """Fresh result of one phase for domain.
+
+        DSA-USED:
+        - HashMap: O(1) entry lookup
+
+        Args:
+            domain: Scanned domain
+            phase: Phase result key (e.g. 'subdomains')
+
+        Returns:
+            Cached items, or None if missing or expired
+        """
+        key = self._key(domain, phase)
+        with self._lock:
+            entry = self._entries.get(key)  # DSA-USED: HashMap
+            if entry is None or entry[0] <= time.time():
+                if entry is not None:
+                    self._entries.remove(key)  # DSA-USED: HashMap
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[2]
+
+    def fresh(self, domain: str, phases: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        cached = {}
+        for phase in phases:
+            items = self.get(domain, phase)
+            if items is not None:
+                cached[phase] = items
+        return cached
+
+    def put(self, domain: str, phase: str, items: List[Dict[str, Any]]):
+        """Cache one phase result for domain until the TTL runs out.
+
+        DSA-USED:
+        - HashMap: O(1) insert; expired and then oldest entries are evicted
+          when the cache is full
+
+        Args:
+            domain: Scanned domain
+            phase: Phase result key
+            items: Phase result
+        """
+        if self.ttl <= 0:
+            return
+        now = time.time()
+        with self._lock:
+            self._entries.put(self._key(domain, phase), (now + self.ttl, now, items))  # DSA-USED: HashMap
+            if len(self._entries) > self.max_entries:
+                for key, entry in list(self._entries.items()):
+                    if entry[0] <= now:
+                        self._entries.remove(key)
+                while len(self._entries) > self.max_entries:
+                    oldest = min(self._entries.items(), key=lambda item: item[1][1])[0]
+                    self._entries.remove(oldest)
+
+    def invalidate(self, domain: Optional[str] = None):
+        with self._lock:
+            if domain is None:
+                self._entries.clear()
+                return
+            prefix = self._key(domain, "")
+            for key in [key for key in self._entries.keys() if key.startswith(prefix)]:
+                self._entries.remove(key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "domains": len({key.split("|", 1)[0] for key in self._entries.keys()}),
+                "hits": self.hits,
+                "misses": self.misses,
+                "ttl": self.ttl
+            }
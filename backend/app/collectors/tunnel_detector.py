@@ -17,6 +17,7 @@ from enum import Enum
 import hashlib
 import re
 import math
+import time
 from collections import deque
 
 import sys
@@ -163,6 +164,10 @@ class TunnelDetector:
         r'X-CMD:\s*(read|write)'
     ]
     
+
+    SNAPSHOT_VERSION = 1
+    TIMING_WINDOW = 100
+    
     def __init__(self, buffer_size: int = 10000):
         
 
@@ -382,7 +387,7 @@ class TunnelDetector:
         timing.append(request.timestamp)
         
 
-        if len(timing) > 100:
+        if len(timing) > self.TIMING_WINDOW:
             timing.pop(0)
     
     def _check_suspicious_headers(self, headers: Dict[str, str]) -> List[str]:
@@ -561,6 +566,127 @@ class TunnelDetector:
         
         return detection
     
+    def export_snapshot(self) -> Dict[str, Any]:
+        """Export long-lived detector state as msgpack-friendly primitives.
+        
+        Only state that takes time to rebuild is exported: per-connection
+        stats, the timing ring used for beaconing detection, beacon patterns
+        and counters. Timestamps are stored as epoch floats.
+        
+        DSA-USED:
+        - HashMap: Iteration over connection, timing and beacon maps
+        
+        Returns:
+            Dictionary containing the versioned detector snapshot
+        """
+        connections = []
+        for conn_key, conn in self.connections.items():  # DSA-USED: HashMap
+            timing = self.timing_data.get(conn_key) or []  # DSA-USED: HashMap
+            connections.append([
+                conn_key,
+                conn["first_seen"].timestamp(),
+                conn["last_seen"].timestamp(),
+                conn["request_count"],
+                conn["total_bytes_sent"],
+                conn["total_bytes_received"],
+                sorted(conn["methods"]),
+                list(conn["uris"]),
+                [ts.timestamp() for ts in timing]
+            ])
+        
+        beacons = []
+        for pattern in self.beacons.values():  # DSA-USED: HashMap
+            beacons.append([
+                pattern.pattern_id,
+                pattern.source_ip,
+                pattern.destination,
+                pattern.interval_seconds,
+                pattern.interval_variance,
+                pattern.confidence,
+                pattern.sample_count,
+                pattern.first_seen.timestamp(),
+                pattern.last_seen.timestamp()
+            ])
+        
+        return {
+            "version": self.SNAPSHOT_VERSION,
+            "created_at": time.time(),
+            "stats": dict(self.stats),
+            "connections": connections,
+            "beacons": beacons
+        }
+    
+    def restore_snapshot(self, snapshot: Dict[str, Any], max_seconds: Optional[float] = None) -> int:
+        """Restore state produced by export_snapshot.
+        
+        Connections are restored most-recently-active first, so when the
+        time budget runs out the entries most likely to still be beaconing
+        are the ones that survived.
+        
+        DSA-USED:
+        - HashMap: Connection, timing and beacon state storage
+        
+        Args:
+            snapshot: Dictionary produced by export_snapshot
+            max_seconds: Optional wall-clock budget for the restore
+        
+        Returns:
+            Number of connections restored
+        
+        Raises:
+            ValueError: If the snapshot version is not supported
+        """
+        version = snapshot.get("version")
+        if version != self.SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported tunnel detector snapshot version: {version}")
+        
+        deadline = time.monotonic() + max_seconds if max_seconds else None
+        
+        for key, value in (snapshot.get("stats") or {}).items():
+            if key in self.stats:
+                self.stats[key] = value
+        
+        connections = sorted(snapshot.get("connections") or [], key=lambda c: c[2], reverse=True)
+        restored = 0
+        for entry in connections:
+            if deadline is not None and time.monotonic() > deadline:
+                break
+            (conn_key, first_seen, last_seen, request_count,
+             bytes_sent, bytes_received, methods, uris, timing) = entry
+            self.connections.put(conn_key, {  # DSA-USED: HashMap
+                "first_seen": datetime.fromtimestamp(first_seen),
+                "last_seen": datetime.fromtimestamp(last_seen),
+                "request_count": request_count,
+                "total_bytes_sent": bytes_sent,
+                "total_bytes_received": bytes_received,
+                "methods": set(methods),
+                "uris": set(uris)
+            })
+            self.timing_data.put(  # DSA-USED: HashMap
+                conn_key,
+                [datetime.fromtimestamp(ts) for ts in timing[-self.TIMING_WINDOW:]]
+            )
+            restored += 1
+        
+        for entry in snapshot.get("beacons") or []:
+            if deadline is not None and time.monotonic() > deadline:
+                break
+            (pattern_id, source_ip, destination, interval_seconds, interval_variance,
+             confidence, sample_count, first_seen, last_seen) = entry
+            self.beacons.put(pattern_id, BeaconingPattern(  # DSA-USED: HashMap
+                pattern_id=pattern_id,
+                source_ip=source_ip,
+                destination=destination,
+                interval_seconds=interval_seconds,
+                interval_variance=interval_variance,
+                confidence=confidence,
+                sample_count=sample_count,
+                first_seen=datetime.fromtimestamp(first_seen),
+                last_seen=datetime.fromtimestamp(last_seen)
+            ))
+        
+        return restored
+    
     def get_detections(
         self,
         tunnel_type: Optional[TunnelType] = None,
@@ -5,20 +5,28 @@ and URL discovery with efficient deduplication and pattern matching.
 
 This module uses the following DSA concepts from app.core.dsa:
 - Trie: Dork pattern storage for efficient prefix matching and autocomplete
-- HashMap: URL and result caching for O(1) lookups
-- BloomFilter: URL deduplication during crawling to avoid reprocessing seen URLs
+- HashMap: Per-domain, per-phase result caching with TTL (via PhaseResultCache)
+- BloomFilter: Subdomain wordlist deduplication within a scan
 """
 
 import asyncio
 import re
-import socket
-from typing import Any, Dict, List, Optional, Callable
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Coroutine, Dict, FrozenSet, Iterable, Iterator, List, Optional, Callable, Tuple, Union
 from urllib.parse import urlparse, urljoin
 from datetime import datetime
 import httpx
 from loguru import logger
 
-from app.core.dsa import Trie, HashMap, BloomFilter
+from app.config import settings
+from app.core.dsa import Trie, CompactBloomFilter
+from app.collectors.dns_resolver import AsyncDNSResolver, get_dns_resolver
+from app.collectors.http_pool import ScanHttpPool
+from app.collectors.http_probe import PathProber, ValidatorCache
+from app.collectors.phase_cache import PhaseResultCache
+from app.collectors.phase_runner import Phase, run_phases
+from app.collectors.subdomain_bruteforce import SubdomainBruteForcer, iter_wordlist
 
 
 class WebRecon:
@@ -102,11 +110,172 @@ class WebRecon:
         'site:{domain} intitle:"parent directory"',
     ]
     
-    def __init__(self):
+    # Built-in brute force wordlist, used when WEB_RECON_SUBDOMAIN_WORDLIST is not set
+    SUBDOMAIN_WORDLIST = [
+        'www', 'mail', 'email', 'webmail', 'smtp', 'pop', 'imap',
+        'ftp', 'sftp', 'ssh', 'vpn', 'remote', 'secure',
+        'ns1', 'ns2', 'dns', 'mx', 'mx1', 'mx2',
+        'server', 'servers', 'host', 'hosting',
+        'dev', 'development', 'staging', 'stage', 'test', 'testing',
+        'qa', 'prod', 'production', 'preprod', 'pre-prod',
+        'api', 'api1', 'api2', 'apis', 'rest', 'graphql',
+        'cdn', 'static', 'assets', 'media', 'files', 'download',
+        'upload', 'storage', 'backup', 'backups',
+        'app', 'apps', 'application', 'portal', 'dashboard',
+        'admin', 'administrator', 'panel', 'cpanel', 'whm',
+        'blog', 'blogs', 'forum', 'forums', 'wiki', 'docs',
+        'documentation', 'help', 'support', 'status', 'monitor',
+        'jenkins', 'gitlab', 'github', 'git', 'svn', 'hg',
+        'ci', 'cd', 'deploy', 'deployment',
+        'mobile', 'm', 'wap', 'old', 'new', 'legacy',
+        'shop', 'store', 'payment', 'pay', 'billing',
+        'auth', 'login', 'signin', 'account', 'accounts',
+    ]
+    
+    # Result key -> human readable phase name, in the order phases are started
+    PHASE_LABELS = {
+        "subdomains": "Subdomain enumeration",
+        "endpoints": "Endpoint scanning",
+        "files": "Sensitive file detection",
+        "source_code": "Source code exposure detection",
+        "admin_panels": "Admin panel discovery",
+        "configs": "Configuration file detection",
+    }
+    
+    # Endpoint scan paths (any non-404 answer is reported)
+    ENDPOINT_PATHS = [
+
+        '/.git/config', '/.git/HEAD', '/.git/index',
+        '/.svn/entries', '/.svn/wc.db',
+        '/.hg/requires',
+
+        '/.env', '/.env.local', '/.env.production',
+        '/config.php', '/config.inc.php', '/configuration.php',
+        '/web.config', '/.htaccess', '/.htpasswd',
+
+        '/admin', '/administrator', '/wp-admin', '/wp-login.php',
+        '/login', '/signin', '/auth', '/dashboard',
+        '/phpmyadmin', '/pma', '/adminer.php',
+        '/cpanel', '/whm', '/plesk',
+
+        '/api', '/api/v1', '/api/v2', '/graphql',
+        '/swagger', '/swagger.json', '/swagger.yaml',
+        '/openapi.json', '/openapi.yaml',
+        '/docs', '/documentation', '/api-docs',
+
+        '/phpinfo.php', '/info.php', '/test.php',
+        '/server-status', '/server-info',
+        '/.well-known/security.txt', '/security.txt',
+
+        '/robots.txt', '/sitemap.xml', '/sitemap.txt',
+        '/backup', '/backups', '/old', '/archive',
+        '/dump', '/sql', '/database',
+
+        '/.DS_Store', '/Thumbs.db',
+    ]
+    
+    # Sensitive files reported when served with 200
+    SENSITIVE_FILES = [
+
+        '/.env', '/.env.local', '/.env.production', '/.env.development',
+        '/.env.test', '/.env.staging',
+
+        '/config.json', '/config.yml', '/config.yaml',
+        '/settings.json', '/settings.py', '/settings.php',
+        '/application.properties', '/application.yml',
+
+        '/id_rsa', '/id_dsa', '/id_ecdsa', '/id_ed25519',
+        '/private.key', '/public.key', '/key.pem',
+        '/certificate.pem', '/cert.pem',
+
+        '/database.sql', '/dump.sql', '/backup.sql',
+        '/db.sqlite', '/database.db',
+
+        '/backup.tar.gz', '/backup.zip', '/backup.rar',
+        '/backup.bak', '/backup.old',
+
+        '/error.log', '/access.log', '/debug.log',
+        '/application.log', '/server.log',
+
+        '/.htpasswd', '/.gitignore', '/.dockerignore',
+        '/composer.json', '/package.json', '/requirements.txt',
+    ]
+    
+    # (path, VCS type) files that reveal an exposed repository
+    VCS_INDICATORS = [
+
+        ('/.git/config', 'git'),
+        ('/.git/HEAD', 'git'),
+        ('/.git/index', 'git'),
+        ('/.git/logs/HEAD', 'git'),
+
+        ('/.svn/entries', 'svn'),
+        ('/.svn/wc.db', 'svn'),
+
+        ('/.hg/requires', 'hg'),
+        ('/.hg/hgrc', 'hg'),
+
+        ('/.bzr/README', 'bzr'),
+        ('/_darcs/README', 'darcs'),
+    ]
+    
+    # (path, panel name) admin and login panels
+    ADMIN_PATHS = [
+
+        ('/wp-admin', 'WordPress Admin'),
+        ('/wp-login.php', 'WordPress Login'),
+
+        ('/administrator', 'Joomla Admin'),
+
+        ('/user/login', 'Drupal Login'),
+
+        ('/admin', 'Generic Admin'),
+        ('/admin/login', 'Admin Login'),
+        ('/administrator/login', 'Administrator Login'),
+        ('/login', 'Login Page'),
+        ('/signin', 'Sign In'),
+        ('/dashboard', 'Dashboard'),
+
+        ('/phpmyadmin', 'phpMyAdmin'),
+        ('/pma', 'phpMyAdmin (alt)'),
+        ('/adminer.php', 'Adminer'),
+
+        ('/cpanel', 'cPanel'),
+        ('/whm', 'WHM'),
+        ('/plesk', 'Plesk'),
+
+        ('/manager', 'Tomcat Manager'),
+        ('/jenkins', 'Jenkins'),
+        ('/gitlab', 'GitLab'),
+    ]
+    
+    # Body keywords that mark an admin panel response as a login page
+    LOGIN_KEYWORDS = ['login', 'password', 'username', 'sign in', 'log in']
+    
+    # Configuration files reported when they look like configuration
+    CONFIG_FILES = [
+        '/config.php', '/config.inc.php', '/configuration.php',
+        '/config.json', '/config.yml', '/config.yaml',
+        '/settings.php', '/settings.py', '/settings.json',
+        '/application.properties', '/application.yml',
+        '/application.yaml', '/application.conf',
+        '/web.config', '/.htaccess', '/.htpasswd',
+        '/.env', '/.env.production', '/.env.local',
+    ]
+    
+    # A URL listed by several phases is probed and reported only by the first phase here that lists it:
+    # specific checks win over the generic endpoint scan, and the file check (which reports every 200)
+    # wins over the config check (which drops files that don't look like configuration)
+    URL_OWNER_PRIORITY = ["source_code", "files", "configs", "admin_panels", "endpoints"]
+    
+    def __init__(self, resolver: Optional[AsyncDNSResolver] = None):
         """Initialize web recon collector with DSA structures."""
+        self._resolver = resolver or get_dns_resolver()
         self._dork_trie = Trie()  # Dork pattern storage
-        self._asset_cache = HashMap()  # Asset caching
-        self._seen_urls = BloomFilter(expected_items=100000)  # URL deduplication
+        self._asset_cache = PhaseResultCache()  # Per-phase result caching with TTL
+        self._validators = ValidatorCache()  # ETag/Last-Modified of probed paths, kept across scans
+        self._probers: "weakref.WeakKeyDictionary[ScanHttpPool, PathProber]" = weakref.WeakKeyDictionary()
+        self._url_owners: "weakref.WeakKeyDictionary[ScanHttpPool, Dict[str, str]]" = weakref.WeakKeyDictionary()
         self._results = []
         
         # Index all dork patterns for search
@@ -114,36 +283,32 @@ class WebRecon:
             self._dork_trie.insert(pattern, pattern)  # DSA-USED: Trie
     
     async def _resolve_dns(self, hostname: str, timeout: float = 2.0) -> bool:
-        try:
-            loop = asyncio.get_event_loop()
-            await asyncio.wait_for(
-                loop.run_in_executor(
-                    None,
-                    lambda: socket.getaddrinfo(hostname, None, socket.AF_INET, socket.SOCK_STREAM)
-                ),
-                timeout=timeout
-            )
-            return True
-        except (socket.gaierror, asyncio.TimeoutError, OSError):
-            return False
-        except Exception:
-            return False
+        return await self._resolver.host_exists(hostname, lifetime=timeout)
     
     async def discover_assets(
         self, 
         domain: str, 
-        progress_callback: Optional[Callable[[int, str], None]] = None
+        progress_callback: Optional[Callable[[int, str], None]] = None,
+        on_phase_complete: Optional[Callable[[str, List[Dict[str, Any]]], Awaitable[None]]] = None,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """Discover assets for a domain using web reconnaissance.
         
+        Discovery phases run concurrently under one shared request budget;
+        progress is reported as each phase finishes. Phases whose result for
+        this domain is still cached are reused instead of re-probed.
+        
         DSA-USED:
         - Trie: Dork pattern storage and matching
-        - HashMap: Asset result caching
-        - BloomFilter: URL deduplication during crawling
+        - HashMap: Per-phase result caching with TTL
+        - BloomFilter: Wordlist deduplication during subdomain brute force
         
         Args:
             domain: Domain to analyze
             progress_callback: Optional callback for progress updates
+            on_phase_complete: Optional coroutine called with (result key, items)
+                as soon as each phase finishes, e.g. to stream findings
+            use_cache: Reuse unexpired phase results from earlier scans
         
         Returns:
             Dictionary with discovered assets
@@ -167,6 +332,9 @@ class WebRecon:
             "third_parties": []
         }
         
+        # One connection pool and request budget for every phase of this scan
+        pool = ScanHttpPool()
+        await pool.open()
         try:
             if progress_callback:
                 logger.info(f"[WebRecon] [domain={domain}] Calling progress_callback(5, 'Initializing discovery...')")
@@ -181,126 +349,62 @@ class WebRecon:
             logger.info(f"[WebRecon] [domain={domain}] Sample dorks (first 3): {dorks[:3]}")
             
             if progress_callback:
-                logger.info(f"[WebRecon] [domain={domain}] Calling progress_callback(10, 'Enumerating subdomains...')")
-                progress_callback(10, "Enumerating subdomains...")
-            
-            subdomain_start = time.time()
-            logger.info(f"[WebRecon] [domain={domain}] Starting subdomain enumeration...")
-            try:
-                subdomains = await self._enumerate_subdomains(domain)
-                subdomain_time = time.time() - subdomain_start
-                results["subdomains"] = subdomains
-                logger.info(f"[WebRecon] [domain={domain}] Discovered {len(subdomains)} subdomains in {subdomain_time:.3f}s")
-                if subdomains:
-                    logger.info(f"[WebRecon] [domain={domain}] Sample subdomains (first 5): {[s.get('subdomain') for s in subdomains[:5]]}")
-            except Exception as e:
-                subdomain_time = time.time() - subdomain_start
-                logger.error(f"[WebRecon] [domain={domain}] Subdomain enumeration failed after {subdomain_time:.3f}s: {e}", exc_info=True)
-                results["subdomains"] = []
+                logger.info(f"[WebRecon] [domain={domain}] Calling progress_callback(10, 'Running discovery phases...')")
+                progress_callback(10, "Running discovery phases...")
             
-            if progress_callback:
-                logger.info(f"[WebRecon] [domain={domain}] Calling progress_callback(30, 'Scanning endpoints...')")
-                progress_callback(30, "Scanning endpoints...")
-            
-            endpoint_start = time.time()
-            logger.info(f"[WebRecon] [domain={domain}] Starting endpoint scanning...")
-            try:
-                endpoints = await self._check_endpoints(domain)
-                endpoint_time = time.time() - endpoint_start
-                results["endpoints"] = endpoints
-                logger.info(f"[WebRecon] [domain={domain}] Discovered {len(endpoints)} endpoints in {endpoint_time:.3f}s")
-                if endpoints:
-                    logger.info(f"[WebRecon] [domain={domain}] Sample endpoints (first 5): {[e.get('path') for e in endpoints[:5]]}")
-            except Exception as e:
-                endpoint_time = time.time() - endpoint_start
-                logger.error(f"[WebRecon] [domain={domain}] Endpoint scanning failed after {endpoint_time:.3f}s: {e}", exc_info=True)
-                results["endpoints"] = []
-            
-            if progress_callback:
-                logger.info(f"[WebRecon] [domain={domain}] Calling progress_callback(50, 'Detecting sensitive files...')")
-                progress_callback(50, "Detecting sensitive files...")
-            
-            file_start = time.time()
-            logger.info(f"[WebRecon] [domain={domain}] Starting sensitive file detection...")
-            try:
-                files = await self._detect_sensitive_files(domain)
-                file_time = time.time() - file_start
-                results["files"] = files
-                logger.info(f"[WebRecon] [domain={domain}] Detected {len(files)} sensitive files in {file_time:.3f}s")
-                if files:
-                    logger.info(f"[WebRecon] [domain={domain}] Sample files (first 5): {[f.get('path') for f in files[:5]]}")
-            except Exception as e:
-                file_time = time.time() - file_start
-                logger.error(f"[WebRecon] [domain={domain}] Sensitive file detection failed after {file_time:.3f}s: {e}", exc_info=True)
-                results["files"] = []
-            
-            if progress_callback:
-                logger.info(f"[WebRecon] [domain={domain}] Calling progress_callback(65, 'Checking for source code exposure...')")
-                progress_callback(65, "Checking for source code exposure...")
-            
-
-            source_start = time.time()
-            logger.info(f"[WebRecon] [domain={domain}] Starting source code exposure detection...")
-            try:
-                source_code = await self._detect_source_code_exposure(domain)
-                source_time = time.time() - source_start
-                results["source_code"] = source_code
-                logger.info(f"[WebRecon] [domain={domain}] Found {len(source_code)} source code exposures in {source_time:.3f}s")
-                if source_code:
-                    logger.info(f"[WebRecon] [domain={domain}] Source code exposures: {[s.get('type') + ':' + s.get('path') for s in source_code]}")
-            except Exception as e:
-                source_time = time.time() - source_start
-                logger.error(f"[WebRecon] [domain={domain}] Source code detection failed after {source_time:.3f}s: {e}", exc_info=True)
-                results["source_code"] = []
+            phase_methods = {
+                "subdomains": self._enumerate_subdomains,
+                "endpoints": self._check_endpoints,
+                "files": self._detect_sensitive_files,
+                "source_code": self._detect_source_code_exposure,
+                "admin_panels": self._discover_admin_panels,
+                "configs": self._detect_config_files,
+            }
+            cached = self._asset_cache.fresh(domain, list(phase_methods)) if use_cache else {}  # DSA-USED: HashMap
+            results["cached_phases"] = list(cached)
+            if cached:
+                logger.info(
+                    f"[WebRecon] [domain={domain}] Reusing cached results for {', '.join(cached)}; "
+                    f"re-probing {len(phase_methods) - len(cached)} expired phases"
+                )
             
-            if progress_callback:
-                logger.info(f"[WebRecon] [domain={domain}] Calling progress_callback(75, 'Scanning admin panels...')")
-                progress_callback(75, "Scanning admin panels...")
+            # Decide up front which phase probes each URL, so overlapping paths are probed and reported
+            # once per scan regardless of which phase gets scheduled first
+            self._url_owners[pool] = self._assign_urls(domain)
             
-
-            admin_start = time.time()
-            logger.info(f"[WebRecon] [domain={domain}] Starting admin panel discovery...")
-            try:
-                admin_panels = await self._discover_admin_panels(domain)
-                admin_time = time.time() - admin_start
-                results["admin_panels"] = admin_panels
-                logger.info(f"[WebRecon] [domain={domain}] Discovered {len(admin_panels)} admin panels in {admin_time:.3f}s")
-                if admin_panels:
-                    logger.info(f"[WebRecon] [domain={domain}] Admin panels: {[p.get('name') + ':' + p.get('path') for p in admin_panels]}")
-            except Exception as e:
-                admin_time = time.time() - admin_start
-                logger.error(f"[WebRecon] [domain={domain}] Admin panel discovery failed after {admin_time:.3f}s: {e}", exc_info=True)
-                results["admin_panels"] = []
+            # No phase consumes another's output yet, so all of them run side by side on the shared pool
+            phases = [
+                Phase(
+                    key,
+                    lambda deps, key=key, method=method: (
+                        self._reuse_phase(domain, key, cached[key]) if key in cached
+                        else self._run_phase(domain, key, method(domain, pool))
+                    )
+                )
+                for key, method in phase_methods.items()
+            ]
+            completed = []
             
-            if progress_callback:
-                logger.info(f"[WebRecon] [domain={domain}] Calling progress_callback(85, 'Checking configuration files...')")
-                progress_callback(85, "Checking configuration files...")
+            async def phase_complete(key: str, items: List[Dict[str, Any]]):
+                results[key] = items
+                completed.append(key)
+                if progress_callback:
+                    progress = 10 + (85 * len(completed)) // len(phases)
+                    progress_callback(progress, f"{self.PHASE_LABELS[key]} complete ({len(items)} found)")
+                if on_phase_complete:
+                    await on_phase_complete(key, items)
             
-            config_start = time.time()
-            logger.info(f"[WebRecon] [domain={domain}] Starting configuration file detection...")
-            try:
-                configs = await self._detect_config_files(domain)
-                config_time = time.time() - config_start
-                results["configs"] = configs
-                logger.info(f"[WebRecon] [domain={domain}] Found {len(configs)} configuration files in {config_time:.3f}s")
-                if configs:
-                    logger.info(f"[WebRecon] [domain={domain}] Config files: {[c.get('path') for c in configs[:5]]}")
-            except Exception as e:
-                config_time = time.time() - config_start
-                logger.error(f"[WebRecon] [domain={domain}] Config file detection failed after {config_time:.3f}s: {e}", exc_info=True)
-                results["configs"] = []
+            phases_start = time.time()
+            await run_phases(phases, on_complete=phase_complete)
+            logger.info(
+                f"[WebRecon] [domain={domain}] {len(phases)} discovery phases completed in "
+                f"{time.time() - phases_start:.3f}s (order: {', '.join(completed)})"
+            )
             
             if progress_callback:
                 logger.info(f"[WebRecon] [domain={domain}] Calling progress_callback(95, 'Finalizing results...')")
                 progress_callback(95, "Finalizing results...")
             
-
-            cache_start = time.time()
-            logger.info(f"[WebRecon] [domain={domain}] Caching results...")
-            self._asset_cache.put(domain, results)  # DSA-USED: HashMap
-            cache_time = time.time() - cache_start
-            logger.info(f"[WebRecon] [domain={domain}] Results cached in {cache_time:.3f}s")
-            
             if progress_callback:
                 logger.info(f"[WebRecon] [domain={domain}] Calling progress_callback(100, 'Discovery complete')")
                 progress_callback(100, "Discovery complete")
@@ -322,6 +426,88 @@ class WebRecon:
                 exc_info=True
             )
             raise
+        finally:
+            await pool.aclose()
+            pool.log_stats(domain)
+            self._url_owners.pop(pool, None)
+            prober = self._probers.pop(pool, None)
+            if prober is not None:
+                prober.log_stats(domain)
+    
+    async def _run_phase(
+        self,
+        domain: str,
+        key: str,
+        phase: Coroutine[Any, Any, List[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        
+        import time
+        label = self.PHASE_LABELS[key]
+        phase_start = time.time()
+        logger.info(f"[WebRecon] [domain={domain}] Starting {label.lower()}...")
+        try:
+            items = await phase
+        except Exception as e:
+            logger.error(f"[WebRecon] [domain={domain}] {label} failed after {time.time() - phase_start:.3f}s: {e}", exc_info=True)
+            return []
+        # Failed phases are not cached, so the next scan retries them
+        self._asset_cache.put(domain, key, items)  # DSA-USED: HashMap
+        logger.info(f"[WebRecon] [domain={domain}] {label} found {len(items)} {key} in {time.time() - phase_start:.3f}s")
+        return items
+    
+    async def _reuse_phase(self, domain: str, key: str, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        
+        logger.info(f"[WebRecon] [domain={domain}] {self.PHASE_LABELS[key]} reused {len(items)} cached {key}")
+        return items
+    
+    def _scan_seen(self, expected_items: int = 10000) -> CompactBloomFilter:
+        
+        # Scoped to one phase run of one scan, so rescans probe everything again
+        return CompactBloomFilter(expected_items=expected_items)
+    
+    def _phase_paths(self, key: str) -> List[str]:
+        
+        return {
+            "source_code": [path for path, _ in self.VCS_INDICATORS],
+            "configs": self.CONFIG_FILES,
+            "files": self.SENSITIVE_FILES,
+            "admin_panels": [path for path, _ in self.ADMIN_PATHS],
+            "endpoints": self.ENDPOINT_PATHS,
+        }[key]
+    
+    def _assign_urls(self, domain: str) -> Dict[str, str]:
+        
+        owners = {}
+        for key in self.URL_OWNER_PRIORITY:
+            for path in self._phase_paths(key):
+                for protocol in ['https', 'http']:
+                    owners.setdefault(f"{protocol}://{domain}{path}", key)
+        return owners
+    
+    def _owns(self, pool: ScanHttpPool, key: str, url: str) -> bool:
+        
+        # Phases run on their own (outside discover_assets) have no owner map and probe every URL
+        owners = self._url_owners.get(pool)
+        return owners is None or owners.get(url, key) == key
+    
+    def _prober(self, pool: ScanHttpPool) -> PathProber:
+        
+        # One prober per pool, so soft-404 baselines are shared by all phases of a scan but not across scans
+        prober = self._probers.get(pool)
+        if prober is None:
+            prober = PathProber(pool, self._validators)
+            self._probers[pool] = prober
+        return prober
+    
+    @asynccontextmanager
+    async def _scan_pool(self, pool: Optional[ScanHttpPool]) -> AsyncIterator[ScanHttpPool]:
+        
+        # Phases called on their own (outside discover_assets) get a pool of their own
+        if pool is not None:
+            yield pool
+        else:
+            async with ScanHttpPool() as own_pool:
+                yield own_pool
     
     def generate_dorks(self, domain: str) -> List[str]:
         dorks = []
@@ -332,122 +518,123 @@ class WebRecon:
         
         return dorks
     
-    async def _enumerate_subdomains(self, domain: str) -> List[Dict[str, Any]]:
+    async def _enumerate_subdomains(
+        self,
+        domain: str,
+        client: Optional[ScanHttpPool] = None,
+        wordlist: Optional[Union[str, Iterable[str]]] = None
+    ) -> List[Dict[str, Any]]:
+        
         import time
+        seen = self._scan_seen(settings.WEB_RECON_SEEN_URLS_CAPACITY)
         enum_start = time.time()
-        logger.info(f"[WebRecon] [domain={domain}] Starting subdomain enumeration with wordlist")
-        subdomains = []
-        
-        common_prefixes = [
-            'www', 'mail', 'email', 'webmail', 'smtp', 'pop', 'imap',
-            'ftp', 'sftp', 'ssh', 'vpn', 'remote', 'secure',
-            'ns1', 'ns2', 'dns', 'mx', 'mx1', 'mx2',
-            'server', 'servers', 'host', 'hosting',
-            'dev', 'development', 'staging', 'stage', 'test', 'testing',
-            'qa', 'prod', 'production', 'preprod', 'pre-prod',
-
-            'api', 'api1', 'api2', 'apis', 'rest', 'graphql',
-            'cdn', 'static', 'assets', 'media', 'files', 'download',
-            'upload', 'storage', 'backup', 'backups',
-            'app', 'apps', 'application', 'portal', 'dashboard',
-            'admin', 'administrator', 'panel', 'cpanel', 'whm',
-            'blog', 'blogs', 'forum', 'forums', 'wiki', 'docs',
-            'documentation', 'help', 'support', 'status', 'monitor',
-            'jenkins', 'gitlab', 'github', 'git', 'svn', 'hg',
-            'ci', 'cd', 'deploy', 'deployment',
-            'mobile', 'm', 'wap', 'old', 'new', 'legacy',
-            'shop', 'store', 'payment', 'pay', 'billing',
-            'auth', 'login', 'signin', 'account', 'accounts',
-        ]
-        
-        logger.info(f"[WebRecon] [domain={domain}] Checking {len(common_prefixes)} subdomain prefixes")
-        
-        dns_start = time.time()
-        dns_tasks = []
-        subdomain_list = []
-        for prefix in common_prefixes:
-            subdomain = f"{prefix}.{domain}"
-            
-            if self._seen_urls.contains(subdomain):  # DSA-USED: BloomFilter
-                continue
-            self._seen_urls.add(subdomain)  # DSA-USED: BloomFilter
-            
-            subdomain_list.append(subdomain)
-            dns_tasks.append(self._resolve_dns(subdomain))
-        
-        dns_results = await asyncio.gather(*dns_tasks, return_exceptions=True)
-        dns_time = time.time() - dns_start
-        
-        resolved_subdomains = []
-        dns_failed = 0
-        for subdomain, resolved in zip(subdomain_list, dns_results):
-            if isinstance(resolved, Exception):
-                logger.debug(f"[WebRecon] [domain={domain}] DNS resolution error for {subdomain}: {type(resolved).__name__}: {resolved}")
-                dns_failed += 1
-            elif resolved:
-                resolved_subdomains.append(subdomain)
-            else:
-                logger.debug(f"[WebRecon] [domain={domain}] DNS resolution failed for {subdomain} (hostname not found)")
-                dns_failed += 1
-        
+        source = wordlist or settings.WEB_RECON_SUBDOMAIN_WORDLIST or self.SUBDOMAIN_WORDLIST
         logger.info(
-            f"[WebRecon] [domain={domain}] DNS resolution completed in {dns_time:.3f}s - "
-            f"resolved: {len(resolved_subdomains)}, failed: {dns_failed}"
+            f"[WebRecon] [domain={domain}] Starting subdomain brute force with wordlist "
+            f"{source if isinstance(source, str) else 'from memory'}"
         )
         
-        tasks_created = 0
-        tasks_skipped = 0
+        def unseen_words() -> Iterator[str]:
+            for word in iter_wordlist(source):
+                subdomain = f"{word}.{domain}"
+                if seen.contains(subdomain):  # DSA-USED: BloomFilter
+                    continue
+                seen.add(subdomain)  # DSA-USED: BloomFilter
+                yield word
         
-        async with httpx.AsyncClient(timeout=5.0, follow_redirects=False) as client:
-            tasks = []
-            for subdomain in resolved_subdomains:
-
-                for protocol in ['https', 'http']:
-                    url = f"{protocol}://{subdomain}"
-                    tasks.append(self._check_subdomain(client, url, subdomain, protocol == 'https'))
-                    tasks_created += 1
+        brute_forcer = SubdomainBruteForcer(self._resolver)
+        # Names resolving to the same address set are usually one host behind several names, so names of
+        # an address set are probed over HTTP one at a time until one answers. The names after it are
+        # reported as resolved but unprobed: on CDN and shared-hosting addresses each vhost can serve
+        # different content
+        probes: Dict[FrozenSet[str], asyncio.Task] = {}
+        groups: Dict[FrozenSet[str], List[str]] = {}
+        resolved = asyncio.Event()
+        
+        async with self._scan_pool(client) as client:
+            try:
+                async for hit in brute_forcer.stream(domain, unseen_words()):
+                    if hit.addresses not in probes:
+                        groups[hit.addresses] = []
+                        probes[hit.addresses] = asyncio.ensure_future(
+                            self._probe_address_group(client, groups[hit.addresses], resolved)
+                        )
+                    groups[hit.addresses].append(hit.hostname)
+            finally:
+                resolved.set()
             
             logger.info(
-                f"[WebRecon] [domain={domain}] Created {tasks_created} subdomain check tasks "
-                f"(skipped {tasks_skipped} duplicates, {dns_failed} DNS failures)"
+                f"[WebRecon] [domain={domain}] {sum(len(names) for names in groups.values())} subdomains resolved "
+                f"to {len(probes)} unique address sets, probing names of each set until one answers"
             )
-            
-
             check_start = time.time()
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            check_time = time.time() - check_start
-            logger.info(f"[WebRecon] [domain={domain}] Completed {len(results)} subdomain checks in {check_time:.3f}s")
-            
-            successful = 0
-            errors = 0
-            for result in results:
-                if isinstance(result, Exception):
-                    errors += 1
-                    logger.warning(f"[WebRecon] [domain={domain}] Subdomain check error: {type(result).__name__}: {result}")
-                elif isinstance(result, dict) and result:
-                    successful += 1
-
-                    existing = next((s for s in subdomains if s["subdomain"] == result["subdomain"]), None)
-                    if not existing:
-                        subdomains.append(result)
-                        logger.info(f"[WebRecon] [domain={domain}] Found subdomain: {result.get('subdomain')} (status: {result.get('status')})")
-                    elif result.get("https") and not existing.get("https"):
-
-                        subdomains.remove(existing)
-                        subdomains.append(result)
-                        logger.info(f"[WebRecon] [domain={domain}] Upgraded subdomain to HTTPS: {result.get('subdomain')}")
+            probe_results = await asyncio.gather(*probes.values(), return_exceptions=True)
+            logger.info(f"[WebRecon] [domain={domain}] Completed {len(probe_results)} subdomain probes in {time.time() - check_start:.3f}s")
+        
+        subdomains = []
+        errors = 0
+        for (addresses, names), outcome in zip(groups.items(), probe_results):
+            if isinstance(outcome, Exception):
+                errors += 1
+                logger.warning(f"[WebRecon] [domain={domain}] Subdomain check error: {type(outcome).__name__}: {outcome}")
+                continue
+            index, result = outcome
+            if not result:
+                continue
             
-            enum_time = time.time() - enum_start
-            logger.info(
-                f"[WebRecon] [domain={domain}] Subdomain enumeration completed in {enum_time:.3f}s - "
-                f"found: {len(subdomains)}, successful: {successful}, errors: {errors}"
-            )
+            # Names before the representative were probed and did not answer
+            representative = names[index]
+            subdomains.append({**result, "probed": True, "addresses": sorted(addresses)})
+            logger.info(f"[WebRecon] [domain={domain}] Found subdomain: {representative} (status: {result.get('status')})")
+            for name in names[index + 1:]:
+                subdomains.append({
+                    "subdomain": name,
+                    "probed": False,
+                    "probed_via": representative,
+                    "addresses": sorted(addresses)
+                })
+                logger.info(f"[WebRecon] [domain={domain}] Found subdomain: {name} (not probed, shares addresses with {representative})")
+        
+        enum_time = time.time() - enum_start
+        logger.info(
+            f"[WebRecon] [domain={domain}] Subdomain enumeration completed in {enum_time:.3f}s - "
+            f"found: {len(subdomains)}, words: {brute_forcer.stats['words']}, "
+            f"wildcard filtered: {brute_forcer.stats['wildcard_filtered']}, errors: {errors}"
+        )
         
         return subdomains
     
+    async def _probe_address_group(
+        self,
+        client: ScanHttpPool,
+        names: List[str],
+        resolved: asyncio.Event
+    ) -> Tuple[int, Optional[Dict[str, Any]]]:
+        
+        # names keeps growing while the brute force streams hits, so wait for more until resolution is done
+        index = 0
+        while True:
+            if index < len(names):
+                result = await self._probe_subdomain(client, names[index])
+                if result:
+                    return index, result
+                index += 1
+            elif resolved.is_set():
+                return index, None
+            else:
+                await resolved.wait()
+    
+    async def _probe_subdomain(self, client: ScanHttpPool, subdomain: str) -> Optional[Dict[str, Any]]:
+        
+        # HTTPS is preferred, so plain HTTP is only tried when HTTPS does not answer
+        result = await self._check_subdomain(client, f"https://{subdomain}", subdomain, True)
+        if result is None:
+            result = await self._check_subdomain(client, f"http://{subdomain}", subdomain, False)
+        return result
+    
     async def _check_subdomain(
         self, 
-        client: httpx.AsyncClient, 
+        client: ScanHttpPool, 
         url: str, 
         subdomain: str, 
         is_https: bool
@@ -459,7 +646,7 @@ class WebRecon:
         logger.info(f"[WebRecon] [subdomain={subdomain}] Checking {protocol} GET {url}")
         
         try:
-            response = await client.get(url, timeout=5.0)
+            response = await client.get(url)
             request_time = time.time() - request_start
             content_length = len(response.content) if response.content else 0
             server_header = response.headers.get("server", "unknown")
@@ -513,7 +700,7 @@ class WebRecon:
             pass
         return ""
     
-    async def _check_endpoints(self, domain: str) -> List[Dict[str, Any]]:
+    async def _check_endpoints(self, domain: str, client: Optional[ScanHttpPool] = None) -> List[Dict[str, Any]]:
         
         import time
         endpoint_start = time.time()
@@ -521,48 +708,16 @@ class WebRecon:
         endpoints = []
         
 
-        paths = [
-
-            '/.git/config', '/.git/HEAD', '/.git/index',
-            '/.svn/entries', '/.svn/wc.db',
-            '/.hg/requires',
-
-            '/.env', '/.env.local', '/.env.production',
-            '/config.php', '/config.inc.php', '/configuration.php',
-            '/web.config', '/.htaccess', '/.htpasswd',
-
-            '/admin', '/administrator', '/wp-admin', '/wp-login.php',
-            '/login', '/signin', '/auth', '/dashboard',
-            '/phpmyadmin', '/pma', '/adminer.php',
-            '/cpanel', '/whm', '/plesk',
-
-            '/api', '/api/v1', '/api/v2', '/graphql',
-            '/swagger', '/swagger.json', '/swagger.yaml',
-            '/openapi.json', '/openapi.yaml',
-            '/docs', '/documentation', '/api-docs',
-
-            '/phpinfo.php', '/info.php', '/test.php',
-            '/server-status', '/server-info',
-            '/.well-known/security.txt', '/security.txt',
-
-            '/robots.txt', '/sitemap.xml', '/sitemap.txt',
-            '/backup', '/backups', '/old', '/archive',
-            '/dump', '/sql', '/database',
-
-            '/.DS_Store', '/Thumbs.db',
-        ]
         
-        logger.info(f"[WebRecon] [domain={domain}] Checking {len(paths)} endpoint paths")
+        logger.info(f"[WebRecon] [domain={domain}] Checking {len(self.ENDPOINT_PATHS)} endpoint paths")
         
 
-        async with httpx.AsyncClient(timeout=5.0, follow_redirects=False) as client:
+        async with self._scan_pool(client) as client:
             tasks = []
-            for path in paths:
+            for path in self.ENDPOINT_PATHS:
                 for protocol in ['https', 'http']:
                     url = f"{protocol}://{domain}{path}"
-                    if not self._seen_urls.contains(url):  # DSA-USED: BloomFilter
-                        self._seen_urls.add(url)  # DSA-USED: BloomFilter
-
+                    if self._owns(client, "endpoints", url):
                         tasks.append(self._check_endpoint(client, url, path, follow_redirects=True))
             
             logger.info(f"[WebRecon] [domain={domain}] Created {len(tasks)} endpoint check tasks (all with redirect following)")
@@ -594,7 +749,7 @@ class WebRecon:
     
     async def _check_endpoint(
         self, 
-        client: httpx.AsyncClient, 
+        client: ScanHttpPool, 
         url: str, 
         path: str,
         follow_redirects: bool = False
@@ -605,24 +760,21 @@ class WebRecon:
         protocol = "HTTPS" if url.startswith("https://") else "HTTP"
         
 
-        if follow_redirects:
-            async with httpx.AsyncClient(timeout=5.0, follow_redirects=True) as redirect_client:
-                return await self._check_endpoint_with_client(redirect_client, url, path, request_start, protocol)
-        else:
-            return await self._check_endpoint_with_client(client, url, path, request_start, protocol)
+        return await self._check_endpoint_with_client(client, url, path, request_start, protocol, follow_redirects)
     
     async def _check_endpoint_with_client(
         self,
-        client: httpx.AsyncClient,
+        client: ScanHttpPool,
         url: str,
         path: str,
         request_start: float,
-        protocol: str
+        protocol: str,
+        follow_redirects: bool = False
     ) -> Optional[Dict[str, Any]]:
         
         import time
         try:
-            response = await client.get(url, timeout=5.0)
+            response = await client.get(url, follow_redirects=follow_redirects)
             request_time = time.time() - request_start
             content_length = len(response.content) if response.content else 0
             content_type = response.headers.get("content-type", "unknown")
@@ -664,7 +816,7 @@ class WebRecon:
             logger.warning(f"[WebRecon] [endpoint={path}] Error checking {url} after {request_time:.3f}s: {type(e).__name__}: {e}")
         return None
     
-    async def _detect_sensitive_files(self, domain: str) -> List[Dict[str, Any]]:
+    async def _detect_sensitive_files(self, domain: str, client: Optional[ScanHttpPool] = None) -> List[Dict[str, Any]]:
         
         import time
         file_start = time.time()
@@ -672,41 +824,15 @@ class WebRecon:
         files = []
         
 
-        sensitive_files = [
-
-            '/.env', '/.env.local', '/.env.production', '/.env.development',
-            '/.env.test', '/.env.staging',
-
-            '/config.json', '/config.yml', '/config.yaml',
-            '/settings.json', '/settings.py', '/settings.php',
-            '/application.properties', '/application.yml',
-
-            '/id_rsa', '/id_dsa', '/id_ecdsa', '/id_ed25519',
-            '/private.key', '/public.key', '/key.pem',
-            '/certificate.pem', '/cert.pem',
-
-            '/database.sql', '/dump.sql', '/backup.sql',
-            '/db.sqlite', '/database.db',
-
-            '/backup.tar.gz', '/backup.zip', '/backup.rar',
-            '/backup.bak', '/backup.old',
-
-            '/error.log', '/access.log', '/debug.log',
-            '/application.log', '/server.log',
-
-            '/.htpasswd', '/.gitignore', '/.dockerignore',
-            '/composer.json', '/package.json', '/requirements.txt',
-        ]
         
-        logger.info(f"[WebRecon] [domain={domain}] Checking {len(sensitive_files)} sensitive file patterns")
+        logger.info(f"[WebRecon] [domain={domain}] Checking {len(self.SENSITIVE_FILES)} sensitive file patterns")
         
-        async with httpx.AsyncClient(timeout=5.0, follow_redirects=False) as client:
+        async with self._scan_pool(client) as client:
             tasks = []
-            for file_path in sensitive_files:
+            for file_path in self.SENSITIVE_FILES:
                 for protocol in ['https', 'http']:
                     url = f"{protocol}://{domain}{file_path}"
-                    if not self._seen_urls.contains(url):  # DSA-USED: BloomFilter
-                        self._seen_urls.add(url)  # DSA-USED: BloomFilter
+                    if self._owns(client, "files", url):
                         tasks.append(self._check_file(client, url, file_path))
             
             logger.info(f"[WebRecon] [domain={domain}] Created {len(tasks)} file check tasks")
@@ -737,7 +863,7 @@ class WebRecon:
     
     async def _check_file(
         self, 
-        client: httpx.AsyncClient, 
+        client: ScanHttpPool, 
         url: str, 
         file_path: str
     ) -> Optional[Dict[str, Any]]:
@@ -747,13 +873,16 @@ class WebRecon:
         protocol = "HTTPS" if url.startswith("https://") else "HTTP"
         
         try:
-            response = await client.get(url, timeout=5.0)
+            response = await self._prober(client).fetch(url)
             request_time = time.time() - request_start
-            content_length = len(response.content) if response.content else 0
+            if response is None:
+                logger.info(f"[WebRecon] [file={file_path}] HTTP {protocol} probe {url} - Not found (404 or soft-404) - Time: {request_time:.3f}s")
+                return None
+            content_length = response.content_length
             content_type = response.headers.get("content-type", "unknown")
             
             if response.status_code == 200:
-                content_preview = response.text[:500] if response.text else ""
+                content_preview = response.text[:500]
                 result = {
                     "path": file_path,
                     "url": url,
@@ -765,7 +894,7 @@ class WebRecon:
                 }
                 logger.info(
                     f"[WebRecon] [file={file_path}] HTTP {protocol} GET {url} - "
-                    f"Status: 200 (EXPOSED) - Time: {request_time:.3f}s - "
+                    f"Status: 200 (EXPOSED{', not modified' if response.not_modified else ''}) - Time: {request_time:.3f}s - "
                     f"Size: {content_length} bytes - Type: {content_type}"
                 )
                 return result
@@ -782,7 +911,7 @@ class WebRecon:
             logger.warning(f"[WebRecon] [file={file_path}] Error checking {url} after {request_time:.3f}s: {type(e).__name__}: {e}")
         return None
     
-    async def _detect_source_code_exposure(self, domain: str) -> List[Dict[str, Any]]:
+    async def _detect_source_code_exposure(self, domain: str, client: Optional[ScanHttpPool] = None) -> List[Dict[str, Any]]:
         
         import time
         exposure_start = time.time()
@@ -790,40 +919,25 @@ class WebRecon:
         exposures = []
         
 
-        vcs_indicators = [
-
-            ('/.git/config', 'git'),
-            ('/.git/HEAD', 'git'),
-            ('/.git/index', 'git'),
-            ('/.git/logs/HEAD', 'git'),
-
-            ('/.svn/entries', 'svn'),
-            ('/.svn/wc.db', 'svn'),
-
-            ('/.hg/requires', 'hg'),
-            ('/.hg/hgrc', 'hg'),
-
-            ('/.bzr/README', 'bzr'),
-            ('/_darcs/README', 'darcs'),
-        ]
         
-        logger.info(f"[WebRecon] [domain={domain}] Checking {len(vcs_indicators)} VCS indicators")
+        logger.info(f"[WebRecon] [domain={domain}] Checking {len(self.VCS_INDICATORS)} VCS indicators")
         check_count = 0
         found_count = 0
         
-        async with httpx.AsyncClient(timeout=5.0, follow_redirects=False) as client:
-            for path, vcs_type in vcs_indicators:
+        async with self._scan_pool(client) as client:
+            for path, vcs_type in self.VCS_INDICATORS:
                 for protocol in ['https', 'http']:
                     url = f"{protocol}://{domain}{path}"
-                    if not self._seen_urls.contains(url):  # DSA-USED: BloomFilter
-                        self._seen_urls.add(url)  # DSA-USED: BloomFilter
+                    if self._owns(client, "source_code", url):
                         check_count += 1
                         request_start = time.time()
                         try:
-                            response = await client.get(url, timeout=5.0)
+                            response = await self._prober(client).fetch(url)
                             request_time = time.time() - request_start
-                            if response.status_code == 200:
-                                content_length = len(response.content) if response.content else 0
+                            if response is None:
+                                logger.info(f"[WebRecon] [vcs={vcs_type}] HTTP {protocol.upper()} probe {url} - Not found (404 or soft-404) - Time: {request_time:.3f}s")
+                            elif response.status_code == 200:
+                                content_length = response.content_length
                                 found_count += 1
                                 logger.info(
                                     f"[WebRecon] [vcs={vcs_type}] HTTP {protocol.upper()} GET {url} - "
@@ -858,7 +972,7 @@ class WebRecon:
         )
         return exposures
     
-    async def _discover_admin_panels(self, domain: str) -> List[Dict[str, Any]]:
+    async def _discover_admin_panels(self, domain: str, client: Optional[ScanHttpPool] = None) -> List[Dict[str, Any]]:
         
         import time
         admin_start = time.time()
@@ -866,46 +980,16 @@ class WebRecon:
         admin_panels = []
         
 
-        admin_paths = [
-
-            ('/wp-admin', 'WordPress Admin'),
-            ('/wp-login.php', 'WordPress Login'),
-
-            ('/administrator', 'Joomla Admin'),
-
-            ('/user/login', 'Drupal Login'),
-
-            ('/admin', 'Generic Admin'),
-            ('/admin/login', 'Admin Login'),
-            ('/administrator/login', 'Administrator Login'),
-            ('/login', 'Login Page'),
-            ('/signin', 'Sign In'),
-            ('/dashboard', 'Dashboard'),
-
-            ('/phpmyadmin', 'phpMyAdmin'),
-            ('/pma', 'phpMyAdmin (alt)'),
-            ('/adminer.php', 'Adminer'),
-
-            ('/cpanel', 'cPanel'),
-            ('/whm', 'WHM'),
-            ('/plesk', 'Plesk'),
-
-            ('/manager', 'Tomcat Manager'),
-            ('/jenkins', 'Jenkins'),
-            ('/gitlab', 'GitLab'),
-        ]
         
-        logger.info(f"[WebRecon] [domain={domain}] Checking {len(admin_paths)} admin panel paths")
+        logger.info(f"[WebRecon] [domain={domain}] Checking {len(self.ADMIN_PATHS)} admin panel paths")
         
 
-        async with httpx.AsyncClient(timeout=5.0, follow_redirects=False) as client:
+        async with self._scan_pool(client) as client:
             tasks = []
-            for path, panel_name in admin_paths:
+            for path, panel_name in self.ADMIN_PATHS:
                 for protocol in ['https', 'http']:
                     url = f"{protocol}://{domain}{path}"
-                    if not self._seen_urls.contains(url):  # DSA-USED: BloomFilter
-                        self._seen_urls.add(url)  # DSA-USED: BloomFilter
-
+                    if self._owns(client, "admin_panels", url):
                         tasks.append(self._check_admin_panel(client, url, path, panel_name, follow_redirects=True))
             
             logger.info(f"[WebRecon] [domain={domain}] Created {len(tasks)} admin panel check tasks")
@@ -933,7 +1017,7 @@ class WebRecon:
     
     async def _check_admin_panel(
         self, 
-        client: httpx.AsyncClient, 
+        client: ScanHttpPool, 
         url: str, 
         path: str, 
         panel_name: str,
@@ -945,38 +1029,36 @@ class WebRecon:
         protocol = "HTTPS" if url.startswith("https://") else "HTTP"
         
 
-        if follow_redirects:
-            async with httpx.AsyncClient(timeout=5.0, follow_redirects=True) as redirect_client:
-                return await self._check_admin_panel_with_client(redirect_client, url, path, panel_name, request_start, protocol)
-        else:
-            return await self._check_admin_panel_with_client(client, url, path, panel_name, request_start, protocol)
+        return await self._check_admin_panel_with_client(client, url, path, panel_name, request_start, protocol, follow_redirects)
     
     async def _check_admin_panel_with_client(
         self,
-        client: httpx.AsyncClient,
+        client: ScanHttpPool,
         url: str,
         path: str,
         panel_name: str,
         request_start: float,
-        protocol: str
+        protocol: str,
+        follow_redirects: bool = False
     ) -> Optional[Dict[str, Any]]:
         
         import time
         try:
-            response = await client.get(url, timeout=5.0)
+            response = await self._prober(client).fetch(url, follow_redirects=follow_redirects, indicators=self.LOGIN_KEYWORDS)
             request_time = time.time() - request_start
-            content_length = len(response.content) if response.content else 0
+            if response is None:
+                logger.info(f"[WebRecon] [admin_panel={panel_name}] HTTP {protocol} probe {url} - Not found (404 or soft-404) - Time: {request_time:.3f}s")
+                return None
+            content_length = response.content_length
             server_header = response.headers.get("server", "unknown")
             
 
-            final_url = str(response.url)
+            final_url = response.url
             was_redirected = final_url != url
             
 
-            content_lower = response.text.lower() if response.text else ""
-            is_login_page = any(keyword in content_lower for keyword in [
-                'login', 'password', 'username', 'sign in', 'log in'
-            ])
+            content_lower = response.text.lower()
+            is_login_page = any(keyword in content_lower for keyword in self.LOGIN_KEYWORDS)
             
 
             if response.status_code == 404:
@@ -1019,7 +1101,7 @@ class WebRecon:
             logger.warning(f"[WebRecon] [admin_panel={panel_name}] Error checking {url} after {request_time:.3f}s: {type(e).__name__}: {e}")
         return None
     
-    async def _detect_config_files(self, domain: str) -> List[Dict[str, Any]]:
+    async def _detect_config_files(self, domain: str, client: Optional[ScanHttpPool] = None) -> List[Dict[str, Any]]:
         
         import time
         config_start = time.time()
@@ -1027,25 +1109,15 @@ class WebRecon:
         configs = []
         
 
-        config_files = [
-            '/config.php', '/config.inc.php', '/configuration.php',
-            '/config.json', '/config.yml', '/config.yaml',
-            '/settings.php', '/settings.py', '/settings.json',
-            '/application.properties', '/application.yml',
-            '/application.yaml', '/application.conf',
-            '/web.config', '/.htaccess', '/.htpasswd',
-            '/.env', '/.env.production', '/.env.local',
-        ]
-        
-        logger.info(f"[WebRecon] [domain={domain}] Checking {len(config_files)} configuration file patterns")
-        
-        async with httpx.AsyncClient(timeout=5.0, follow_redirects=False) as client:
+        
+        logger.info(f"[WebRecon] [domain={domain}] Checking {len(self.CONFIG_FILES)} configuration file patterns")
+        
+        async with self._scan_pool(client) as client:
             tasks = []
-            for config_path in config_files:
+            for config_path in self.CONFIG_FILES:
                 for protocol in ['https', 'http']:
                     url = f"{protocol}://{domain}{config_path}"
-                    if not self._seen_urls.contains(url):  # DSA-USED: BloomFilter
-                        self._seen_urls.add(url)  # DSA-USED: BloomFilter
+                    if self._owns(client, "configs", url):
                         tasks.append(self._check_config_file(client, url, config_path))
             
             logger.info(f"[WebRecon] [domain={domain}] Created {len(tasks)} config file check tasks")
@@ -1073,7 +1145,7 @@ class WebRecon:
     
     async def _check_config_file(
         self, 
-        client: httpx.AsyncClient, 
+        client: ScanHttpPool, 
         url: str, 
         config_path: str
     ) -> Optional[Dict[str, Any]]:
@@ -1083,14 +1155,18 @@ class WebRecon:
         protocol = "HTTPS" if url.startswith("https://") else "HTTP"
         
         try:
-            response = await client.get(url, timeout=5.0)
+            response = await self._prober(client).fetch(url)
             request_time = time.time() - request_start
-            content_length = len(response.content) if response.content else 0
+            if response is None:
+                logger.info(f"[WebRecon] [config={config_path}] HTTP {protocol} probe {url} - Not found (404 or soft-404) - Time: {request_time:.3f}s")
+                return None
+            content_length = response.content_length
             content_type = response.headers.get("content-type", "unknown")
             
             if response.status_code == 200:
 
-                content = response.text if response.text else ""
+                # Only the first WEB_RECON_PROBE_BYTES of the body are fetched; secrets near the top are what matter
+                content = response.text
                 is_config = any(keyword in content.lower() for keyword in [
                     'password', 'secret', 'key', 'api', 'database', 'db_',
                     'host', 'port', 'user', 'config', 'setting'
@@ -1128,14 +1204,16 @@ class WebRecon:
     
     def get_cached_results(self, domain: str) -> Optional[Dict[str, Any]]:
         
-        return self._asset_cache.get(domain)  # DSA-USED: HashMap
+        cached = self._asset_cache.fresh(domain, list(self.PHASE_LABELS))  # DSA-USED: HashMap
+        return {"domain": domain, **cached} if cached else None
     
     def stats(self) -> Dict[str, Any]:
         
+        cache_stats = self._asset_cache.get_stats()
         return {
             "dork_patterns": len(self.DORK_PATTERNS),
-            "cached_domains": len(self._asset_cache),
-            "seen_urls": self._seen_urls.stats()
+            "cached_domains": cache_stats["domains"],
+            "phase_cache": cache_stats
         }
 
 
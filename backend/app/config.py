@@ -25,6 +25,7 @@ class Settings(BaseSettings):
     EVENTS_DIR: Path = Path("data/events")
     CACHE_DIR: Path = Path("data/cache")
     BLOBS_DIR: Path = Path("data/blobs")
+    BLOB_COMPRESSION: str = Field(default="zstd", env="BLOB_COMPRESSION", description="Blob store codec: zstd (needs zstandard, else gzip is used) or gzip")
     
     TOR_PROXY_HOST: str = Field(default="localhost", env="TOR_PROXY_HOST")
     TOR_PROXY_PORT: int = Field(default=9050, env="TOR_PROXY_PORT")
@@ -41,6 +42,8 @@ class Settings(BaseSettings):
     CRAWLER_SCORE_KEYWORDS: int = 40
     CRAWLER_COUNT_CATEGORIES: int = 5
     CRAWLER_DAYS_TIME: int = 10
+    CRAWLER_DB_BATCH_SIZE: int = Field(default=50, env="CRAWLER_DB_BATCH_SIZE", description="Queued URL status/category updates flushed per transaction")
+    CRAWLER_DB_FLUSH_INTERVAL: float = Field(default=2.0, env="CRAWLER_DB_FLUSH_INTERVAL", description="Max seconds a queued URL update waits before being flushed")
     DARKWEB_BATCH_SIZE: int = Field(default=5, env="DARKWEB_BATCH_SIZE")
     
     ONIONSEARCH_ENGINES: List[str] = Field(
@@ -78,12 +81,56 @@ class Settings(BaseSettings):
         env="ONIONSEARCH_MAX_PAGES",
         description="Maximum number of pages to fetch per engine"
     )
+    ONIONSEARCH_PARALLEL: bool = Field(default=True, env="ONIONSEARCH_PARALLEL", description="Fan discovery out over query x engine x page")
+    ONIONSEARCH_MAX_WORKERS: int = Field(default=8, env="ONIONSEARCH_MAX_WORKERS")
+    ONIONSEARCH_ENGINE_CONCURRENCY: int = Field(default=2, env="ONIONSEARCH_ENGINE_CONCURRENCY", description="Max in-flight requests per search engine")
+    ONIONSEARCH_ENGINE_MIN_INTERVAL: float = Field(default=1.0, env="ONIONSEARCH_ENGINE_MIN_INTERVAL", description="Min seconds between request starts per search engine")
+    ONIONSEARCH_CACHE_TTL: int = Field(default=3600, env="ONIONSEARCH_CACHE_TTL", description="Seconds search result pages stay cached (0 disables)")
+    ONIONSEARCH_CACHE_MAX_ENTRIES: int = Field(default=2000, env="ONIONSEARCH_CACHE_MAX_ENTRIES")
     
     DARKWEB_MAX_WORKERS: int = Field(default=5, env="DARKWEB_MAX_WORKERS")
     DARKWEB_DISCOVERY_TIMEOUT: int = Field(default=300, env="DARKWEB_DISCOVERY_TIMEOUT")
     DARKWEB_CRAWL_TIMEOUT: int = Field(default=600, env="DARKWEB_CRAWL_TIMEOUT")
     DARKWEB_DEFAULT_CRAWL_LIMIT: int = Field(default=5, env="DARKWEB_DEFAULT_CRAWL_LIMIT")
     DARKWEB_MAX_ADDITIONAL_CRAWL: int = Field(default=10, env="DARKWEB_MAX_ADDITIONAL_CRAWL")
+    DARKWEB_ASYNC_CRAWL: bool = Field(default=True, env="DARKWEB_ASYNC_CRAWL")
+    DARKWEB_ASYNC_CONCURRENCY: int = Field(default=200, env="DARKWEB_ASYNC_CONCURRENCY")
+    DARKWEB_PER_HOST_CONCURRENCY: int = Field(default=2, env="DARKWEB_PER_HOST_CONCURRENCY")
+    DARKWEB_PER_HOST_DELAY: float = Field(default=1.0, env="DARKWEB_PER_HOST_DELAY")
+    DARKWEB_INTEL_STORE_ENABLED: bool = Field(default=True, env="DARKWEB_INTEL_STORE_ENABLED")
+    DARKWEB_INTEL_STORE_PATH: str = Field(default="darkweb/intel_store.db", env="DARKWEB_INTEL_STORE_PATH", description="Shared crawl intel database, relative to DATA_DIR")
+    DARKWEB_INTEL_MAX_AGE: int = Field(default=86400, env="DARKWEB_INTEL_MAX_AGE", description="Seconds before a stored site is considered stale and refetched")
+    DARKWEB_MAX_RESPONSE_BYTES: int = Field(default=5 * 1024 * 1024, env="DARKWEB_MAX_RESPONSE_BYTES", description="Bytes read from a crawled response before the body is truncated")
+    DARKWEB_ANALYZE_PROCESSES: int = Field(default=0, env="DARKWEB_ANALYZE_PROCESSES", description="Worker processes for crawled page analysis (0 = one per CPU core, -1 = analyze in-process)")
+    DARKWEB_FRONTIER_MAX_DEPTH: int = Field(default=3, env="DARKWEB_FRONTIER_MAX_DEPTH", description="Upper bound on link depth followed by recursive crawls")
+    DARKWEB_FRONTIER_LEASE_TIMEOUT: float = Field(default=900.0, env="DARKWEB_FRONTIER_LEASE_TIMEOUT", description="Seconds before a claimed frontier URL is considered abandoned and re-queued")
+    DARKWEB_FRONTIER_MAX_ATTEMPTS: int = Field(default=2, env="DARKWEB_FRONTIER_MAX_ATTEMPTS", description="Crawl attempts per frontier URL before it is marked failed")
+    DARKWEB_REVISIT_ENABLED: bool = Field(default=True, env="DARKWEB_REVISIT_ENABLED", description="Schedule recrawls from each site's change history instead of recrawling everything")
+    DARKWEB_REVISIT_MIN_INTERVAL: float = Field(default=3600.0, env="DARKWEB_REVISIT_MIN_INTERVAL", description="Shortest revisit interval in seconds, reached by sites that change on every visit")
+    DARKWEB_REVISIT_MAX_INTERVAL: float = Field(default=14 * 86400.0, env="DARKWEB_REVISIT_MAX_INTERVAL", description="Longest revisit interval in seconds, reached by static or dead sites")
+    DARKWEB_REVISIT_BACKOFF: float = Field(default=2.0, env="DARKWEB_REVISIT_BACKOFF", description="Factor the revisit interval grows by per unchanged or failed visit, and shrinks by per change")
+    DARKWEB_SCHEDULED_CRAWL_BUDGET: int = Field(default=25, env="DARKWEB_SCHEDULED_CRAWL_BUDGET", description="Max sites fetched per scheduled dark web search run (override with the crawl_budget config key)")
+    
+    WEB_RECON_MAX_CONCURRENCY: int = Field(default=50, env="WEB_RECON_MAX_CONCURRENCY", description="Requests in flight at once per web recon scan, shared by all phases")
+    WEB_RECON_MAX_PER_HOST: int = Field(default=10, env="WEB_RECON_MAX_PER_HOST", description="Requests in flight at once to a single host during a web recon scan")
+    WEB_RECON_MAX_CONNECTIONS: int = Field(default=100, env="WEB_RECON_MAX_CONNECTIONS", description="Pooled (keep-alive) connections per web recon scan")
+    WEB_RECON_HTTP2: bool = Field(default=True, env="WEB_RECON_HTTP2", description="Negotiate HTTP/2 for web recon requests when the h2 package is installed")
+    WEB_RECON_TIMEOUT: float = Field(default=5.0, env="WEB_RECON_TIMEOUT", description="Per-request timeout in seconds for web recon probes")
+    WEB_RECON_CACHE_TTL: int = Field(default=21600, env="WEB_RECON_CACHE_TTL", description="Seconds a web recon phase result is reused by rescans of the same domain (0 disables)")
+    WEB_RECON_CACHE_MAX_ENTRIES: int = Field(default=600, env="WEB_RECON_CACHE_MAX_ENTRIES", description="Max cached web recon phase results (one per domain and phase)")
+    WEB_RECON_SEEN_URLS_CAPACITY: int = Field(default=1000000, env="WEB_RECON_SEEN_URLS_CAPACITY", description="Expected subdomain candidates per web recon scan, used to size the brute force dedup Bloom filter")
+    WEB_RECON_PROBE_BYTES: int = Field(default=8192, env="WEB_RECON_PROBE_BYTES", description="Body bytes fetched (ranged GET) to classify sensitive file, config and admin panel candidates")
+    WEB_RECON_VALIDATOR_CACHE_SIZE: int = Field(default=2000, env="WEB_RECON_VALIDATOR_CACHE_SIZE", description="Probed URLs whose ETag/Last-Modified and response prefix are kept for conditional rescans")
+    WEB_RECON_SUBDOMAIN_WORDLIST: str = Field(default="", env="WEB_RECON_SUBDOMAIN_WORDLIST", description="Path to a subdomain wordlist (one word per line) for brute force; empty = built-in list")
+    WEB_RECON_DNS_CONCURRENCY: int = Field(default=100, env="WEB_RECON_DNS_CONCURRENCY", description="Upper bound of the adaptive DNS lookup window during subdomain brute force")
+    WEB_RECON_DNS_MIN_CONCURRENCY: int = Field(default=10, env="WEB_RECON_DNS_MIN_CONCURRENCY", description="Starting and lowest DNS lookup window during subdomain brute force")
+    WEB_RECON_WILDCARD_PROBES: int = Field(default=3, env="WEB_RECON_WILDCARD_PROBES", description="Random names resolved per zone to detect wildcard DNS (0 disables detection)")
+    
+    DNS_NAMESERVERS: str = Field(default="", env="DNS_NAMESERVERS", description="Comma-separated nameservers for collector DNS lookups (empty = system resolver)")
+    DNS_RESOLVER_TIMEOUT: float = Field(default=5.0, env="DNS_RESOLVER_TIMEOUT", description="Per-lookup timeout in seconds for collector DNS queries")
+    DNS_MAX_CONCURRENCY: int = Field(default=100, env="DNS_MAX_CONCURRENCY", description="DNS queries in flight at once across all collectors")
+    DNS_NEGATIVE_TTL: int = Field(default=300, env="DNS_NEGATIVE_TTL", description="Max seconds to cache NXDOMAIN/NoAnswer results (the zone's SOA negative TTL applies when lower)")
+    DNS_CACHE_SIZE: int = Field(default=10000, env="DNS_CACHE_SIZE", description="Max cached DNS answers (positive and negative)")
     
     ANALYZER_DB_HOST: Optional[str] = None
     ANALYZER_DB_NAME: Optional[str] = None
@@ -91,6 +138,21 @@ class Settings(BaseSettings):
     ANALYZER_DB_PASS: Optional[str] = None
     
     WS_HEARTBEAT_INTERVAL: int = 30
+    WS_SEND_QUEUE_SIZE: int = Field(
+        default=256,
+        env="WS_SEND_QUEUE_SIZE",
+        description="Maximum messages buffered per WebSocket client before backpressure applies"
+    )
+    WS_BACKPRESSURE_POLICY: str = Field(
+        default="drop_oldest",
+        env="WS_BACKPRESSURE_POLICY",
+        description="What to do when a client's send queue is full (drop_oldest/disconnect)"
+    )
+    WS_SEND_TIMEOUT: float = Field(
+        default=10.0,
+        env="WS_SEND_TIMEOUT",
+        description="Seconds a single WebSocket send may take before the client is dropped"
+    )
     
     API_REQUEST_TIMEOUT: int = Field(default=300, env="API_REQUEST_TIMEOUT")
     DARKWEB_JOB_TIMEOUT: int = Field(default=1800, env="DARKWEB_JOB_TIMEOUT")
@@ -171,6 +233,26 @@ class Settings(BaseSettings):
         env="NETWORK_MAX_BODY_SIZE",
         description="Maximum body size to log in bytes (1MB default)"
     )
+    NETWORK_TUNNEL_SNAPSHOT_ENABLED: bool = Field(
+        default=True,
+        env="NETWORK_TUNNEL_SNAPSHOT_ENABLED",
+        description="Persist tunnel detector baselines across restarts"
+    )
+    NETWORK_TUNNEL_SNAPSHOT_PATH: Path = Field(
+        default=Path("data/cache/tunnel_detector.msgpack"),
+        env="NETWORK_TUNNEL_SNAPSHOT_PATH",
+        description="File the tunnel detector snapshot is written to"
+    )
+    NETWORK_TUNNEL_SNAPSHOT_INTERVAL: int = Field(
+        default=300,
+        env="NETWORK_TUNNEL_SNAPSHOT_INTERVAL",
+        description="Seconds between periodic tunnel detector snapshots"
+    )
+    NETWORK_TUNNEL_SNAPSHOT_MAX_LOAD_SECONDS: float = Field(
+        default=2.0,
+        env="NETWORK_TUNNEL_SNAPSHOT_MAX_LOAD_SECONDS",
+        description="Upper bound on time spent restoring the snapshot at startup"
+    )
     
     class Config:
         env_file = ".env"
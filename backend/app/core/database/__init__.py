@@ -7,7 +7,8 @@ the database layer.
 from .storage import Storage
 from .indexer import Indexer
 from .serializer import Serializer
+from .blob_store import BlobStore, get_blob_store
 
-__all__ = ["Storage", "Indexer", "Serializer"]
+__all__ = ["Storage", "Indexer", "Serializer", "BlobStore", "get_blob_store"]
 
 
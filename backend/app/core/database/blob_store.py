@@ -0,0 +1,184 @@
+"""Content-addressed blob storage.
+
+This module stores large payloads (crawled page text, screenshots, HAR
+captures) as compressed files under settings.BLOBS_DIR, named by the SHA-256
+of their uncompressed bytes. Records that used to embed the payload keep only
+the digest and fetch the bytes on demand, so jobs, findings and database rows
+stay small, and identical payloads (mirrored pages, repeated captures) are
+stored once.
+
+Blobs are compressed with zstd when the zstandard package is installed and
+with gzip otherwise; the file suffix records the codec, so stores written with
+either can be read back.
+
+This module does not use custom DSA concepts from app.core.dsa.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+from app.config import settings
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+class BlobStore:
+
+    def __init__(self, root: Optional[Path] = None, compression: Optional[str] = None):
+        self.root = Path(root or settings.BLOBS_DIR)
+        compression = (compression or settings.BLOB_COMPRESSION).lower()
+        if compression == "zstd" and not ZSTD_AVAILABLE:
+            logger.warning("[BlobStore] zstandard not installed, falling back to gzip")
+            compression = "gzip"
+        if compression not in ("zstd", "gzip"):
+            raise ValueError(f"Unsupported blob compression: {compression}")
+        self.compression = compression
+        self.stats = {"writes": 0, "dedup_hits": 0, "reads": 0, "misses": 0, "bytes_in": 0, "bytes_stored": 0}
+        self._lock = threading.Lock()
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    @staticmethod
+    def _valid_digest(digest: str) -> bool:
+        return len(digest) == 64 and all(c in "0123456789abcdef" for c in digest)
+
+    def _path(self, digest: str, suffix: str) -> Path:
+        return self.root / digest[:2] / digest[2:4] / f"{digest}.{suffix}"
+
+    def _find(self, digest: str) -> Optional[Path]:
+        if not self._valid_digest(digest):
+            return None
+        for suffix in ("zst", "gz"):
+            path = self._path(digest, suffix)
+            if path.exists():
+                return path
+        return None
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.compression == "zstd":
+            return zstandard.ZstdCompressor(level=10).compress(data)
+        return gzip.compress(data, compresslevel=6)
+
+    @staticmethod
+    def _decompress(path: Path, payload: bytes) -> bytes:
+        if path.suffix == ".zst":
+            if not ZSTD_AVAILABLE:
+                raise RuntimeError(f"zstandard is required to read {path.name}")
+            return zstandard.ZstdDecompressor().decompress(payload)
+        return gzip.decompress(payload)
+
+    def put(self, data: bytes) -> str:
+        """Store bytes and return their digest; existing content is not rewritten.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            data: Uncompressed payload
+
+        Returns:
+            Hex SHA-256 of data, used as the blob reference
+        """
+        digest = self.digest(data)
+        with self._lock:
+            self.stats["bytes_in"] += len(data)
+            if self._find(digest) is not None:
+                self.stats["dedup_hits"] += 1
+                return digest
+
+        path = self._path(digest, "zst" if self.compression == "zstd" else "gz")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        compressed = self._compress(data)
+        # Write to a temp file and rename so readers never see a partial blob
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(compressed)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        with self._lock:
+            self.stats["writes"] += 1
+            self.stats["bytes_stored"] += len(compressed)
+        return digest
+
+    def put_text(self, text: str) -> str:
+        return self.put(text.encode("utf-8"))
+
+    def put_json(self, value: Any) -> str:
+        return self.put(json.dumps(value, separators=(",", ":"), sort_keys=True).encode("utf-8"))
+
+    def get(self, digest: Optional[str]) -> Optional[bytes]:
+        """Load a blob by digest.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            digest: Reference returned by put()
+
+        Returns:
+            Uncompressed bytes, or None if the blob does not exist
+        """
+        path = self._find(digest) if digest else None
+        if path is None:
+            self.stats["misses"] += 1
+            return None
+        with open(path, "rb") as f:
+            data = self._decompress(path, f.read())
+        self.stats["reads"] += 1
+        return data
+
+    def get_text(self, digest: Optional[str]) -> Optional[str]:
+        data = self.get(digest)
+        return data.decode("utf-8") if data is not None else None
+
+    def get_json(self, digest: Optional[str]) -> Any:
+        data = self.get(digest)
+        return json.loads(data) if data is not None else None
+
+    def exists(self, digest: str) -> bool:
+        return self._find(digest) is not None
+
+    def delete(self, digest: str) -> bool:
+        path = self._find(digest)
+        if path is None:
+            return False
+        path.unlink(missing_ok=True)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "compression": self.compression, "root": str(self.root)}
+
+
+_blob_store: Optional[BlobStore] = None
+_blob_store_lock = threading.Lock()
+
+
+def get_blob_store() -> BlobStore:
+
+    global _blob_store
+    if _blob_store is None:
+        with _blob_store_lock:
+            if _blob_store is None:
+                _blob_store = BlobStore()
+                logger.info(f"[BlobStore] Using {_blob_store.root} ({_blob_store.compression})")
+    return _blob_store
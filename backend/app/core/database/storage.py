@@ -20,7 +20,7 @@ from datetime import datetime
 from loguru import logger
 
 from app.config import settings
-from app.core.dsa import Graph, AVLTree, HashMap, Trie, BloomFilter
+from app.core.dsa import Graph, AVLTree, HashMap, Trie, CompactBloomFilter
 
 
 class Storage:
@@ -39,7 +39,7 @@ class Storage:
         self._entity_index = AVLTree()
         self._type_index = HashMap()
         self._value_trie = Trie()
-        self._seen_filter = BloomFilter(expected_items=1000000)
+        self._seen_filter = CompactBloomFilter(expected_items=1000000)
         
         self._lock = threading.RLock()
         
@@ -11,7 +11,9 @@ DSA Concepts Exported:
 - DoublyLinkedList: Bidirectional linked list for timelines
 - CircularBuffer: Fixed-size buffer for rolling logs
 - Trie: Prefix tree for text searching
-- BloomFilter: Probabilistic membership testing
+- BloomFilter/CompactBloomFilter: Probabilistic membership testing
+- SimHashIndex: Near-duplicate detection over SimHash fingerprints
+- TrigramIndex: Substring and regex prefiltering over indexed strings
 - SkipList: Probabilistic ordered structure
 - BTree: Disk-optimized tree structure
 """
@@ -23,7 +25,9 @@ from .heap import MinHeap, MaxHeap
 from .linked_list import DoublyLinkedList, ListNode
 from .circular_buffer import CircularBuffer
 from .trie import Trie, TrieNode
-from .bloom_filter import BloomFilter
+from .bloom_filter import BloomFilter, CompactBloomFilter
+from .simhash import SimHashIndex, simhash, hamming_distance
+from .trigram_index import TrigramIndex
 from .skip_list import SkipList
 from .btree import BTree, BTreeNode
 
@@ -35,7 +39,9 @@ __all__ = [
     "DoublyLinkedList", "ListNode",
     "CircularBuffer",
     "Trie", "TrieNode",
-    "BloomFilter",
+    "BloomFilter", "CompactBloomFilter",
+    "SimHashIndex", "simhash", "hamming_distance",
+    "TrigramIndex",
     "SkipList",
     "BTree", "BTreeNode"
 ]
@@ -10,11 +10,18 @@ DSA Concept: Bloom Filter
 - Memory efficient O(m) space where m is bit array size
 - O(k) insert and query operations where k is number of hash functions
 - No false negatives, possible false positives
+
+CompactBloomFilter packs the bit array into a bytearray (1 bit per slot instead
+of one list slot) and derives all k positions from a single blake2b digest,
+optionally backed by a memory-mapped file so the filter survives restarts.
 """
 
 import math
 import hashlib
-from typing import Any, List
+import mmap
+import os
+import struct
+from typing import Any, Iterable, List, Optional
 
 
 class BloomFilter:
@@ -184,6 +191,276 @@ class BloomFilter:
         return result
 
 
+class CompactBloomFilter:
+    
+    _MAGIC = b"CBLF"
+    _HEADER = struct.Struct("<4sHQIQQd")
+    
+    def __init__(
+        self,
+        expected_items: int,
+        false_positive_rate: float = 0.01,
+        path: Optional[str] = None
+    ):
+        if expected_items <= 0:
+            raise ValueError("Expected items must be positive")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("False positive rate must be between 0 and 1")
+        
+        self._size = BloomFilter._optimal_size(expected_items, false_positive_rate)
+        self._num_hashes = BloomFilter._optimal_hashes(self._size, expected_items)
+        self._num_bytes = (self._size + 7) // 8
+        self._expected_items = expected_items
+        self._false_positive_rate = false_positive_rate
+        self._count = 0
+        
+        self._path = path
+        self._file = None
+        self._mmap = None
+        if path:
+            self._bits = self._open_mmap(path)
+        else:
+            self._bits = bytearray(self._num_bytes)
+    
+    def _open_mmap(self, path: str) -> memoryview:
+        header_size = self._HEADER.size
+        total_size = header_size + self._num_bytes
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        exists = os.path.exists(path)
+        if exists and os.path.getsize(path) != total_size:
+            raise ValueError(f"Bloom filter file {path} does not match filter parameters")
+        self._file = open(path, "r+b" if exists else "w+b")
+        if not exists:
+            self._file.truncate(total_size)
+        self._mmap = mmap.mmap(self._file.fileno(), total_size)
+        
+        if exists:
+            magic, _, size, num_hashes, count, _, _ = self._HEADER.unpack_from(self._mmap, 0)
+            if magic != self._MAGIC or size != self._size or num_hashes != self._num_hashes:
+                self._mmap.close()
+                self._file.close()
+                self._mmap = self._file = None
+                raise ValueError(f"Bloom filter file {path} does not match filter parameters")
+            self._count = count
+        else:
+            self._write_header()
+        
+        return memoryview(self._mmap)[header_size:]
+    
+    def _write_header(self):
+        self._HEADER.pack_into(
+            self._mmap, 0, self._MAGIC, 1, self._size, self._num_hashes,
+            self._count, self._expected_items, self._false_positive_rate
+        )
+    
+    def _positions(self, item: Any) -> List[int]:
+        if isinstance(item, str):
+            data = item.encode('utf-8')
+        elif isinstance(item, bytes):
+            data = item
+        else:
+            data = str(item).encode('utf-8')
+        
+        # One 128-bit digest split into two 64-bit halves drives all k probes
+        digest = int.from_bytes(hashlib.blake2b(data, digest_size=16).digest(), "little")
+        size = self._size
+        h1 = (digest & 0xFFFFFFFFFFFFFFFF) % size
+        h2 = ((digest >> 64) | 1) % size
+        positions = []
+        for _ in range(self._num_hashes):
+            positions.append(h1)
+            h1 += h2
+            if h1 >= size:
+                h1 -= size
+        return positions
+    
+    def add(self, item: Any):
+        """Add an item to the bloom filter.
+        
+        DSA-USED:
+        - BloomFilter: O(k) insertion where k is number of hash functions
+        
+        Args:
+            item: Item to add to the filter
+        """
+        bits = self._bits
+        for pos in self._positions(item):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self._count += 1
+    
+    def __contains__(self, item: Any) -> bool:
+        return self.contains(item)
+    
+    def contains(self, item: Any) -> bool:
+        """Check if an item might be in the filter (may have false positives).
+        
+        DSA-USED:
+        - BloomFilter: O(k) query where k is number of hash functions
+        
+        Args:
+            item: Item to check
+        
+        Returns:
+            True if item might be present (no false negatives, possible false positives)
+        """
+        bits = self._bits
+        for pos in self._positions(item):
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+    
+    def add_many(self, items: Iterable[Any]):
+        """Add multiple items to the bloom filter.
+        
+        Args:
+            items: Items to add
+        """
+        bits = self._bits
+        positions = self._positions
+        added = 0
+        for item in items:
+            for pos in positions(item):
+                bits[pos >> 3] |= 1 << (pos & 7)
+            added += 1
+        self._count += added
+    
+    def contains_many(self, items: Iterable[Any]) -> List[bool]:
+        """Check multiple items in one call.
+        
+        Args:
+            items: Items to check
+        
+        Returns:
+            List of membership results in input order
+        """
+        bits = self._bits
+        positions = self._positions
+        results = []
+        for item in items:
+            present = True
+            for pos in positions(item):
+                if not bits[pos >> 3] & (1 << (pos & 7)):
+                    present = False
+                    break
+            results.append(present)
+        return results
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    @property
+    def count(self) -> int:
+        return self._count
+    
+    @property
+    def size_bits(self) -> int:
+        return self._size
+    
+    @property
+    def size_bytes(self) -> int:
+        return self._num_bytes
+    
+    @property
+    def num_hashes(self) -> int:
+        return self._num_hashes
+    
+    def current_false_positive_rate(self) -> float:
+        """Calculate the current false positive rate based on items added.
+        
+        Returns:
+            Current false positive rate as a float between 0 and 1
+        """
+        if self._count == 0:
+            return 0.0
+        
+        exponent = -self._num_hashes * self._count / self._size
+        return (1 - math.exp(exponent)) ** self._num_hashes
+    
+    def fill_ratio(self) -> float:
+        """Get the ratio of set bits in the bit array.
+        
+        Returns:
+            Fill ratio as a float between 0 and 1
+        """
+        chunk = 1 << 20
+        set_bits = 0
+        for start in range(0, self._num_bytes, chunk):
+            set_bits += bin(int.from_bytes(self._bits[start:start + chunk], "little")).count("1")
+        return set_bits / self._size
+    
+    def stats(self) -> dict:
+        """Get statistics about the bloom filter.
+        
+        Returns:
+            Dictionary with filter statistics
+        """
+        return {
+            "items_added": self._count,
+            "expected_items": self._expected_items,
+            "size_bits": self._size,
+            "size_bytes": self.size_bytes,
+            "num_hashes": self._num_hashes,
+            "fill_ratio": self.fill_ratio(),
+            "target_fpr": self._false_positive_rate,
+            "current_fpr": self.current_false_positive_rate(),
+            "persistent": self._path is not None
+        }
+    
+    def clear(self):
+        """Remove all items from the bloom filter."""
+        if self._mmap is not None:
+            self._bits[:] = bytes(self._num_bytes)
+        else:
+            self._bits = bytearray(self._num_bytes)
+        self._count = 0
+        self.flush()
+    
+    def merge(self, other: "CompactBloomFilter") -> "CompactBloomFilter":
+        """Merge another bloom filter with this one.
+        
+        Args:
+            other: Another CompactBloomFilter to merge with
+        
+        Returns:
+            New in-memory CompactBloomFilter containing the union of both filters
+        
+        Raises:
+            ValueError: If filters have different sizes or hash counts
+        """
+        if self._size != other._size or self._num_hashes != other._num_hashes:
+            raise ValueError("Bloom filters must have same size and hash count")
+        
+        result = CompactBloomFilter(self._expected_items, self._false_positive_rate)
+        merged = int.from_bytes(self._bits, "little") | int.from_bytes(other._bits, "little")
+        result._bits = bytearray(merged.to_bytes(self._num_bytes, "little"))
+        result._count = self._count + other._count
+        
+        return result
+    
+    def flush(self):
+        """Persist the item count and dirty pages of a file-backed filter."""
+        if self._mmap is not None:
+            self._write_header()
+            self._mmap.flush()
+    
+    def close(self):
+        """Flush and unmap a file-backed filter, keeping its bits in memory."""
+        if self._mmap is not None:
+            self.flush()
+            view = self._bits
+            self._bits = bytearray(view)
+            view.release()
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
 class CountingBloomFilter:
     
     def __init__(self, expected_items: int, false_positive_rate: float = 0.01):
@@ -0,0 +1,176 @@
+"""SimHash fingerprinting and near-duplicate index.
+
+This module implements 64-bit SimHash fingerprints over word shingles and an
+index that finds fingerprints within a Hamming distance without comparing
+against every stored item. Two texts that differ in a few words produce
+fingerprints that differ in only a few bits, so near-duplicate pages can be
+found even when their exact hashes differ.
+
+DSA Concept: SimHash with block-partitioned index
+- Locality-sensitive 64-bit fingerprint from weighted shingle hashes
+- Pigeonhole lookup: with the fingerprint split into b blocks, any fingerprint
+  within distance d < b shares at least one block exactly with the query
+- O(b) hash table probes plus candidate verification per query
+- Linear fallback for distances too large for the block layout
+"""
+
+import hashlib
+import re
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+
+FINGERPRINT_BITS = 64
+_WORD_RE = re.compile(r'\w+')
+
+
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def shingles(text: str, size: int = 3) -> Counter:
+    """Split text into lowercase word shingles with occurrence counts.
+    
+    Args:
+        text: Text to shingle
+        size: Words per shingle (default: 3)
+    
+    Returns:
+        Counter of shingle -> occurrences; single words when the text is shorter than size
+    """
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < size:
+        return Counter(words)
+    return Counter(" ".join(words[i:i + size]) for i in range(len(words) - size + 1))
+
+
+def simhash(features: Any) -> int:
+    """Compute a 64-bit SimHash fingerprint.
+    
+    DSA-USED:
+    - SimHash: Each feature hash votes +weight/-weight on every bit; the sign of
+      each bit's total gives the fingerprint. O(f * 64) for f distinct features.
+    
+    Args:
+        features: Text (shingled with shingles()) or a mapping/iterable of features
+    
+    Returns:
+        Fingerprint as an int, 0 when there are no features
+    """
+    if isinstance(features, str):
+        features = shingles(features)
+    elif not isinstance(features, dict):
+        features = Counter(features)
+    
+    if not features:
+        return 0
+    
+    votes = [0] * FINGERPRINT_BITS
+    for feature, weight in features.items():
+        h = _feature_hash(feature)
+        for bit in range(FINGERPRINT_BITS):
+            if h >> bit & 1:
+                votes[bit] += weight
+            else:
+                votes[bit] -= weight
+    
+    fingerprint = 0
+    for bit, vote in enumerate(votes):
+        if vote > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def similarity(a: int, b: int) -> float:
+    return 1.0 - hamming_distance(a, b) / FINGERPRINT_BITS
+
+
+class SimHashIndex:
+    
+    def __init__(self, blocks: int = 8):
+        if FINGERPRINT_BITS % blocks:
+            raise ValueError(f"blocks must divide {FINGERPRINT_BITS}")
+        self.blocks = blocks
+        self._block_bits = FINGERPRINT_BITS // blocks
+        self._block_mask = (1 << self._block_bits) - 1
+        self._tables: List[Dict[int, Set[Any]]] = [{} for _ in range(blocks)]
+        self._fingerprints: Dict[Any, int] = {}
+    
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+    
+    def __contains__(self, key: Any) -> bool:
+        return key in self._fingerprints
+    
+    def _block_values(self, fingerprint: int) -> Iterable[Tuple[int, int]]:
+        for block in range(self.blocks):
+            yield block, fingerprint >> (block * self._block_bits) & self._block_mask
+    
+    def get(self, key: Any) -> Optional[int]:
+        return self._fingerprints.get(key)
+    
+    def add(self, key: Any, fingerprint: int):
+        """Index a fingerprint under key, replacing any previous fingerprint.
+        
+        DSA-USED:
+        - SimHash index: O(b) block table inserts
+        
+        Args:
+            key: Item identifier
+            fingerprint: SimHash fingerprint
+        """
+        if key in self._fingerprints:
+            self.remove(key)
+        self._fingerprints[key] = fingerprint
+        for block, value in self._block_values(fingerprint):
+            self._tables[block].setdefault(value, set()).add(key)
+    
+    def remove(self, key: Any) -> bool:
+        fingerprint = self._fingerprints.pop(key, None)
+        if fingerprint is None:
+            return False
+        for block, value in self._block_values(fingerprint):
+            bucket = self._tables[block].get(value)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._tables[block][value]
+        return True
+    
+    def query(self, fingerprint: int, max_distance: int) -> List[Tuple[Any, int]]:
+        """Find indexed items within max_distance bits of fingerprint.
+        
+        DSA-USED:
+        - SimHash index: Exact block lookups gather candidates when max_distance < b,
+          otherwise every fingerprint is checked
+        
+        Args:
+            fingerprint: Query fingerprint
+            max_distance: Maximum Hamming distance (inclusive)
+        
+        Returns:
+            List of (key, distance) tuples sorted by distance
+        """
+        if max_distance < self.blocks:
+            candidates: Set[Any] = set()
+            for block, value in self._block_values(fingerprint):
+                candidates.update(self._tables[block].get(value, ()))
+        else:
+            candidates = set(self._fingerprints)
+        
+        results = []
+        for key in candidates:
+            distance = hamming_distance(fingerprint, self._fingerprints[key])
+            if distance <= max_distance:
+                results.append((key, distance))
+        
+        results.sort(key=lambda item: item[1])
+        return results
+    
+    def clear(self):
+        self._tables = [{} for _ in range(self.blocks)]
+        self._fingerprints = {}
@@ -11,9 +11,11 @@ DSA Concept: Trie (Prefix Tree)
 - Word count statistics
 - O(m) insert and search operations
 - O(m + k) prefix match where k is number of results
+- Aho-Corasick failure/output links for O(n + z) multi-key text scanning
 """
 
-from typing import Any, Optional, List, Dict, Generator, Tuple
+from collections import deque
+from typing import Any, Optional, List, Dict, Generator, Set, Tuple
 from dataclasses import dataclass, field
 
 
@@ -23,6 +25,10 @@ class TrieNode:
     is_end: bool = False
     value: Any = None
     count: int = 0
+    depth: int = 0
+    # Aho-Corasick links, rebuilt lazily after the key set changes
+    fail: Optional["TrieNode"] = field(default=None, repr=False, compare=False)
+    output: Optional["TrieNode"] = field(default=None, repr=False, compare=False)
 
 
 class Trie:
@@ -30,6 +36,7 @@ class Trie:
     def __init__(self):
         self._root = TrieNode()
         self._size = 0
+        self._automaton_ready = False
     
     def __len__(self) -> int:
         return self._size
@@ -63,7 +70,7 @@ class Trie:
         
         for char in key:
             if char not in node.children:
-                node.children[char] = TrieNode()
+                node.children[char] = TrieNode(depth=node.depth + 1)
             node = node.children[char]
             node.count += 1
         
@@ -73,6 +80,7 @@ class Trie:
         
         if is_new:
             self._size += 1
+            self._automaton_ready = False
         
         return is_new
     
@@ -136,6 +144,7 @@ class Trie:
         
         if found:
             self._size -= 1
+            self._automaton_ready = False
         
         return found
     
@@ -344,6 +353,7 @@ class Trie:
         """Remove all keys from the trie."""
         self._root = TrieNode()
         self._size = 0
+        self._automaton_ready = False
     
     def get_longest_prefix(self, text: str) -> Optional[Tuple[str, Any]]:
         """Find the longest key that is a prefix of the given text.
@@ -370,31 +380,99 @@ class Trie:
         
         return last_match
     
-    def find_all_in_text(self, text: str) -> List[Tuple[int, str, Any]]:
-        """Find all keys that appear as substrings in the given text.
+    def build_automaton(self):
+        """Compute Aho-Corasick failure and output links for every node.
+        
+        DSA-USED:
+        - Trie: Breadth-first traversal setting each node's failure link to the
+          longest proper suffix that is also a trie path, and its output link to
+          the nearest key-ending node along the failure chain. O(total key length).
+        """
+        root = self._root
+        root.fail = None
+        root.output = None
+        queue = deque()
+        
+        for child in root.children.values():
+            child.fail = root
+            child.output = None
+            queue.append(child)
+        
+        while queue:
+            node = queue.popleft()
+            for char, child in node.children.items():
+                fail = node.fail
+                while fail is not None and char not in fail.children:
+                    fail = fail.fail
+                child.fail = fail.children[char] if fail is not None else root
+                child.output = child.fail if child.fail.is_end else child.fail.output
+                queue.append(child)
+        
+        self._automaton_ready = True
+    
+    def scan_text(self, text: str, fold_case: bool = False) -> Generator[Tuple[int, str, Any], None, None]:
+        """Stream every key occurrence in text using the Aho-Corasick automaton.
         
         DSA-USED:
-        - Trie: O(n*m) substring matching where n is text length and m is average key length
+        - Trie: Aho-Corasick scan, O(n + z) where n is text length and z is the
+          number of matches, independent of how many keys are stored
         
         Args:
             text: Text to search in
+            fold_case: Lowercase the text before scanning (keys must be stored lowercase)
+        
+        Yields:
+            (start_index, matched_key, value) tuples in order of match end position;
+            indices refer to the lowercased text when fold_case is set
+        """
+        if not self._automaton_ready:
+            self.build_automaton()
+        if fold_case:
+            text = text.lower()
+        
+        root = self._root
+        node = root
+        
+        for i, char in enumerate(text):
+            while node is not root and char not in node.children:
+                node = node.fail
+            node = node.children.get(char, root)
+            
+            match = node if node.is_end else node.output
+            while match is not None:
+                start = i + 1 - match.depth
+                yield (start, text[start:i + 1], match.value)
+                match = match.output
+    
+    def find_keys_in_text(self, text: str, fold_case: bool = False) -> Set[str]:
+        """Return the distinct keys that occur in text.
+        
+        DSA-USED:
+        - Trie: Aho-Corasick scan, O(n + z)
+        
+        Args:
+            text: Text to search in
+            fold_case: Lowercase the text before scanning (keys must be stored lowercase)
         
         Returns:
-            List of (start_index, matched_key, value) tuples
+            Set of matched keys
         """
-        results = []
+        return {key for _, key, _ in self.scan_text(text, fold_case)}
+    
+    def find_all_in_text(self, text: str) -> List[Tuple[int, str, Any]]:
+        """Find all keys that appear as substrings in the given text.
         
-        for i in range(len(text)):
-            node = self._root
-            j = i
-            
-            while j < len(text) and text[j] in node.children:
-                node = node.children[text[j]]
-                j += 1
-                
-                if node.is_end:
-                    results.append((i, text[i:j], node.value))
+        DSA-USED:
+        - Trie: Aho-Corasick scan, O(n + z) where n is text length and z is the number of matches
         
+        Args:
+            text: Text to search in
+        
+        Returns:
+            List of (start_index, matched_key, value) tuples, ordered by start index then key length
+        """
+        results = list(self.scan_text(text))
+        results.sort(key=lambda match: (match[0], len(match[1])))
         return results
     
     def to_dict(self) -> dict:
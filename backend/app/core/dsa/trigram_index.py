@@ -0,0 +1,147 @@
+"""Trigram index for substring and regex prefiltering.
+
+This module implements an inverted index from character trigrams to the keys
+whose text contains them. A substring query only has to verify the keys that
+contain every trigram of the substring, and a regex query only the keys that
+contain every trigram of the literal runs the regex requires, instead of
+testing the pattern against every stored value.
+
+DSA Concept: Trigram inverted index
+- Posting sets per 3-character gram of the case-folded text
+- Query by intersecting posting sets, smallest first
+- Required literals of a regex extracted from its parse tree
+- Falls back to "no filter" (None) when a query has no usable trigrams
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+
+GRAM_SIZE = 3
+
+
+def trigrams(text: str) -> Set[str]:
+    text = text.lower()
+    return {text[i:i + GRAM_SIZE] for i in range(len(text) - GRAM_SIZE + 1)}
+
+
+def required_literals(pattern: str) -> List[str]:
+    """Literal strings that every match of pattern must contain.
+
+    Only runs of plain characters in the pattern's sequence (including groups)
+    are returned; classes, repeats and alternations end a run. An empty list
+    means nothing is known about matches.
+
+    Args:
+        pattern: Regular expression (compiled case-insensitively by callers)
+
+    Returns:
+        Lowercased literal runs
+    """
+    try:
+        parsed = sre_parse.parse(pattern, re.IGNORECASE)
+    except re.error:
+        return []
+
+    literals = []
+    run = []
+
+    def walk(items):
+        for op, arg in items:
+            if op is sre_parse.LITERAL:
+                run.append(chr(arg))
+            elif op is sre_parse.SUBPATTERN:
+                # Groups match in sequence, so their literals continue the current run
+                walk(arg[-1])
+            elif run:
+                literals.append("".join(run).lower())
+                run.clear()
+
+    walk(parsed)
+    if run:
+        literals.append("".join(run).lower())
+    return literals
+
+
+class TrigramIndex:
+
+    def __init__(self):
+        self._postings: Dict[str, Set[Any]] = {}
+        self._grams: Dict[Any, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._grams)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._grams
+
+    def add(self, key: Any, text: str):
+        """Index text under key, replacing anything previously indexed for key.
+
+        DSA-USED:
+        - Trigram index: O(g) posting set inserts for g distinct trigrams
+
+        Args:
+            key: Item identifier
+            text: Text to index (case-insensitive)
+        """
+        if key in self._grams:
+            self.remove(key)
+        grams = trigrams(text)
+        self._grams[key] = grams
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(key)
+
+    def remove(self, key: Any) -> bool:
+        grams = self._grams.pop(key, None)
+        if grams is None:
+            return False
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(key)
+                if not posting:
+                    del self._postings[gram]
+        return True
+
+    def candidates(self, substrings: Iterable[str]) -> Optional[Set[Any]]:
+        """Keys whose text may contain every one of substrings.
+
+        DSA-USED:
+        - Trigram index: Intersection of posting sets, smallest first
+
+        Args:
+            substrings: Strings that must all occur (case-insensitive)
+
+        Returns:
+            Candidate keys (a superset of the true matches), or None when no
+            substring is long enough to filter on
+        """
+        grams = set()
+        for substring in substrings:
+            grams |= trigrams(substring)
+        if not grams:
+            return None
+
+        postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+        result = set(postings[0])
+        for posting in postings[1:]:
+            if not result:
+                break
+            result &= posting
+        return result
+
+    def search(self, substring: str) -> Optional[Set[Any]]:
+        return self.candidates([substring])
+
+    def search_regex(self, pattern: str) -> Optional[Set[Any]]:
+        return self.candidates(required_literals(pattern))
+
+    def clear(self):
+        self._postings = {}
+        self._grams = {}
@@ -102,6 +102,22 @@ async def lifespan(app: FastAPI):
     tor_status_task = asyncio.create_task(update_tor_status_periodically())
     logger.info("Tor status cache background update task started")
     
+    async def snapshot_tunnel_detector_periodically():
+        interval = settings.NETWORK_TUNNEL_SNAPSHOT_INTERVAL
+        while True:
+            try:
+                await asyncio.sleep(interval)
+                get_tunnel_analyzer().save_snapshot()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in tunnel detector snapshot task: {e}", exc_info=True)
+    
+    tunnel_snapshot_task = None
+    if settings.NETWORK_ENABLE_TUNNEL_DETECTION and settings.NETWORK_TUNNEL_SNAPSHOT_ENABLED:
+        tunnel_snapshot_task = asyncio.create_task(snapshot_tunnel_detector_periodically())
+        logger.info("Tunnel detector snapshot task started")
+    
     logger.info("Initializing custom DSA structures...")
     
     logger.info("Initializing scheduler service...")
@@ -124,6 +140,15 @@ async def lifespan(app: FastAPI):
         pass
     logger.info("Tor status cache background task stopped")
     
+    if tunnel_snapshot_task:
+        tunnel_snapshot_task.cancel()
+        try:
+            await tunnel_snapshot_task
+        except asyncio.CancelledError:
+            pass
+        get_tunnel_analyzer().save_snapshot()
+        logger.info("Tunnel detector snapshot saved")
+    
     try:
         from app.services.scheduler import get_scheduler_service
         scheduler = get_scheduler_service()
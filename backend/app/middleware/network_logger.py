@@ -14,6 +14,7 @@ from jose import JWTError, jwt
 from app.config import settings
 from app.core.database.database import get_db
 from app.core.database.network_log_storage import DBNetworkLogStorage
+from app.services.broadcast_hub import get_broadcast_hub
 
 
 _global_middleware_instance = None
@@ -25,7 +26,11 @@ class NetworkLoggerMiddleware(BaseHTTPMiddleware):
         global _global_middleware_instance
         _global_middleware_instance = self
         self.tunnel_analyzer = tunnel_analyzer
-        self.websocket_clients = set()
+        self.hub = get_broadcast_hub("network")
+    
+    @property
+    def websocket_clients(self):
+        return self.hub.keys()
         
     async def dispatch(self, request: Request, call_next):
         if not settings.NETWORK_ENABLE_LOGGING:
@@ -245,23 +250,13 @@ class NetworkLoggerMiddleware(BaseHTTPMiddleware):
             logger.error(f"Failed to broadcast log: {e}")
     
     async def _send_to_clients(self, message: Dict[str, Any]):
-        if not self.websocket_clients:
-            return
-        
-        disconnected = set()
-        for client in self.websocket_clients:
-            try:
-                await client.send_json(message)
-            except Exception:
-                disconnected.add(client)
-        
-        self.websocket_clients -= disconnected
+        self.hub.publish(message)
     
     def register_websocket_client(self, client):
-        self.websocket_clients.add(client)
+        self.hub.register(client, client)
     
     def unregister_websocket_client(self, client):
-        self.websocket_clients.discard(client)
+        self.hub.unregister(client)
 
 
 def get_network_logger_middleware() -> Optional[NetworkLoggerMiddleware]:
@@ -0,0 +1,258 @@
+"""WebSocket broadcast hub with per-client backpressure.
+
+This module fans messages out to WebSocket clients without letting a slow
+client hold up the others. Each message is serialized once with orjson and
+the same payload is queued on every recipient's bounded send queue; a
+dedicated writer task per client drains its queue. When a queue is full the
+hub either drops the oldest pending message or disconnects the client,
+depending on the configured policy.
+
+This module does not use custom DSA concepts from app.core.dsa.
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+
+import orjson
+from loguru import logger
+
+from app.config import settings
+
+
+DROP_OLDEST = "drop_oldest"
+DISCONNECT = "disconnect"
+
+
+def serialize_message(message: Dict[str, Any]) -> str:
+    """Serialize a message to the JSON text frame sent to clients.
+
+    DSA-USED:
+    - None: This function does not use custom DSA structures from app.core.dsa.
+
+    Args:
+        message: Message dictionary to serialize
+
+    Returns:
+        JSON string (non-JSON types such as datetimes are stringified)
+    """
+    return orjson.dumps(message, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
+class _ClientChannel:
+
+    def __init__(self, key: Hashable, websocket: Any):
+        self.key = key
+        self.websocket = websocket
+        self.queue: deque = deque()
+        self.ready = asyncio.Event()
+        self.sent = 0
+        self.dropped = 0
+        self.task: Optional[asyncio.Task] = None
+
+
+class BroadcastHub:
+
+    def __init__(
+        self,
+        name: str,
+        max_queue: Optional[int] = None,
+        policy: Optional[str] = None,
+        send_timeout: Optional[float] = None,
+        on_disconnect: Optional[Callable[[Hashable], None]] = None
+    ):
+        self.name = name
+        self.max_queue = max_queue or settings.WS_SEND_QUEUE_SIZE
+        self.policy = (policy or settings.WS_BACKPRESSURE_POLICY).lower()
+        if self.policy not in (DROP_OLDEST, DISCONNECT):
+            raise ValueError(f"Unknown backpressure policy: {self.policy}")
+        self.send_timeout = send_timeout or settings.WS_SEND_TIMEOUT
+        self.on_disconnect = on_disconnect
+        self._channels: Dict[Hashable, _ClientChannel] = {}
+        self._stats = {
+            "messages_published": 0,
+            "messages_dropped": 0,
+            "clients_disconnected": 0
+        }
+
+    def __len__(self) -> int:
+        return len(self._channels)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._channels
+
+    def keys(self) -> List[Hashable]:
+        return list(self._channels.keys())
+
+    def register(self, key: Hashable, websocket: Any):
+        """Register a client and start its writer task.
+
+        Must be called from within the running event loop. Registering an
+        existing key replaces the previous connection.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            key: Identifier of the client within this hub
+            websocket: Accepted WebSocket connection
+        """
+        if key in self._channels:
+            self.unregister(key)
+        channel = _ClientChannel(key, websocket)
+        channel.task = asyncio.create_task(self._writer(channel))
+        self._channels[key] = channel
+
+    def unregister(self, key: Hashable):
+        """Remove a client and stop its writer task, discarding pending messages.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            key: Identifier of the client within this hub
+        """
+        channel = self._channels.pop(key, None)
+        if channel and channel.task and channel.task is not asyncio.current_task():
+            channel.task.cancel()
+
+    def publish(self, message: Dict[str, Any], keys: Optional[Iterable[Hashable]] = None) -> int:
+        """Queue a message for a set of clients without waiting on any of them.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            message: Message dictionary to send
+            keys: Recipients (default: every registered client)
+
+        Returns:
+            Number of clients the message was queued for
+        """
+        if keys is None:
+            channels = list(self._channels.values())
+        else:
+            channels = [self._channels[k] for k in keys if k in self._channels]
+        if not channels:
+            return 0
+
+        payload = serialize_message(message)
+        self._stats["messages_published"] += 1
+
+        queued = 0
+        for channel in channels:
+            if self._enqueue(channel, payload):
+                queued += 1
+        return queued
+
+    def send(self, key: Hashable, message: Dict[str, Any]) -> bool:
+        """Queue a message for a single client.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Args:
+            key: Identifier of the recipient
+            message: Message dictionary to send
+
+        Returns:
+            True if the message was queued, False if the client is unknown or was dropped
+        """
+        return self.publish(message, keys=[key]) == 1
+
+    def _enqueue(self, channel: _ClientChannel, payload: str) -> bool:
+        if len(channel.queue) >= self.max_queue:
+            if self.policy == DISCONNECT:
+                logger.warning(f"[{self.name}] Send queue full for client {channel.key}, disconnecting")
+                self._drop_client(channel, close=True)
+                return False
+            channel.queue.popleft()
+            channel.dropped += 1
+            self._stats["messages_dropped"] += 1
+
+        channel.queue.append(payload)
+        channel.ready.set()
+        return True
+
+    async def _writer(self, channel: _ClientChannel):
+        try:
+            while True:
+                await channel.ready.wait()
+                while channel.queue:
+                    payload = channel.queue.popleft()
+                    await asyncio.wait_for(channel.websocket.send_text(payload), timeout=self.send_timeout)
+                    channel.sent += 1
+                channel.ready.clear()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f"[{self.name}] Dropping client {channel.key} after send failure: {e!r}")
+            self._drop_client(channel, close=isinstance(e, asyncio.TimeoutError))
+
+    def _drop_client(self, channel: _ClientChannel, close: bool = False):
+        if self._channels.get(channel.key) is not channel:
+            return
+        self.unregister(channel.key)
+        self._stats["clients_disconnected"] += 1
+
+        if close:
+            asyncio.create_task(self._close(channel.websocket))
+
+        if self.on_disconnect:
+            try:
+                self.on_disconnect(channel.key)
+            except Exception as e:
+                logger.error(f"[{self.name}] Disconnect callback failed for {channel.key}: {e}")
+
+    async def _close(self, websocket: Any):
+        try:
+            await websocket.close(code=1013)
+        except Exception:
+            pass
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get queue depth and drop counters for the hub.
+
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+
+        Returns:
+            Dictionary with hub-wide counters and per-client queue statistics
+        """
+        clients = []
+        for key, channel in self._channels.items():
+            clients.append({
+                "client": key if isinstance(key, str) else hex(id(key)),
+                "queue_depth": len(channel.queue),
+                "sent": channel.sent,
+                "dropped": channel.dropped
+            })
+
+        depths = [c["queue_depth"] for c in clients]
+        return {
+            "hub": self.name,
+            "policy": self.policy,
+            "max_queue": self.max_queue,
+            "clients": len(clients),
+            "queue_depth_total": sum(depths),
+            "queue_depth_max": max(depths) if depths else 0,
+            **self._stats,
+            "per_client": clients
+        }
+
+
+_hubs: Dict[str, BroadcastHub] = {}
+
+
+def get_broadcast_hub(name: str, **kwargs) -> BroadcastHub:
+
+    hub = _hubs.get(name)
+    if hub is None:
+        hub = BroadcastHub(name, **kwargs)
+        _hubs[name] = hub
+    return hub
+
+
+def get_all_hub_metrics() -> List[Dict[str, Any]]:
+
+    return [hub.get_metrics() for hub in _hubs.values()]
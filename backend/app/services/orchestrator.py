@@ -9,7 +9,7 @@ This module uses the following DSA concepts from app.core.dsa:
 - AVLTree: Findings index for timestamp-based queries and O(log n) lookups
 """
 
-from typing import Dict, List, Optional, Any, AsyncGenerator
+from typing import Dict, List, Optional, Any, AsyncGenerator, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -19,11 +19,12 @@ import time
 import base64
 import json
 from threading import Lock
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from loguru import logger
 from fastapi import WebSocket
 
 from app.core.dsa import HashMap, MinHeap, AVLTree
+from app.core.database.blob_store import get_blob_store
 
 from app.collectors.web_recon import WebRecon
 from app.collectors.email_audit import EmailAudit
@@ -34,6 +35,7 @@ from app.collectors.domain_tree import DomainTree
 from app.services.bypass_tester import BypassTester
 from app.services.browser_capture import get_browser_capture_service
 from app.services.visual_similarity import get_visual_similarity_service
+from app.services.broadcast_hub import get_broadcast_hub
 
 
 class Capability(str, Enum):
@@ -263,6 +265,10 @@ class Orchestrator:
         
         self._websocket_connections: Dict[str, WebSocket] = {}
         self._websocket_lock = asyncio.Lock()
+        self._job_hub = get_broadcast_hub(
+            "jobs",
+            on_disconnect=lambda job_id: self._websocket_connections.pop(job_id, None)
+        )
         
         self._tool_executors: Dict[str, Any] = {}
         
@@ -305,10 +311,12 @@ class Orchestrator:
     async def register_websocket(self, job_id: str, websocket: WebSocket):
         async with self._websocket_lock:
             self._websocket_connections[job_id] = websocket
+            self._job_hub.register(job_id, websocket)
             logger.info(f"Registered WebSocket connection for job {job_id}")
     
     async def unregister_websocket(self, job_id: str):
         async with self._websocket_lock:
+            self._job_hub.unregister(job_id)
             if job_id in self._websocket_connections:
                 del self._websocket_connections[job_id]
                 logger.info(f"Unregistered WebSocket connection for job {job_id}")
@@ -318,17 +326,7 @@ class Orchestrator:
             return self._websocket_connections.get(job_id)
     
     async def send_websocket_message(self, job_id: str, message: Dict[str, Any]) -> bool:
-        websocket = await self.get_websocket(job_id)
-        if not websocket:
-            return False
-        
-        try:
-            await websocket.send_json(message)
-            return True
-        except Exception as e:
-            logger.warning(f"Failed to send WebSocket message to job {job_id}: {e}")
-            await self.unregister_websocket(job_id)
-            return False
+        return self._job_hub.send(job_id, message)
     
     def get_capabilities(self) -> List[Dict[str, Any]]:
         return list(CAPABILITY_METADATA.values())
@@ -1000,32 +998,6 @@ class Orchestrator:
                 "timestamp": datetime.now().isoformat()
             }))
         
-        recon_start = time.time()
-        logger.debug(f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Calling WebRecon.discover_assets()")
-        try:
-            results = await self._web_recon.discover_assets(
-                job.target,
-                progress_callback=progress_callback
-            )
-            recon_time = time.time() - recon_start
-            logger.info(
-                f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] WebRecon completed in {recon_time:.3f}s - "
-                f"subdomains: {len(results.get('subdomains', []))}, "
-                f"endpoints: {len(results.get('endpoints', []))}, "
-                f"files: {len(results.get('files', []))}, "
-                f"source_code: {len(results.get('source_code', []))}, "
-                f"admin_panels: {len(results.get('admin_panels', []))}, "
-                f"configs: {len(results.get('configs', []))}"
-            )
-        except Exception as e:
-            recon_time = time.time() - recon_start
-            logger.error(
-                f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] WebRecon failed after {recon_time:.3f}s: {e}",
-                exc_info=True
-            )
-            raise
-        
-
         async def create_and_stream_finding(
             category: str,
             severity: str,
@@ -1074,307 +1046,357 @@ class Orchestrator:
             
             return finding
         
-        subdomains = results.get("subdomains", [])
-        subdomain_count = len(subdomains)
-        logger.debug(f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processing {subdomain_count} subdomains")
-        if subdomains:
-            processed_count = 0
-            for idx, subdomain in enumerate(subdomains[:50]):
+        async def stream_subdomains(subdomains: List[Dict[str, Any]]):
+            subdomain_count = len(subdomains)
+            logger.debug(f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processing {subdomain_count} subdomains")
+            if subdomains:
+                processed_count = 0
+                for idx, subdomain in enumerate(subdomains[:50]):
+                    severity = "info"
+                    risk_score = 20.0
+                    probed = subdomain.get("probed", True)
+                    # Names that share another name's addresses were resolved but never fetched, so https is unknown
+                    if probed and not subdomain.get("https"):
+                        severity = "medium"
+                        risk_score = 50.0
+                
+                    logger.debug(
+                        f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processing subdomain {idx+1}/{min(50, subdomain_count)}: "
+                        f"{subdomain.get('subdomain')} (severity: {severity}, https: {subdomain.get('https')})"
+                    )
+                
+                    await create_and_stream_finding(
+                        category="subdomain",
+                        severity=severity,
+                        title=f"Subdomain Discovered: {subdomain.get('subdomain')}",
+                        description=(
+                            f"Active subdomain found at {subdomain.get('url', subdomain.get('subdomain'))}" if probed else
+                            f"Subdomain {subdomain.get('subdomain')} resolves to the same addresses as "
+                            f"{subdomain.get('probed_via')}; not probed over HTTP"
+                        ),
+                        evidence={
+                            "subdomain": subdomain.get("subdomain"),
+                            "url": subdomain.get("url"),
+                            "status": subdomain.get("status"),
+                            "https": subdomain.get("https"),
+                            "server": subdomain.get("server", ""),
+                            "title": subdomain.get("title", ""),
+                            "probed": probed,
+                            "probed_via": subdomain.get("probed_via"),
+                            "addresses": subdomain.get("addresses", [])
+                        },
+                        affected_assets=[subdomain.get("subdomain")],
+                        recommendations=["Verify subdomain ownership", "Ensure proper security configuration"],
+                        risk_score=risk_score,
+                        source="subdomain_enum"
+                    )
+                    processed_count += 1
+            
+                logger.info(
+                    f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processed {processed_count} subdomain findings "
+                    f"(limited from {subdomain_count} total)"
+                )
+        
+        async def stream_endpoints(endpoints: List[Dict[str, Any]]):
+            endpoint_count = len(endpoints)
+            logger.debug(f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processing {endpoint_count} endpoints")
+            endpoint_processed = 0
+            for idx, endpoint in enumerate(endpoints):
+                path = endpoint.get("path", "")
+                status = endpoint.get("status", 0)
+                url = endpoint.get("url", f"https://{job.target}{path}")
+                was_redirected = endpoint.get("was_redirected", False)
+                final_url = endpoint.get("final_url", url)
+            
+                if status == 404:
+                    logger.debug(
+                        f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Skipping endpoint {path}: "
+                        f"final status is 404 (not accessible)" + (f" (redirected from {url})" if was_redirected else "")
+                    )
+                    continue
+            
                 severity = "info"
                 risk_score = 20.0
-                if not subdomain.get("https"):
-                    severity = "medium"
-                    risk_score = 50.0
+                category = "endpoint"
+                title = f"Endpoint Discovered: {path}"
+                recommendations = ["Review endpoint access controls"]
+            
+                if "/.git" in path:
+                    severity = "critical"
+                    risk_score = 90.0
+                    category = "source_code"
+                    title = "Git Repository Exposed"
+                    recommendations = ["Block access to .git directory immediately", "Check for exposed secrets in git history"]
+                elif path == "/.env" or ".env" in path:
+                    severity = "critical"
+                    risk_score = 95.0
+                    category = "file"
+                    title = "Environment File Exposed"
+                    recommendations = ["Remove .env from web root", "Rotate all exposed credentials"]
+                elif "/.svn" in path or "/.hg" in path or "/.bzr" in path or "/_darcs" in path:
+                    severity = "critical"
+                    risk_score = 85.0
+                    category = "source_code"
+                    title = f"Source Code Repository Exposed: {path}"
+                    recommendations = ["Block access to VCS directory immediately", "Check for exposed secrets"]
+                elif any(admin in path.lower() for admin in ["/admin", "/wp-admin", "/administrator", "/cpanel"]):
+                    severity = "high"
+                    risk_score = 70.0
+                    category = "admin_panel"
+                    title = f"Admin Panel Exposed: {path}"
+                    recommendations = ["Restrict admin access by IP", "Implement strong authentication"]
+                elif any(debug in path.lower() for debug in ["/phpinfo", "/server-status", "/info"]):
+                    severity = "high"
+                    risk_score = 65.0
+                    title = f"Server Information Exposed: {path}"
+                    recommendations = ["Remove debug endpoints from production", "Disable server-status"]
+                elif any(sensitive in path.lower() for sensitive in ["/backup", "/config", "/database"]):
+                    severity = "high"
+                    risk_score = 75.0
+                    category = "config"
+                    title = f"Sensitive Directory Exposed: {path}"
+                    recommendations = ["Remove sensitive files from web root", "Implement access controls"]
+                elif path in ["/robots.txt", "/sitemap.xml"]:
+                    severity = "info"
+                    risk_score = 10.0
+            
+                if status == 200 or (status >= 300 and status < 400):
+                    logger.debug(
+                        f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processing endpoint {idx+1}/{endpoint_count}: "
+                        f"{path} (status: {status}, severity: {severity}, category: {category}, redirected: {was_redirected})"
+                    )
+                    evidence = {
+                        "url": url,
+                        "path": path,
+                        "status_code": status,
+                        "content_length": endpoint.get("content_length", 0),
+                        "content_type": endpoint.get("content_type", ""),
+                        "server": endpoint.get("server", "")
+                    }
+                    if was_redirected:
+                        evidence["final_url"] = final_url
+                        evidence["was_redirected"] = True
                 
+                    await create_and_stream_finding(
+                        category=category,
+                        severity=severity,
+                        title=title,
+                        description=f"Discovered accessible endpoint at {url}" + (f" (redirected to {final_url})" if was_redirected else ""),
+                        evidence=evidence,
+                        affected_assets=[url],
+                        recommendations=recommendations,
+                        risk_score=risk_score,
+                        source="endpoint_scan"
+                    )
+                    endpoint_processed += 1
+        
+            logger.info(
+                f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processed {endpoint_processed} endpoint findings "
+                f"(from {endpoint_count} discovered)"
+            )
+        
+        async def stream_files(files: List[Dict[str, Any]]):
+            file_count = len(files)
+            logger.debug(f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processing {file_count} sensitive files")
+            file_processed = 0
+            for idx, file_info in enumerate(files):
+                path = file_info.get("path", "")
+                url = file_info.get("url", "")
+            
+                severity = "high"
+                risk_score = 80.0
+                if ".env" in path or "config" in path.lower():
+                    severity = "critical"
+                    risk_score = 95.0
+                elif any(ext in path for ext in [".key", ".pem", ".p12", ".pfx"]):
+                    severity = "critical"
+                    risk_score = 90.0
+                elif ".sql" in path or ".db" in path:
+                    severity = "critical"
+                    risk_score = 85.0
+                elif ".log" in path:
+                    severity = "medium"
+                    risk_score = 60.0
+            
                 logger.debug(
-                    f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processing subdomain {idx+1}/{min(50, subdomain_count)}: "
-                    f"{subdomain.get('subdomain')} (severity: {severity}, https: {subdomain.get('https')})"
+                    f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processing file {idx+1}/{file_count}: "
+                    f"{path} (severity: {severity}, size: {file_info.get('content_length', 0)} bytes)"
                 )
-                
                 await create_and_stream_finding(
-                    category="subdomain",
+                    category="file",
                     severity=severity,
-                    title=f"Subdomain Discovered: {subdomain.get('subdomain')}",
-                    description=f"Active subdomain found at {subdomain.get('url', subdomain.get('subdomain'))}",
+                    title=f"Sensitive File Exposed: {path}",
+                    description=f"Exposed sensitive file found at {url}",
                     evidence={
-                        "subdomain": subdomain.get("subdomain"),
-                        "url": subdomain.get("url"),
-                        "status": subdomain.get("status"),
-                        "https": subdomain.get("https", True),
-                        "server": subdomain.get("server", ""),
-                        "title": subdomain.get("title", "")
+                        "url": url,
+                        "path": path,
+                        "status": file_info.get("status"),
+                        "content_length": file_info.get("content_length", 0),
+                        "content_type": file_info.get("content_type", ""),
+                        "file_type": file_info.get("file_type", ""),
+                        "content_preview": file_info.get("content_preview", "")
                     },
-                    affected_assets=[subdomain.get("subdomain")],
-                    recommendations=["Verify subdomain ownership", "Ensure proper security configuration"],
+                    affected_assets=[url],
+                    recommendations=["Remove file from web root", "Review file contents for exposed secrets", "Rotate any exposed credentials"],
                     risk_score=risk_score,
-                    source="subdomain_enum"
+                    source="file_detection"
                 )
-                processed_count += 1
-            
+                file_processed += 1
+        
             logger.info(
-                f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processed {processed_count} subdomain findings "
-                f"(limited from {subdomain_count} total)"
+                f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processed {file_processed} file findings "
+                f"(from {file_count} discovered)"
             )
         
-        endpoints = results.get("endpoints", [])
-        endpoint_count = len(endpoints)
-        logger.debug(f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processing {endpoint_count} endpoints")
-        endpoint_processed = 0
-        for idx, endpoint in enumerate(endpoints):
-            path = endpoint.get("path", "")
-            status = endpoint.get("status", 0)
-            url = endpoint.get("url", f"https://{job.target}{path}")
-            was_redirected = endpoint.get("was_redirected", False)
-            final_url = endpoint.get("final_url", url)
-            
-            if status == 404:
+        async def stream_source_code(source_code: List[Dict[str, Any]]):
+            source_count = len(source_code)
+            logger.debug(f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processing {source_count} source code exposures")
+            for idx, exposure in enumerate(source_code):
                 logger.debug(
-                    f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Skipping endpoint {path}: "
-                    f"final status is 404 (not accessible)" + (f" (redirected from {url})" if was_redirected else "")
+                    f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processing source code exposure {idx+1}/{source_count}: "
+                    f"{exposure.get('type')} at {exposure.get('path')}"
                 )
-                continue
-            
-            severity = "info"
-            risk_score = 20.0
-            category = "endpoint"
-            title = f"Endpoint Discovered: {path}"
-            recommendations = ["Review endpoint access controls"]
-            
-            if "/.git" in path:
-                severity = "critical"
-                risk_score = 90.0
-                category = "source_code"
-                title = "Git Repository Exposed"
-                recommendations = ["Block access to .git directory immediately", "Check for exposed secrets in git history"]
-            elif path == "/.env" or ".env" in path:
-                severity = "critical"
-                risk_score = 95.0
-                category = "file"
-                title = "Environment File Exposed"
-                recommendations = ["Remove .env from web root", "Rotate all exposed credentials"]
-            elif "/.svn" in path or "/.hg" in path or "/.bzr" in path or "/_darcs" in path:
-                severity = "critical"
-                risk_score = 85.0
-                category = "source_code"
-                title = f"Source Code Repository Exposed: {path}"
-                recommendations = ["Block access to VCS directory immediately", "Check for exposed secrets"]
-            elif any(admin in path.lower() for admin in ["/admin", "/wp-admin", "/administrator", "/cpanel"]):
-                severity = "high"
-                risk_score = 70.0
-                category = "admin_panel"
-                title = f"Admin Panel Exposed: {path}"
-                recommendations = ["Restrict admin access by IP", "Implement strong authentication"]
-            elif any(debug in path.lower() for debug in ["/phpinfo", "/server-status", "/info"]):
-                severity = "high"
-                risk_score = 65.0
-                title = f"Server Information Exposed: {path}"
-                recommendations = ["Remove debug endpoints from production", "Disable server-status"]
-            elif any(sensitive in path.lower() for sensitive in ["/backup", "/config", "/database"]):
-                severity = "high"
-                risk_score = 75.0
-                category = "config"
-                title = f"Sensitive Directory Exposed: {path}"
-                recommendations = ["Remove sensitive files from web root", "Implement access controls"]
-            elif path in ["/robots.txt", "/sitemap.xml"]:
-                severity = "info"
-                risk_score = 10.0
+                await create_and_stream_finding(
+                    category="source_code",
+                    severity="critical",
+                    title=f"{exposure.get('type', 'VCS').upper()} Repository Exposed",
+                    description=f"Version control system exposed at {exposure.get('url')}",
+                    evidence={
+                        "type": exposure.get("type"),
+                        "url": exposure.get("url"),
+                        "path": exposure.get("path"),
+                        "status": exposure.get("status"),
+                        "content_length": exposure.get("content_length", 0)
+                    },
+                    affected_assets=[exposure.get("url")],
+                    recommendations=["Block access to VCS directories", "Check git history for exposed secrets", "Rotate all credentials"],
+                    risk_score=90.0,
+                    source="source_code_detection"
+                )
+        
+        async def stream_admin_panels(admin_panels: List[Dict[str, Any]]):
+            admin_count = len(admin_panels)
+            logger.debug(f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processing {admin_count} admin panels")
+            admin_processed = 0
+            for idx, panel in enumerate(admin_panels):
+                status = panel.get("status", 0)
+                url = panel.get("url", "")
+                path = panel.get("path", "")
+                panel_name = panel.get("name", "")
+            
+                if status == 404:
+                    logger.debug(
+                        f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Skipping admin panel {panel_name} at {path}: "
+                        f"final status is 404 (not accessible)" + 
+                        (f" (redirected from {url})" if panel.get("was_redirected") else "")
+                    )
+                    continue
             
-            if status == 200 or (status >= 300 and status < 400):
                 logger.debug(
-                    f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processing endpoint {idx+1}/{endpoint_count}: "
-                    f"{path} (status: {status}, severity: {severity}, category: {category}, redirected: {was_redirected})"
+                    f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processing admin panel {idx+1}/{admin_count}: "
+                    f"{panel_name} at {path}"
                 )
+            
                 evidence = {
+                    "name": panel_name,
                     "url": url,
                     "path": path,
-                    "status_code": status,
-                    "content_length": endpoint.get("content_length", 0),
-                    "content_type": endpoint.get("content_type", ""),
-                    "server": endpoint.get("server", "")
+                    "status": status,
+                    "is_login_page": panel.get("is_login_page", False)
                 }
-                if was_redirected:
-                    evidence["final_url"] = final_url
+                if panel.get("was_redirected"):
+                    evidence["final_url"] = panel.get("final_url")
                     evidence["was_redirected"] = True
-                
+            
+                description = f"Admin panel found at {url}"
+                if panel.get("was_redirected"):
+                    description += f" (redirected to {panel.get('final_url')})"
+            
                 await create_and_stream_finding(
-                    category=category,
-                    severity=severity,
-                    title=title,
-                    description=f"Discovered accessible endpoint at {url}" + (f" (redirected to {final_url})" if was_redirected else ""),
+                    category="admin_panel",
+                    severity=panel.get("severity", "high"),
+                    title=f"Admin Panel Discovered: {panel_name}",
+                    description=description,
                     evidence=evidence,
                     affected_assets=[url],
-                    recommendations=recommendations,
-                    risk_score=risk_score,
-                    source="endpoint_scan"
+                    recommendations=["Restrict access by IP whitelist", "Implement strong authentication", "Enable 2FA"],
+                    risk_score=70.0 if panel.get("severity") == "high" else 50.0,
+                    source="admin_panel_discovery"
                 )
-                endpoint_processed += 1
-        
-        logger.info(
-            f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processed {endpoint_processed} endpoint findings "
-            f"(from {endpoint_count} discovered)"
-        )
-        
-        files = results.get("files", [])
-        file_count = len(files)
-        logger.debug(f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processing {file_count} sensitive files")
-        file_processed = 0
-        for idx, file_info in enumerate(files):
-            path = file_info.get("path", "")
-            url = file_info.get("url", "")
-            
-            severity = "high"
-            risk_score = 80.0
-            if ".env" in path or "config" in path.lower():
-                severity = "critical"
-                risk_score = 95.0
-            elif any(ext in path for ext in [".key", ".pem", ".p12", ".pfx"]):
-                severity = "critical"
-                risk_score = 90.0
-            elif ".sql" in path or ".db" in path:
-                severity = "critical"
-                risk_score = 85.0
-            elif ".log" in path:
-                severity = "medium"
-                risk_score = 60.0
-            
-            logger.debug(
-                f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processing file {idx+1}/{file_count}: "
-                f"{path} (severity: {severity}, size: {file_info.get('content_length', 0)} bytes)"
-            )
-            await create_and_stream_finding(
-                category="file",
-                severity=severity,
-                title=f"Sensitive File Exposed: {path}",
-                description=f"Exposed sensitive file found at {url}",
-                evidence={
-                    "url": url,
-                    "path": path,
-                    "status": file_info.get("status"),
-                    "content_length": file_info.get("content_length", 0),
-                    "content_type": file_info.get("content_type", ""),
-                    "file_type": file_info.get("file_type", ""),
-                    "content_preview": file_info.get("content_preview", "")
-                },
-                affected_assets=[url],
-                recommendations=["Remove file from web root", "Review file contents for exposed secrets", "Rotate any exposed credentials"],
-                risk_score=risk_score,
-                source="file_detection"
-            )
-            file_processed += 1
-        
-        logger.info(
-            f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processed {file_processed} file findings "
-            f"(from {file_count} discovered)"
-        )
+                admin_processed += 1
         
-        source_code = results.get("source_code", [])
-        source_count = len(source_code)
-        logger.debug(f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processing {source_count} source code exposures")
-        for idx, exposure in enumerate(source_code):
-            logger.debug(
-                f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processing source code exposure {idx+1}/{source_count}: "
-                f"{exposure.get('type')} at {exposure.get('path')}"
-            )
-            await create_and_stream_finding(
-                category="source_code",
-                severity="critical",
-                title=f"{exposure.get('type', 'VCS').upper()} Repository Exposed",
-                description=f"Version control system exposed at {exposure.get('url')}",
-                evidence={
-                    "type": exposure.get("type"),
-                    "url": exposure.get("url"),
-                    "path": exposure.get("path"),
-                    "status": exposure.get("status"),
-                    "content_length": exposure.get("content_length", 0)
-                },
-                affected_assets=[exposure.get("url")],
-                recommendations=["Block access to VCS directories", "Check git history for exposed secrets", "Rotate all credentials"],
-                risk_score=90.0,
-                source="source_code_detection"
+            logger.info(
+                f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processed {admin_processed} admin panel findings "
+                f"(from {admin_count} discovered)"
             )
         
-        admin_panels = results.get("admin_panels", [])
-        admin_count = len(admin_panels)
-        logger.debug(f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processing {admin_count} admin panels")
-        admin_processed = 0
-        for idx, panel in enumerate(admin_panels):
-            status = panel.get("status", 0)
-            url = panel.get("url", "")
-            path = panel.get("path", "")
-            panel_name = panel.get("name", "")
-            
-            if status == 404:
+        async def stream_configs(configs: List[Dict[str, Any]]):
+            config_count = len(configs)
+            logger.debug(f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processing {config_count} configuration files")
+            for idx, config in enumerate(configs):
                 logger.debug(
-                    f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Skipping admin panel {panel_name} at {path}: "
-                    f"final status is 404 (not accessible)" + 
-                    (f" (redirected from {url})" if panel.get("was_redirected") else "")
+                    f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processing config file {idx+1}/{config_count}: "
+                    f"{config.get('path')} ({config.get('content_length', 0)} bytes)"
+                )
+                await create_and_stream_finding(
+                    category="config",
+                    severity="critical",
+                    title=f"Configuration File Exposed: {config.get('path')}",
+                    description=f"Exposed configuration file found at {config.get('url')}",
+                    evidence={
+                        "url": config.get("url"),
+                        "path": config.get("path"),
+                        "status": config.get("status"),
+                        "content_length": config.get("content_length", 0),
+                        "content_preview": config.get("content_preview", "")
+                    },
+                    affected_assets=[config.get("url")],
+                    recommendations=["Remove config files from web root", "Review for exposed secrets", "Rotate all credentials"],
+                    risk_score=95.0,
+                    source="config_detection"
                 )
-                continue
-            
-            logger.debug(
-                f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processing admin panel {idx+1}/{admin_count}: "
-                f"{panel_name} at {path}"
-            )
-            
-            evidence = {
-                "name": panel_name,
-                "url": url,
-                "path": path,
-                "status": status,
-                "is_login_page": panel.get("is_login_page", False)
-            }
-            if panel.get("was_redirected"):
-                evidence["final_url"] = panel.get("final_url")
-                evidence["was_redirected"] = True
-            
-            description = f"Admin panel found at {url}"
-            if panel.get("was_redirected"):
-                description += f" (redirected to {panel.get('final_url')})"
-            
-            await create_and_stream_finding(
-                category="admin_panel",
-                severity=panel.get("severity", "high"),
-                title=f"Admin Panel Discovered: {panel_name}",
-                description=description,
-                evidence=evidence,
-                affected_assets=[url],
-                recommendations=["Restrict access by IP whitelist", "Implement strong authentication", "Enable 2FA"],
-                risk_score=70.0 if panel.get("severity") == "high" else 50.0,
-                source="admin_panel_discovery"
-            )
-            admin_processed += 1
         
-        logger.info(
-            f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processed {admin_processed} admin panel findings "
-            f"(from {admin_count} discovered)"
-        )
+        phase_streamers = {
+            "subdomains": stream_subdomains,
+            "endpoints": stream_endpoints,
+            "files": stream_files,
+            "source_code": stream_source_code,
+            "admin_panels": stream_admin_panels,
+            "configs": stream_configs,
+        }
         
-        configs = results.get("configs", [])
-        config_count = len(configs)
-        logger.debug(f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processing {config_count} configuration files")
-        for idx, config in enumerate(configs):
-            logger.debug(
-                f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Processing config file {idx+1}/{config_count}: "
-                f"{config.get('path')} ({config.get('content_length', 0)} bytes)"
+        async def on_phase_complete(phase: str, items: List[Dict[str, Any]]):
+            # Findings go out as each WebRecon phase finishes instead of after the whole scan
+            await phase_streamers[phase](items)
+        
+        recon_start = time.time()
+        logger.debug(f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Calling WebRecon.discover_assets()")
+        try:
+            results = await self._web_recon.discover_assets(
+                job.target,
+                progress_callback=progress_callback,
+                on_phase_complete=on_phase_complete,
+                use_cache=(job.config or {}).get("use_cache", True)
             )
-            await create_and_stream_finding(
-                category="config",
-                severity="critical",
-                title=f"Configuration File Exposed: {config.get('path')}",
-                description=f"Exposed configuration file found at {config.get('url')}",
-                evidence={
-                    "url": config.get("url"),
-                    "path": config.get("path"),
-                    "status": config.get("status"),
-                    "content_length": config.get("content_length", 0),
-                    "content_preview": config.get("content_preview", "")
-                },
-                affected_assets=[config.get("url")],
-                recommendations=["Remove config files from web root", "Review for exposed secrets", "Rotate all credentials"],
-                risk_score=95.0,
-                source="config_detection"
+            recon_time = time.time() - recon_start
+            logger.info(
+                f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] WebRecon completed in {recon_time:.3f}s - "
+                f"subdomains: {len(results.get('subdomains', []))}, "
+                f"endpoints: {len(results.get('endpoints', []))}, "
+                f"files: {len(results.get('files', []))}, "
+                f"source_code: {len(results.get('source_code', []))}, "
+                f"admin_panels: {len(results.get('admin_panels', []))}, "
+                f"configs: {len(results.get('configs', []))}"
             )
+        except Exception as e:
+            recon_time = time.time() - recon_start
+            logger.error(
+                f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] WebRecon failed after {recon_time:.3f}s: {e}",
+                exc_info=True
+            )
+            raise
         
+
         dorks_count = results.get("dorks_generated", 0)
         if dorks_count > 0:
             all_dorks = self._web_recon.generate_dorks(job.target)
@@ -1399,8 +1421,10 @@ class Orchestrator:
         execution_time = time.time() - execution_start
         logger.info(
             f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Exposure discovery completed in {execution_time:.3f}s - "
-            f"total findings: {len(findings)} (subdomains: {subdomain_count}, endpoints: {endpoint_count}, "
-            f"files: {file_count}, source_code: {source_count}, admin_panels: {admin_count}, configs: {config_count})"
+            f"total findings: {len(findings)} (subdomains: {len(results.get('subdomains', []))}, "
+            f"endpoints: {len(results.get('endpoints', []))}, files: {len(results.get('files', []))}, "
+            f"source_code: {len(results.get('source_code', []))}, admin_panels: {len(results.get('admin_panels', []))}, "
+            f"configs: {len(results.get('configs', []))})"
         )
         logger.debug(
             f"[ExposureDiscovery] [job_id={job.id}] [target={job.target}] Finding breakdown by category: "
@@ -1833,6 +1857,7 @@ class Orchestrator:
             max_urls_config = job_config.get("max_urls", settings.DARKWEB_DEFAULT_CRAWL_LIMIT)
             worker_threads_config = job_config.get("worker_threads", settings.DARKWEB_MAX_WORKERS)
             depth_config = job_config.get("depth", 1)
+            urls, crawl_budget = self._plan_darkweb_revisits(job, dark_watch, urls, job_config)
             
 
             crawl_limit = min(max_urls_config, len(urls))
@@ -1858,115 +1883,38 @@ class Orchestrator:
             job.progress = 30
             
 
-            def crawl_and_analyze_url(url: str) -> List[Finding]:
-                
-                url_findings = []
-                url_start_time = time.time()
-                
-                try:
-                    logger.info(
-                        f"[DarkWeb] [job_id={job.id}] Starting parallel crawl of {url}"
-                    )
-                    site = dark_watch.crawl_site(url, depth=depth_config)
-                    url_crawl_time = time.time() - url_start_time
-                    logger.info(
-                        f"[DarkWeb] [job_id={job.id}] Crawled {url} in {url_crawl_time:.2f}s - "
-                        f"Title: {site.title[:50] if site.title else 'N/A'}, "
-                        f"Entities: {len(site.extracted_entities)}, "
-                        f"Keywords matched: {len(site.keywords_matched)}, "
-                        f"Threat level: {site.threat_level.value}"
-                    )
-                    
-
-                    if site.keywords_matched:
-                        finding = Finding(
-                            id=f"find-{uuid.uuid4().hex[:8]}",
-                            capability=Capability.DARK_WEB_INTELLIGENCE,
-                            severity=self._map_threat_to_severity(site.threat_level.value),
-                            title=f"Brand mention found: {site.title}",
-                            description=f"Keyword '{job.target}' found on {site.onion_url}",
-                            evidence={"site": site.to_dict()},
-                            affected_assets=[job.target] if job.target else [],
-                            recommendations=["Review dark web mention", "Monitor for data leaks"],
-                            discovered_at=datetime.now(),
-                            risk_score=site.risk_score
-                        )
-                        url_findings.append(finding)
-                        logger.debug(f"[DarkWeb] Created keyword match finding for {url}")
-                    
-
-                    for entity in site.extracted_entities:
-                        if entity.entity_type in ["email", "credit_card"]:
-                            finding = Finding(
-                                id=f"find-{uuid.uuid4().hex[:8]}",
-                                capability=Capability.DARK_WEB_INTELLIGENCE,
-                                severity="high" if entity.entity_type == "credit_card" else "medium",
-                                title=f"{entity.entity_type.title()} found on dark web",
-                                description=f"{entity.entity_type.title()} '{entity.value}' discovered on {site.onion_url}",
-                                evidence={"entity": entity.to_dict(), "site": site.onion_url},
-                                affected_assets=[entity.value],
-                                recommendations=["Investigate exposure", "Take remediation steps"],
-                                discovered_at=datetime.now(),
-                                risk_score=85.0 if entity.entity_type == "credit_card" else 65.0
-                            )
-                            url_findings.append(finding)
-                            logger.debug(f"[DarkWeb] Created entity finding for {entity.entity_type} from {url}")
-                    
-                except Exception as e:
-                    url_error_time = time.time() - url_start_time
-                    logger.error(
-                        f"[DarkWeb] [job_id={job.id}] Error crawling {url} after {url_error_time:.2f}s - "
-                        f"Error type: {type(e).__name__}, Error: {e}",
-                        exc_info=True
-                    )
-                
-                return url_findings
-            
-
             batch_progress_base = 30
             batch_progress_range = 60
             total_urls = len(urls_to_crawl)
             completed_count = 0
+            # A failed URL that the frontier retries is yielded again, and linked pages add to the seeds
+            crawled_urls = set()
             
             crawl_start_time = time.time()
-            logger.info(f"[DarkWeb] [job_id={job.id}] ThreadPoolExecutor starting with {max_workers} workers for {len(urls_to_crawl)} URLs")
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-
-                future_to_url = {
-                    executor.submit(crawl_and_analyze_url, url): url 
-                    for url in urls_to_crawl
-                }
+            max_pages = crawl_limit + job_config.get("max_additional_crawl", settings.DARKWEB_MAX_ADDITIONAL_CRAWL)
+            if crawl_budget is not None:
+                max_pages = min(max_pages, crawl_budget)
+            async for url, url_findings in self._crawl_darkweb_urls(
+                job, dark_watch, urls_to_crawl, depth_config, max_workers, crawl_timeout, max_pages
+            ):
+                if url_findings:
+                    findings.extend(url_findings)
+                    job.add_findings(url_findings)
+                    logger.info(
+                        f"[DarkWeb] [job_id={job.id}] Stored {len(url_findings)} findings from {url}. "
+                        f"Total findings so far: {len(job.findings)}"
+                    )
                 
 
-                for future in as_completed(future_to_url, timeout=crawl_timeout):
-                    url = future_to_url[future]
-                    try:
-                        url_findings = future.result(timeout=120)
-                        
-
-                        if url_findings:
-                            findings.extend(url_findings)
-                            job.add_findings(url_findings)
-                            logger.info(
-                                f"[DarkWeb] [job_id={job.id}] Stored {len(url_findings)} findings from {url}. "
-                                f"Total findings so far: {len(job.findings)}"
-                            )
-                        
-
-                        completed_count += 1
-                        progress = batch_progress_base + int((completed_count / total_urls) * batch_progress_range)
-                        job.progress = progress
-                        
-                        logger.debug(
-                            f"[DarkWeb] [job_id={job.id}] Progress: {completed_count}/{total_urls} URLs "
-                            f"({progress}%)"
-                        )
-                        
-                    except Exception as e:
-                        logger.error(
-                            f"[DarkWeb] [job_id={job.id}] Error processing result for {url}: {e}",
-                            exc_info=True
-                        )
+                crawled_urls.add(url)
+                completed_count = len(crawled_urls)
+                progress = batch_progress_base + int((min(completed_count, total_urls) / total_urls) * batch_progress_range)
+                job.progress = progress
+                
+                logger.debug(
+                    f"[DarkWeb] [job_id={job.id}] Progress: {completed_count}/{max(completed_count, total_urls)} URLs "
+                    f"({progress}%)"
+                )
             
             crawl_time = time.time() - crawl_start_time
             elapsed_total = time.time() - start_time
@@ -2277,6 +2225,7 @@ class Orchestrator:
             max_urls_config = job_config.get("max_urls", settings.DARKWEB_DEFAULT_CRAWL_LIMIT)
             worker_threads_config = job_config.get("worker_threads", settings.DARKWEB_MAX_WORKERS)
             depth_config = job_config.get("depth", 1)
+            urls, crawl_budget = self._plan_darkweb_revisits(job, dark_watch, urls, job_config)
             
 
             crawl_limit = min(max_urls_config, len(urls))
@@ -2292,106 +2241,38 @@ class Orchestrator:
             await send_progress(30, f"Starting crawl of {len(urls_to_crawl)} URLs")
             
 
-            def crawl_and_analyze_url(url: str) -> List[Finding]:
-                
-                url_findings = []
-                url_start_time = time.time()
-                
-                try:
-                    logger.info(
-                        f"[DarkWeb] [job_id={job.id}] Starting parallel crawl of {url}"
-                    )
-                    site = dark_watch.crawl_site(url, depth=depth_config)
-                    url_crawl_time = time.time() - url_start_time
-                    logger.info(
-                        f"[DarkWeb] [job_id={job.id}] Crawled {url} in {url_crawl_time:.2f}s"
-                    )
-                    
-
-                    if site.keywords_matched:
-                        finding = Finding(
-                            id=f"find-{uuid.uuid4().hex[:8]}",
-                            capability=Capability.DARK_WEB_INTELLIGENCE,
-                            severity=self._map_threat_to_severity(site.threat_level.value),
-                            title=f"Brand mention found: {site.title}",
-                            description=f"Keyword '{job.target}' found on {site.onion_url}",
-                            evidence={"site": site.to_dict()},
-                            affected_assets=[job.target] if job.target else [],
-                            recommendations=["Review dark web mention", "Monitor for data leaks"],
-                            discovered_at=datetime.now(),
-                            risk_score=site.risk_score
-                        )
-                        url_findings.append(finding)
-                    
-
-                    for entity in site.extracted_entities:
-                        if entity.entity_type in ["email", "credit_card"]:
-                            finding = Finding(
-                                id=f"find-{uuid.uuid4().hex[:8]}",
-                                capability=Capability.DARK_WEB_INTELLIGENCE,
-                                severity="high" if entity.entity_type == "credit_card" else "medium",
-                                title=f"{entity.entity_type.title()} found on dark web",
-                                description=f"{entity.entity_type.title()} '{entity.value}' discovered on {site.onion_url}",
-                                evidence={"entity": entity.to_dict(), "site": site.onion_url},
-                                affected_assets=[entity.value],
-                                recommendations=["Investigate exposure", "Take remediation steps"],
-                                discovered_at=datetime.now(),
-                                risk_score=85.0 if entity.entity_type == "credit_card" else 65.0
-                            )
-                            url_findings.append(finding)
-                    
-                except Exception as e:
-                    url_error_time = time.time() - url_start_time
-                    logger.error(
-                        f"[DarkWeb] [job_id={job.id}] Error crawling {url} after {url_error_time:.2f}s: {e}",
-                        exc_info=True
-                    )
-                
-                return url_findings
-            
-
             batch_progress_base = 30
             batch_progress_range = 60
             total_urls = len(urls_to_crawl)
             completed_count = 0
+            # A failed URL that the frontier retries is yielded again, and linked pages add to the seeds
+            crawled_urls = set()
             
             crawl_start_time = time.time()
-            logger.info(f"[DarkWeb] [job_id={job.id}] ThreadPoolExecutor starting with {max_workers} workers")
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_url = {
-                    executor.submit(crawl_and_analyze_url, url): url 
-                    for url in urls_to_crawl
-                }
-                
+            max_pages = crawl_limit + job_config.get("max_additional_crawl", settings.DARKWEB_MAX_ADDITIONAL_CRAWL)
+            if crawl_budget is not None:
+                max_pages = min(max_pages, crawl_budget)
+            async for url, url_findings in self._crawl_darkweb_urls(
+                job, dark_watch, urls_to_crawl, depth_config, max_workers, crawl_timeout, max_pages
+            ):
+                if url_findings:
+                    findings.extend(url_findings)
+                    job.add_findings(url_findings)
+                    
 
-                for future in as_completed(future_to_url, timeout=crawl_timeout):
-                    url = future_to_url[future]
-                    try:
-                        url_findings = future.result(timeout=120)
-                        
-                        if url_findings:
-                            findings.extend(url_findings)
-                            job.add_findings(url_findings)
-                            
-
-                            for finding in url_findings:
-                                await send_finding(finding)
-                            
-                            logger.info(
-                                f"[DarkWeb] [job_id={job.id}] Stored and sent {len(url_findings)} findings from {url}"
-                            )
-                        
+                    for finding in url_findings:
+                        await send_finding(finding)
+                    
+                    logger.info(
+                        f"[DarkWeb] [job_id={job.id}] Stored and sent {len(url_findings)} findings from {url}"
+                    )
+                
 
-                        completed_count += 1
-                        progress = batch_progress_base + int((completed_count / total_urls) * batch_progress_range)
-                        job.progress = progress
-                        await send_progress(progress, f"Crawled {completed_count}/{total_urls} URLs")
-                        
-                    except Exception as e:
-                        logger.error(
-                            f"[DarkWeb] [job_id={job.id}] Error processing result for {url}: {e}",
-                            exc_info=True
-                        )
+                crawled_urls.add(url)
+                completed_count = len(crawled_urls)
+                progress = batch_progress_base + int((min(completed_count, total_urls) / total_urls) * batch_progress_range)
+                job.progress = progress
+                await send_progress(progress, f"Crawled {completed_count}/{max(completed_count, total_urls)} URLs")
             
             crawl_time = time.time() - crawl_start_time
             logger.info(
@@ -2478,6 +2359,246 @@ class Orchestrator:
         )
         return findings
     
+    def _plan_darkweb_revisits(
+        self,
+        job: Job,
+        dark_watch: Any,
+        urls: List[str],
+        job_config: Dict[str, Any]
+    ) -> Tuple[List[str], Optional[int]]:
+        """Restrict a scheduled dark web run to the sites due for a revisit.
+        
+        Ad-hoc jobs crawl everything they discovered. Runs started by a
+        scheduled search only crawl sites the revisit policy considers due
+        (never crawled, or past their change-driven revisit time), most urgent
+        first, up to the run's crawl budget; the rest are recorded in
+        job.metadata['deferred_urls'] for a later run. Scheduled runs also let
+        DarkWatch reuse stored pages for each site's full revisit interval.
+        
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+        
+        Args:
+            job: Job the crawl belongs to
+            dark_watch: DarkWatch instance performing the crawl
+            urls: Discovered onion URLs
+            job_config: Job configuration (crawl_budget overrides the default budget)
+        
+        Returns:
+            (URLs to crawl, crawl budget or None when the run is not budgeted)
+        """
+        from app.config import settings
+        
+        metadata = job_config.get("metadata") or {}
+        policy = getattr(dark_watch, "revisit_policy", None)
+        if not metadata.get("scheduled_search_id") or policy is None:
+            return urls, None
+        dark_watch.scheduled_run = True
+        
+        budget = job_config.get("crawl_budget", settings.DARKWEB_SCHEDULED_CRAWL_BUDGET)
+        try:
+            selected, deferred = policy.plan(urls, budget)
+        except Exception as e:
+            logger.warning(f"[DarkWeb] [job_id={job.id}] Revisit planning failed, crawling all URLs: {e}")
+            return urls, budget
+        
+        job.metadata['deferred_urls'] = deferred
+        logger.info(
+            f"[DarkWeb] [job_id={job.id}] Revisit plan for scheduled run: crawling {len(selected)} of "
+            f"{len(urls)} URLs (budget={budget}), deferring {len(deferred)}"
+        )
+        return selected, budget
+    
+    async def _crawl_darkweb_urls(
+        self,
+        job: Job,
+        dark_watch: Any,
+        urls: List[str],
+        depth: int,
+        max_workers: int,
+        timeout: float,
+        max_pages: Optional[int] = None
+    ) -> AsyncGenerator:
+        """Crawl URLs concurrently and yield findings as each site completes.
+        
+        Seeds go into a persistent CrawlFrontier keyed by the job (or the job's
+        frontier_id config), and workers keep claiming from it until it is empty
+        or max_pages sites have been crawled. Onion links found on a page are
+        pushed back one level deeper with the page's risk score as priority, so
+        the crawl actually recurses to the requested depth, and an interrupted
+        job resumes where it stopped when re-run with the same frontier_id.
+        
+        Uses the async Tor crawler (one pooled SOCKS session) when enabled and
+        available, otherwise falls back to running DarkWatch.crawl_site in a
+        thread pool. Either way the event loop is never blocked on a crawl.
+        
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+        
+        Args:
+            job: Job the crawl belongs to
+            dark_watch: DarkWatch instance performing the crawl
+            urls: Seed onion URLs to crawl
+            depth: Link depth to follow from the seeds
+            max_workers: Thread pool size for the fallback path
+            timeout: Overall crawl timeout in seconds
+            max_pages: Maximum sites to crawl including discovered links (default: len(urls))
+        
+        Yields:
+            Tuples of (url, findings) in completion order
+        """
+        from app.config import settings
+        from app.collectors.darkwatch_modules.crawlers import (
+            AsyncTorCrawler, ASYNC_CRAWL_AVAILABLE, CrawlFrontier
+        )
+        
+        loop = asyncio.get_running_loop()
+        crawler = None
+        executor = None
+        max_pages = max_pages or len(urls)
+        
+        frontier_id = (job.config or {}).get("frontier_id") or f"job-{job.id}"
+        frontier = await loop.run_in_executor(None, CrawlFrontier, frontier_id)
+        added = await loop.run_in_executor(None, frontier.push_many, urls, depth)
+        frontier_stats = await loop.run_in_executor(None, frontier.get_stats)
+        logger.info(
+            f"[DarkWeb] [job_id={job.id}] Frontier '{frontier_id}': {added} new seeds, "
+            f"state={frontier_stats}, max_pages={max_pages}, depth={depth}"
+        )
+        
+        if settings.DARKWEB_ASYNC_CRAWL and ASYNC_CRAWL_AVAILABLE:
+            crawler = AsyncTorCrawler()
+            concurrency = crawler.concurrency
+            logger.info(
+                f"[DarkWeb] [job_id={job.id}] Async crawl starting for up to {max_pages} URLs "
+                f"(concurrency={crawler.concurrency}, per_host={crawler.per_host_concurrency})"
+            )
+            
+            def crawl(url: str, entry_depth: int):
+                return dark_watch.crawl_site_async(url, crawler, depth=entry_depth)
+        else:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            concurrency = max_workers
+            logger.info(f"[DarkWeb] [job_id={job.id}] ThreadPoolExecutor starting with {max_workers} workers for up to {max_pages} URLs")
+            
+            def crawl(url: str, entry_depth: int):
+                return loop.run_in_executor(executor, lambda: dark_watch.crawl_site(url, depth=entry_depth))
+        
+        async def crawl_and_analyze_url(url: str, entry_depth: int):
+            url_start_time = time.time()
+            try:
+                logger.info(f"[DarkWeb] [job_id={job.id}] Starting parallel crawl of {url}")
+                site = await crawl(url, entry_depth)
+                logger.info(
+                    f"[DarkWeb] [job_id={job.id}] Crawled {url} in {time.time() - url_start_time:.2f}s - "
+                    f"Title: {site.title[:50] if site.title else 'N/A'}, "
+                    f"Entities: {len(site.extracted_entities)}, "
+                    f"Keywords matched: {len(site.keywords_matched)}, "
+                    f"Threat level: {site.threat_level.value}"
+                )
+                return url, site, self._build_darkweb_site_findings(job, site)
+            except Exception as e:
+                logger.error(
+                    f"[DarkWeb] [job_id={job.id}] Error crawling {url} after {time.time() - url_start_time:.2f}s - "
+                    f"Error type: {type(e).__name__}, Error: {e}",
+                    exc_info=True
+                )
+                return url, None, []
+        
+        tasks: Dict[asyncio.Task, Any] = {}
+        started = 0
+        deadline = loop.time() + timeout
+        try:
+            while True:
+                if started < max_pages and len(tasks) < concurrency:
+                    entries = await loop.run_in_executor(
+                        None, frontier.claim, min(concurrency - len(tasks), max_pages - started)
+                    )
+                    for entry in entries:
+                        tasks[asyncio.create_task(crawl_and_analyze_url(entry.url, entry.depth))] = entry
+                    started += len(entries)
+                
+                if not tasks:
+                    if started >= max_pages or await loop.run_in_executor(None, frontier.pending_count) == 0:
+                        break
+                    # Only politeness-delayed hosts (or hosts claimed elsewhere) are left
+                    await asyncio.sleep(min(frontier.next_ready_in() or 1.0, max(deadline - loop.time(), 0)))
+                    if loop.time() >= deadline:
+                        raise asyncio.TimeoutError()
+                    continue
+                
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError()
+                wait_timeout = remaining
+                next_slot = frontier.next_ready_in()
+                if started < max_pages and len(tasks) < concurrency and next_slot > 0:
+                    wait_timeout = min(remaining, next_slot)
+                done, _ = await asyncio.wait(tasks, timeout=wait_timeout, return_when=asyncio.FIRST_COMPLETED)
+                
+                for task in done:
+                    entry = tasks.pop(task)
+                    url, site, url_findings = task.result()
+                    if site is None:
+                        await loop.run_in_executor(None, frontier.fail, entry)
+                    else:
+                        await loop.run_in_executor(
+                            None, frontier.complete, entry, site.linked_sites, site.risk_score
+                        )
+                    yield url, url_findings
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await loop.run_in_executor(None, frontier.release)
+            frontier_stats = await loop.run_in_executor(None, frontier.get_stats)
+            logger.info(f"[DarkWeb] [job_id={job.id}] Frontier '{frontier_id}' state: {frontier_stats}")
+            if crawler is not None:
+                logger.info(f"[DarkWeb] [job_id={job.id}] Async crawler stats: {crawler.get_stats()}")
+                await crawler.close()
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _build_darkweb_site_findings(self, job: Job, site: Any) -> List[Finding]:
+        
+        url_findings = []
+        
+        if site.keywords_matched:
+            finding = Finding(
+                id=f"find-{uuid.uuid4().hex[:8]}",
+                capability=Capability.DARK_WEB_INTELLIGENCE,
+                severity=self._map_threat_to_severity(site.threat_level.value),
+                title=f"Brand mention found: {site.title}",
+                description=f"Keyword '{job.target}' found on {site.onion_url}",
+                evidence={"site": site.to_dict()},
+                affected_assets=[job.target] if job.target else [],
+                recommendations=["Review dark web mention", "Monitor for data leaks"],
+                discovered_at=datetime.now(),
+                risk_score=site.risk_score
+            )
+            url_findings.append(finding)
+            logger.debug(f"[DarkWeb] Created keyword match finding for {site.onion_url}")
+        
+
+        for entity in site.extracted_entities:
+            if entity.entity_type in ["email", "credit_card"]:
+                finding = Finding(
+                    id=f"find-{uuid.uuid4().hex[:8]}",
+                    capability=Capability.DARK_WEB_INTELLIGENCE,
+                    severity="high" if entity.entity_type == "credit_card" else "medium",
+                    title=f"{entity.entity_type.title()} found on dark web",
+                    description=f"{entity.entity_type.title()} '{entity.value}' discovered on {site.onion_url}",
+                    evidence={"entity": entity.to_dict(), "site": site.onion_url},
+                    affected_assets=[entity.value],
+                    recommendations=["Investigate exposure", "Take remediation steps"],
+                    discovered_at=datetime.now(),
+                    risk_score=85.0 if entity.entity_type == "credit_card" else 65.0
+                )
+                url_findings.append(finding)
+                logger.debug(f"[DarkWeb] Created entity finding for {entity.entity_type} from {site.onion_url}")
+        
+        return url_findings
+    
     def _map_threat_to_severity(self, threat_level: str) -> str:
         mapping = {
             "critical": "critical",
@@ -2576,9 +2697,20 @@ class Orchestrator:
 
             if not hasattr(job, 'metadata'):
                 job.metadata = {}
+            # Screenshot and HAR go to the blob store; job metadata keeps only their digests.
+            # Compressing a multi-MB HAR would block the event loop, so writes run in the executor
+            blob_store = get_blob_store()
+            loop = asyncio.get_running_loop()
+            screenshot_b64 = capture_result.get('screenshot')
+            screenshot_blob = None
+            if screenshot_b64:
+                screenshot_blob = await loop.run_in_executor(None, blob_store.put, base64.b64decode(screenshot_b64))
+            har_blob = None
+            if capture_result.get('har'):
+                har_blob = await loop.run_in_executor(None, blob_store.put_json, capture_result['har'])
             job.metadata['capture'] = {
-                'screenshot': capture_result.get('screenshot'),
-                'har': capture_result.get('har'),
+                'screenshot_blob': screenshot_blob,
+                'har_blob': har_blob,
                 'final_url': capture_result.get('final_url'),
                 'title': capture_result.get('title'),
                 'redirect_chain': capture_result.get('redirect_chain', []),
@@ -8,6 +8,9 @@ This module does not directly use custom DSA concepts from app.core.dsa.
 
 from typing import Dict, Any, Optional
 from datetime import datetime
+from pathlib import Path
+import os
+import msgpack
 from loguru import logger
 
 from app.config import settings
@@ -127,6 +130,64 @@ class TunnelAnalyzer:
             logger.error(f"Error getting detector stats: {e}")
             return {}
 
+    
+    def save_snapshot(self, path: Optional[Path] = None) -> bool:
+        """Write the detector baseline snapshot to disk.
+        
+        The file is written to a temporary sibling and renamed into place so
+        a crash mid-write never leaves a truncated snapshot behind.
+        
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+        
+        Args:
+            path: Snapshot file path (defaults to NETWORK_TUNNEL_SNAPSHOT_PATH)
+        
+        Returns:
+            True if the snapshot was written, False otherwise
+        """
+        path = Path(path or settings.NETWORK_TUNNEL_SNAPSHOT_PATH)
+        try:
+            payload = msgpack.packb(self.detector.export_snapshot(), use_bin_type=True)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(path.suffix + ".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+            logger.debug(f"Tunnel detector snapshot written ({len(payload)} bytes) to {path}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to write tunnel detector snapshot: {e}")
+            return False
+    
+    def load_snapshot(self, path: Optional[Path] = None) -> bool:
+        """Warm-restart the detector from a snapshot written by save_snapshot.
+        
+        DSA-USED:
+        - None: This function does not use custom DSA structures from app.core.dsa.
+        
+        Args:
+            path: Snapshot file path (defaults to NETWORK_TUNNEL_SNAPSHOT_PATH)
+        
+        Returns:
+            True if a snapshot was restored, False otherwise
+        """
+        path = Path(path or settings.NETWORK_TUNNEL_SNAPSHOT_PATH)
+        if not path.exists():
+            return False
+        try:
+            with open(path, "rb") as f:
+                snapshot = msgpack.unpackb(f.read(), raw=False, strict_map_key=False)
+            restored = self.detector.restore_snapshot(
+                snapshot,
+                max_seconds=settings.NETWORK_TUNNEL_SNAPSHOT_MAX_LOAD_SECONDS
+            )
+            logger.info(f"Tunnel detector restored {restored} connection baselines from {path}")
+            return True
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable tunnel detector snapshot {path}: {e}")
+            return False
+
 
 
 _tunnel_analyzer: Optional[TunnelAnalyzer] = None
@@ -137,6 +198,8 @@ def get_tunnel_analyzer() -> TunnelAnalyzer:
     global _tunnel_analyzer
     if _tunnel_analyzer is None:
         _tunnel_analyzer = TunnelAnalyzer()
+        if settings.NETWORK_TUNNEL_SNAPSHOT_ENABLED:
+            _tunnel_analyzer.load_snapshot()
     return _tunnel_analyzer
 
 
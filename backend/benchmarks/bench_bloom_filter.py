@@ -0,0 +1,77 @@
+"""BloomFilter vs CompactBloomFilter memory and throughput benchmark.
+
+Measures the allocation size of each filter and add/lookup throughput, both
+item-at-a-time and through the batch APIs.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_bloom_filter --expected 1000000 --items 200000
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+from core.dsa.bloom_filter import BloomFilter, CompactBloomFilter
+
+
+def _measure_alloc(factory):
+    tracemalloc.start()
+    bloom = factory()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return bloom, peak
+
+
+def _rate(count: int, seconds: float) -> str:
+    return f"{count / seconds:>12,.0f} ops/s"
+
+
+def run(expected: int, fpr: float, items: int):
+    present = [f"http://{i:016x}.onion/path" for i in range(items)]
+    absent = [f"http://{i:016x}.onion/other" for i in range(items)]
+
+    for name, cls in (("BloomFilter", BloomFilter), ("CompactBloomFilter", CompactBloomFilter)):
+        bloom, peak = _measure_alloc(lambda: cls(expected_items=expected, false_positive_rate=fpr))
+
+        start = time.perf_counter()
+        for item in present:
+            bloom.add(item)
+        add_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        hits = sum(1 for item in present if bloom.contains(item))
+        lookup_time = time.perf_counter() - start
+
+        false_positives = sum(1 for item in absent if bloom.contains(item))
+
+        print(f"{name}")
+        print(f"  allocation:   {peak / (1024 * 1024):>10.1f} MiB ({bloom.size_bits:,} bits, k={bloom.num_hashes})")
+        print(f"  add:          {_rate(items, add_time)}")
+        print(f"  contains:     {_rate(items, lookup_time)} (hits={hits})")
+        print(f"  observed fpr: {false_positives / items:.5f} (target {fpr})")
+
+        if hasattr(bloom, "contains_many"):
+            bloom.clear()
+            start = time.perf_counter()
+            bloom.add_many(present)
+            batch_add = time.perf_counter() - start
+            start = time.perf_counter()
+            bloom.contains_many(absent)
+            batch_lookup = time.perf_counter() - start
+            print(f"  add_many:     {_rate(items, batch_add)}")
+            print(f"  contains_many:{_rate(items, batch_lookup)}")
+        print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--expected", type=int, default=1_000_000)
+    parser.add_argument("--fpr", type=float, default=0.001)
+    parser.add_argument("--items", type=int, default=200_000)
+    args = parser.parse_args()
+    run(args.expected, args.fpr, args.items)
@@ -0,0 +1,132 @@
+"""Repeated BeautifulSoup parses vs single-pass parse_html CPU time per page.
+
+Builds synthetic onion pages (or reads every file under --corpus) and measures
+per-page CPU time for the previous pipeline, which parsed each page four times
+(title and links, visible text, the connector's YARA text and title, link
+discovery), and for one parse_html call that yields all of it. Also checks that
+both produce the same title, text and links.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_html_parse --pages 200
+"""
+
+import argparse
+import os
+import random
+import time
+
+from bs4 import BeautifulSoup
+
+from app.collectors.darkwatch_modules.extractors.utils.html_parser import parse_html
+
+
+_WORDS = (
+    "market vendor escrow shipping listing forum thread reply login register "
+    "contact support price review customer product stealth tracking account "
+    "wallet payment deposit withdraw the and for with your from this that"
+).split()
+
+
+def _sentence(words: int) -> str:
+    return " ".join(random.choice(_WORDS) for _ in range(words))
+
+
+def _onion() -> str:
+    return "".join(random.choice("abcdefghijklmnopqrstuvwxyz234567") for _ in range(56)) + ".onion"
+
+
+def _page(blocks: int) -> bytes:
+    parts = [
+        "<!DOCTYPE html><html><head>",
+        f"<title>{_sentence(4)}</title>",
+        "<style>body { color: #333; } .nav a { margin: 4px; }</style>",
+        "<script>var tracking = {id: 42, path: location.pathname};</script>",
+        "</head><body><div class='nav'>"
+    ]
+    for _ in range(blocks):
+        kind = random.random()
+        if kind < 0.3:
+            parts.append(f"<a href='/listing/{random.randint(1, 9999)}.php'>{_sentence(3)}</a>")
+        elif kind < 0.45:
+            parts.append(f"<a href='http://{_onion()}/'>{_sentence(2)}</a>")
+        elif kind < 0.5:
+            parts.append(f"<form action='/search' method='post'><input name='q'><button>{_sentence(1)}</button></form>")
+        elif kind < 0.55:
+            parts.append(f"<!-- {_sentence(5)} --><script>console.log('{_sentence(3)}');</script>")
+        else:
+            parts.append(f"<div><p>{_sentence(30)}</p><span>{_sentence(8)}</span></div>")
+    parts.append("</div></body></html>")
+    return "".join(parts).encode("utf-8")
+
+
+def _load_corpus(corpus_dir: str):
+    pages = []
+    for root, _, files in os.walk(corpus_dir):
+        for name in files:
+            with open(os.path.join(root, name), "rb") as f:
+                pages.append(f.read())
+    return pages
+
+
+def _visible_text(content: bytes) -> str:
+    soup = BeautifulSoup(content, features="lxml")
+    for s in soup(['script', 'style']):
+        s.decompose()
+    return ' '.join(soup.stripped_strings)
+
+
+def legacy_pipeline(content: bytes):
+    soup = BeautifulSoup(content, features="lxml")
+    title_tag = soup.find('title')
+    title = title_tag.get_text().strip() if title_tag else None
+    links = [link['href'] for link in soup.find_all('a', href=True) if link['href']]
+
+    text = _visible_text(content)
+
+    _visible_text(content).lower()
+    BeautifulSoup(content, features="lxml").find('title')
+
+    body = BeautifulSoup(content, features="lxml").find('body')
+    body_hrefs = [raw.get('href') for raw in body.findAll() if raw.get('href') is not None] if body else []
+    return title, text, links, body_hrefs
+
+
+def single_pass(content: bytes):
+    page = parse_html(content)
+    return page.title, page.text, page.links, page.body_hrefs
+
+
+def run(pages, repeat: int):
+    for index, page in enumerate(pages):
+        expected = legacy_pipeline(page)
+        actual = single_pass(page)
+        if expected != actual:
+            fields = [name for name, a, b in zip(("title", "text", "links", "body_hrefs"), expected, actual) if a != b]
+            print(f"MISMATCH on page {index}: {', '.join(fields)}")
+            break
+    else:
+        print(f"Results identical on {len(pages)} pages ({sum(map(len, pages)) / 1024:.0f} KB)")
+
+    timings = {}
+    for name, pipeline in (("BeautifulSoup x4", legacy_pipeline), ("parse_html x1", single_pass)):
+        start = time.process_time()
+        for _ in range(repeat):
+            for page in pages:
+                pipeline(page)
+        timings[name] = (time.process_time() - start) / (repeat * len(pages)) * 1000
+        print(f"{name:<18} {timings[name]:>8.2f} ms CPU/page")
+    print(f"speedup            {timings['BeautifulSoup x4'] / timings['parse_html x1']:>8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--blocks", type=int, default=150)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--corpus", help="Directory of saved HTML pages to use instead of synthetic pages")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    random.seed(args.seed)
+    corpus = _load_corpus(args.corpus) if args.corpus else [_page(args.blocks) for _ in range(args.pages)]
+    run(corpus, args.repeat)
@@ -0,0 +1,163 @@
+"""Subdomain brute force throughput against a local stub DNS server.
+
+Starts a UDP DNS server on 127.0.0.1 (in its own thread) that answers A
+queries for a set of existing names, returns NXDOMAIN for everything
+else and, with --wildcard, answers every other name in the zone with one
+wildcard address. The server only keeps --capacity queries in progress and
+drops the rest, like an overloaded resolver, so the adaptive window has
+something to adapt to.
+
+The same wordlist (written to a temp file and read lazily) is brute forced
+with a fixed window at the maximum concurrency and with the adaptive window,
+and words/s, hits, wildcard-filtered names, retries and errors are reported
+for both.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_subdomain_bruteforce --words 20000 --wildcard
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dns.message
+import dns.rcode
+import dns.rdatatype
+import dns.rrset
+
+from app.collectors.dns_resolver import AsyncDNSResolver
+from app.collectors.subdomain_bruteforce import SubdomainBruteForcer, iter_wordlist
+
+
+DOMAIN = "bench.test"
+WILDCARD_ADDRESS = "10.255.255.1"
+
+
+class StubDNSProtocol(asyncio.DatagramProtocol):
+
+    def __init__(self, existing, wildcard: bool, capacity: int, latency: float):
+        self.existing = existing
+        self.wildcard = wildcard
+        self.capacity = capacity
+        self.latency = latency
+        self.pending = 0
+        self.answered = 0
+        self.dropped = 0
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        if self.pending >= self.capacity:
+            self.dropped += 1
+            return
+        self.pending += 1
+        asyncio.get_running_loop().call_later(self.latency, self._answer, data, addr)
+
+    def _answer(self, data, addr):
+        self.pending -= 1
+        query = dns.message.from_wire(data)
+        response = dns.message.make_response(query)
+        question = query.question[0]
+        name = question.name.to_text().rstrip(".")
+
+        address = self.existing.get(name)
+        if address is None and self.wildcard and name.endswith(f".{DOMAIN}"):
+            address = WILDCARD_ADDRESS
+        if address is not None and question.rdtype == dns.rdatatype.A:
+            response.answer.append(dns.rrset.from_text(question.name, 300, "IN", "A", address))
+        else:
+            if address is None:
+                response.set_rcode(dns.rcode.NXDOMAIN)
+            response.authority.append(
+                dns.rrset.from_text(f"{DOMAIN}.", 300, "IN", "SOA", f"ns.{DOMAIN}. admin.{DOMAIN}. 1 3600 600 86400 60")
+            )
+        self.answered += 1
+        self.transport.sendto(response.to_wire(), addr)
+
+
+def start_server(existing, wildcard: bool, capacity: int, latency: float):
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+    state = {}
+
+    async def serve():
+        transport, protocol = await loop.create_datagram_endpoint(
+            lambda: StubDNSProtocol(existing, wildcard, capacity, latency), local_addr=("127.0.0.1", 0)
+        )
+        state["port"] = transport.get_extra_info("sockname")[1]
+        state["protocol"] = protocol
+        ready.set()
+
+    threading.Thread(target=lambda: (loop.run_until_complete(serve()), loop.run_forever()), daemon=True).start()
+    ready.wait()
+    return state["port"], state["protocol"]
+
+
+def write_wordlist(words: int, hits: int):
+    fd, path = tempfile.mkstemp(prefix="wordlist-", suffix=".txt")
+    existing = {}
+    with os.fdopen(fd, "w") as f:
+        for i in range(words):
+            word = f"w{i:07d}"
+            f.write(word + "\n")
+            if i % max(words // hits, 1) == 0 and len(existing) < hits:
+                existing[f"{word}.{DOMAIN}"] = f"10.0.{len(existing) // 250}.{len(existing) % 250 + 1}"
+    return path, existing
+
+
+async def brute_force(port: int, path: str, min_concurrency: int, max_concurrency: int, timeout: float):
+    resolver = AsyncDNSResolver(
+        nameservers=["127.0.0.1"], port=port, timeout=timeout, max_concurrency=max_concurrency, negative_ttl=0
+    )
+    engine = SubdomainBruteForcer(resolver, max_concurrency=max_concurrency, min_concurrency=min_concurrency, lifetime=timeout)
+    start = time.perf_counter()
+    found = 0
+    async for _ in engine.stream(DOMAIN, iter_wordlist(path)):
+        found += 1
+    return found, time.perf_counter() - start, engine.stats
+
+
+def run(args):
+    path, existing = write_wordlist(args.words, args.hits)
+    port, protocol = start_server(existing, args.wildcard, args.capacity, args.latency)
+    print(
+        f"{args.words} words, {len(existing)} existing names, wildcard={args.wildcard}, "
+        f"server capacity {args.capacity} in progress, {args.latency * 1000:.0f} ms latency"
+    )
+    try:
+        for label, min_concurrency in (("fixed", args.max_concurrency), ("adaptive", args.min_concurrency)):
+            dropped = protocol.dropped
+            found, elapsed, stats = asyncio.run(
+                brute_force(port, path, min_concurrency, args.max_concurrency, args.timeout)
+            )
+            print(
+                f"{label:<9} {stats['words'] / elapsed:>8.0f} words/s  {elapsed:>7.2f}s  found {found:>5}  "
+                f"wildcard filtered {stats['wildcard_filtered']:>6}  retries {stats['retries']:>5}  "
+                f"errors {stats['errors']:>4}  dropped {protocol.dropped - dropped:>6}"
+            )
+            if found != len(existing):
+                print(f"          MISSED {len(existing) - found} existing names")
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=20000)
+    parser.add_argument("--hits", type=int, default=200)
+    parser.add_argument("--wildcard", action="store_true", help="Answer every other name in the zone with a wildcard address")
+    parser.add_argument("--capacity", type=int, default=64, help="Queries the stub server keeps in progress before dropping")
+    parser.add_argument("--latency", type=float, default=0.005, help="Seconds before the stub server answers")
+    parser.add_argument("--min-concurrency", type=int, default=10)
+    parser.add_argument("--max-concurrency", type=int, default=200)
+    parser.add_argument("--timeout", type=float, default=1.0)
+    run(parser.parse_args())
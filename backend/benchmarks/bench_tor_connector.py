@@ -0,0 +1,86 @@
+"""Per-page TorConnector overhead benchmark.
+
+Compares the old per-page setup (a new TorConnector and freshly compiled YARA
+rules for every page) with the pooled connector and cached rules. Network
+time is excluded: each iteration feeds the same HTML page straight into
+TorConnector.process_response.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_tor_connector --pages 200
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.collectors.darkwatch_modules.crawlers import tor_connector
+from app.collectors.darkwatch_modules.crawlers.connector_pool import TorConnectorPool
+from app.collectors.darkwatch_modules.crawlers.tor_connector import TorConnector, clear_compiled_rules
+
+
+CATEGORY_RULES = "\n".join(
+    f'rule category_{i} {{ meta: score = "{i % 5}" strings: $a = "category{i}" nocase condition: $a }}'
+    for i in range(200)
+)
+KEYWORD_RULES = "\n".join(
+    f'rule keyword_{i} {{ meta: score = "{i % 3}" strings: $a = "keyword{i}" nocase condition: $a }}'
+    for i in range(200)
+)
+PAGE = (
+    "<html><head><title>Benchmark market</title></head><body>"
+    + "".join(f"<p>listing {i} category{i % 200} keyword{i % 50}</p><a href='/item/{i}'>item</a>" for i in range(500))
+    + "</body></html>"
+).encode()
+
+
+def _write(path: str, content: str) -> str:
+    with open(path, "w") as f:
+        f.write(content)
+    return path
+
+
+def run(pages: int):
+    workdir = tempfile.mkdtemp(prefix="bench_tor_connector_")
+    tor_connector.YARA_CATEGORIES_FILE = _write(os.path.join(workdir, "categories.yar"), CATEGORY_RULES)
+    tor_connector.YARA_KEYWORDS_FILE = _write(os.path.join(workdir, "keywords.yar"), KEYWORD_RULES)
+    connector_kwargs = {"db_path": workdir, "db_name": "bench.db"}
+
+    seed = TorConnector(**connector_kwargs)
+    seed.database.save(url="benchmark.onion", source="Benchmark", type="URI", baseurl="benchmark.onion")
+    url_record = seed.database.select_url(url="benchmark.onion")[0]
+
+    start = time.perf_counter()
+    for _ in range(pages):
+        clear_compiled_rules()
+        connector = TorConnector(**connector_kwargs)
+        connector.process_response(url_record, 200, PAGE)
+    before = (time.perf_counter() - start) / pages
+
+    clear_compiled_rules()
+    pool = TorConnectorPool(**connector_kwargs)
+    start = time.perf_counter()
+    for _ in range(pages):
+        connector = pool.get()
+        connector.process_response(url_record, 200, PAGE)
+    after = (time.perf_counter() - start) / pages
+
+    print(f"pages:                      {pages}")
+    print(f"per-page (new connector):   {before * 1000:.2f} ms")
+    print(f"per-page (pooled + cached): {after * 1000:.2f} ms")
+    print(f"speedup:                    {before / after:.1f}x")
+    print(f"pool stats:                 {pool.get_stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=200)
+    args = parser.parse_args()
+
+    if not tor_connector.YARA_AVAILABLE:
+        sys.exit("yara-python is required for this benchmark")
+    run(args.pages)
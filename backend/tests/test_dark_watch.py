@@ -0,0 +1,62 @@
+"""Tests for DarkWatch crawl indexing."""
+
+import pytest
+
+from app.config import settings
+from app.core.database import blob_store
+from app.collectors.dark_watch import DarkWatch, SiteCategory
+from app.collectors.darkwatch_modules.intel_store import DarkWebIntelStore
+
+
+ONION_URL = "http://" + "a" * 56 + ".onion"
+
+
+@pytest.fixture
+def intel_store(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "DARKWEB_INTEL_STORE_ENABLED", False)
+    monkeypatch.setattr(settings, "DARKWEB_REVISIT_ENABLED", False)
+    monkeypatch.setattr(blob_store, "_blob_store", blob_store.BlobStore(root=tmp_path / "blobs", compression="gzip"))
+    return DarkWebIntelStore(db_file=str(tmp_path / "intel_store.db"))
+
+
+def _dark_watch(intel_store: DarkWebIntelStore) -> DarkWatch:
+    dark_watch = DarkWatch()
+    dark_watch.intel_store = intel_store
+    return dark_watch
+
+
+def test_entities_from_stored_page_are_searchable(intel_store, monkeypatch):
+    first = _dark_watch(intel_store)
+    monkeypatch.setattr(first, "_crawl_site_real", lambda onion_url: {
+        "title": "Leaked accounts",
+        "content": "Contact admin@evil.com for the full dump of the customer database.",
+        "category": SiteCategory.UNKNOWN,
+        "linked_onions": []
+    })
+    first.crawl_site(ONION_URL, depth=0)
+    assert [entity.value for entity in first.search_entities(value_pattern="evil")] == ["admin@evil.com"]
+
+    second = _dark_watch(intel_store)
+
+    def fail_crawl(onion_url):
+        raise AssertionError("stored page should be reused instead of crawling")
+
+    monkeypatch.setattr(second, "_crawl_site_real", fail_crawl)
+    site = second.crawl_site(ONION_URL, depth=0)
+
+    assert [entity.value for entity in site.extracted_entities] == ["admin@evil.com"]
+    assert len(second.entities) == 1
+    assert [entity.value for entity in second.search_entities(value_pattern="evil")] == ["admin@evil.com"]
+    assert list(second.entities_by_type.get("email", {})) == ["admin@evil.com"]
+
+
+def test_unknown_page_category_falls_back_to_text_analysis(intel_store):
+    dark_watch = _dark_watch(intel_store)
+    site = dark_watch._index_site(ONION_URL, {
+        "title": "Ransomware decrypt portal",
+        "content": "Your files are encrypted files. Pay the ransom to decrypt them. Ransomware support.",
+        "category": SiteCategory.UNKNOWN,
+        "linked_onions": []
+    }, depth=0, crawl_start_time=0.0)
+
+    assert site.category == SiteCategory.RANSOMWARE
@@ -0,0 +1,54 @@
+"""Tests for soft-404 filtering in PathProber."""
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from app.collectors.http_pool import ScanHttpPool
+from app.collectors.web_recon import WebRecon
+
+
+TEMPLATE = (
+    "<html><head><title>Example Corp</title>"
+    + "".join(f'<link rel="stylesheet" href="/static/theme-{i}.css">' for i in range(40))
+    + "</head><body><nav>"
+    + "".join(f'<a href="/section-{i}">Section {i}</a>' for i in range(40))
+    + '<a href="/login">Log in</a></nav><main>{main}</main></body></html>'
+)
+
+NOT_FOUND_PAGE = TEMPLATE.replace("{main}", "<h1>Sorry, we could not find that page.</h1>")
+
+ADMIN_PAGE = TEMPLATE.replace("{main}", (
+    '<form method="post"><input name="username" type="text">'
+    '<input name="password" type="password"><button>Sign in</button></form>'
+))
+
+
+@pytest_asyncio.fixture
+async def themed_host():
+    # Unknown paths answer 200 with the site's themed "not found" page
+    async def handle(request):
+        if request.path == "/admin":
+            return web.Response(text=ADMIN_PAGE, content_type="text/html")
+        return web.Response(text=NOT_FOUND_PAGE, content_type="text/html")
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_themed_soft_404_host_still_reports_real_admin_page(themed_host):
+    web_recon = WebRecon()
+    async with ScanHttpPool(timeout=5.0) as pool:
+        panels = await web_recon._discover_admin_panels(themed_host, client=pool)
+        prober = web_recon._prober(pool)
+
+    assert [(panel["path"], panel["is_login_page"]) for panel in panels] == [("/admin", True)]
+    assert prober.stats["soft_404"] > 0